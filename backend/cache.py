@@ -0,0 +1,75 @@
+# backend/cache.py
+import threading
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process cache for computed snapshots.
+
+    Entries expire after `ttl` seconds and can be dropped early with
+    `invalidate()` / `clear()` when a write makes them stale. Meant for
+    cheap-to-store, expensive-to-compute payloads (dashboard aggregates etc.),
+    not as a general data cache.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        # bumped on every invalidation so a snapshot computed before a write
+        # is never stored after it
+        self._generation = 0
+
+    def get(self, key: Hashable = None) -> Any:
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            expires, value = hit
+            if expires < time.monotonic():
+                self._data.pop(key, None)
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            if len(self._data) >= self.maxsize and key not in self._data:
+                # drop the entry closest to expiry
+                oldest = min(self._data, key=lambda k: self._data[k][0])
+                self._data.pop(oldest, None)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def get_or_set(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is None:
+            generation = self._generation
+            value = compute()
+            with self._lock:
+                stale = generation != self._generation
+            if not stale:
+                self.set(key, value)
+        return value
+
+    async def aget_or_set(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        value = self.get(key)
+        if value is None:
+            generation = self._generation
+            value = await compute()
+            with self._lock:
+                stale = generation != self._generation
+            if not stale:
+                self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable = None) -> None:
+        with self._lock:
+            self._generation += 1
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
@@ -1,14 +1,59 @@
 # backend/database.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 import os
 
 DB_URL = os.getenv("DATABASE_URL", "sqlite:///./backend/app.db")
+IS_SQLITE = DB_URL.startswith("sqlite")
+IS_SQLITE_MEMORY = IS_SQLITE and make_url(DB_URL).database in (None, "", ":memory:")
+
+# Opt-in SQLite production profile (SQLITE_TUNING=1). Applied to every new
+# DBAPI connection: WAL lets readers run alongside a writer, busy_timeout
+# makes writers wait instead of failing with "database is locked", and
+# synchronous=NORMAL is durable in WAL mode while skipping an fsync per commit.
+SQLITE_TUNING = os.getenv("SQLITE_TUNING", "0") == "1"
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "cache_size": -int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536")),  # negative = KiB
+    "mmap_size": int(os.getenv("SQLITE_MMAP_MB", "256")) * 1024 * 1024,
+    "temp_store": "MEMORY",
+    "foreign_keys": "ON",  # so ondelete="CASCADE" on child tables is honored
+}
+
+# Explicit pool sizing (ignored for in-memory SQLite, which needs a single shared connection)
+POOL_OPTIONS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+    "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    "pool_pre_ping": not IS_SQLITE,
+}
 
 engine = create_engine(
     DB_URL,
-    connect_args={"check_same_thread": False} if DB_URL.startswith("sqlite") else {},
+    connect_args={"check_same_thread": False} if IS_SQLITE else {},
+    **({} if IS_SQLITE_MEMORY else POOL_OPTIONS),
 )
+
+
+def apply_sqlite_pragmas(dbapi_conn, pragmas: dict = SQLITE_PRAGMAS) -> None:
+    cur = dbapi_conn.cursor()
+    try:
+        for name, value in pragmas.items():
+            cur.execute(f"PRAGMA {name}={value}")
+    finally:
+        cur.close()
+
+
+if IS_SQLITE and SQLITE_TUNING:
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, _record):
+        apply_sqlite_pragmas(dbapi_conn)
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -19,3 +64,45 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# -----------------------------
+# Async engine (read-heavy endpoints)
+# -----------------------------
+# Same database as DB_URL, through an asyncio driver: aiosqlite for SQLite,
+# asyncpg for Postgres. Async handlers await the DB round-trip on the event
+# loop instead of holding a threadpool worker for it.
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+
+def to_async_url(url: str) -> str:
+    u = make_url(url)
+    backend = u.get_backend_name()
+    if u.drivername in ASYNC_DRIVERS.values() or backend not in ASYNC_DRIVERS:
+        return url
+    return u.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+ASYNC_DB_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DB_URL)
+
+async_engine = create_async_engine(
+    ASYNC_DB_URL,
+    **({} if IS_SQLITE_MEMORY else POOL_OPTIONS),
+)
+
+if IS_SQLITE and SQLITE_TUNING:
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _on_async_connect(dbapi_conn, _record):
+        apply_sqlite_pragmas(dbapi_conn)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+# Async FastAPI dependency
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
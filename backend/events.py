@@ -0,0 +1,181 @@
+# backend/events.py
+"""
+In-process pub/sub for roster changes, streamed to browsers as Server-Sent
+Events by GET /api/events (routers/events.py).
+
+Publishing piggybacks on the same Session hooks as versions.py: rows of the
+PUBLISHED tables that are inserted, updated or deleted through the ORM are
+collected on flush and published once the transaction commits (never on
+rollback), so every create/update/delete handler feeds the bus without
+calling it. Bulk writes that bypass the ORM call `bus.publish_bulk()`.
+
+Events are notifications, not row payloads:
+    {"op": "created" | "updated" | "deleted" | "bulk" | "resync",
+     "table": "notes", "ref_id": 12, "athlete_id": 3, "at": "..."}
+Clients refetch what they show; with the ETag endpoints that is usually a
+304.
+
+Backpressure: every subscriber has a bounded queue (EVENT_QUEUE_SIZE). A
+client that falls that far behind has its backlog dropped and gets one
+"resync" event instead (refetch everything), so a slow consumer never grows
+memory or holds up publishers. At most MAX_SUBSCRIBERS streams are open at
+once. A short replay buffer serves Last-Event-ID on reconnect.
+
+Like the ETag counters, this lives in one process: with several workers a
+client only hears about writes made by the worker it is connected to.
+"""
+from collections import deque
+from datetime import datetime
+from typing import Any, Optional
+import asyncio
+import os
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from . import models
+
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "256"))
+MAX_SUBSCRIBERS = int(os.getenv("EVENT_MAX_SUBSCRIBERS", "200"))
+REPLAY_SIZE = int(os.getenv("EVENT_REPLAY_SIZE", "1000"))
+
+PUBLISHED = (
+    models.Athlete,
+    models.Assessment,
+    models.MovementAssessment,
+    models.Injury,
+    models.Note,
+)
+
+_PENDING_KEY = "_bus_events"
+
+
+class Subscription:
+    """One SSE client: a bounded queue on the event loop that serves it."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, athlete_id: Optional[int], tables: Optional[set[str]]):
+        self.loop = loop
+        self.athlete_id = athlete_id
+        self.tables = tables
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self.dropped = 0
+
+    def wants(self, ev: dict) -> bool:
+        if ev["op"] == "resync":
+            return True
+        if self.tables is not None and ev["table"] not in self.tables:
+            return False
+        # events without an athlete (bulk writes) may concern anyone
+        return self.athlete_id is None or ev["athlete_id"] in (None, self.athlete_id)
+
+    def _offer(self, ev: dict) -> None:
+        # runs on self.loop
+        try:
+            self.queue.put_nowait(ev)
+        except asyncio.QueueFull:
+            self.dropped += self.queue.qsize()
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({**ev, "op": "resync", "table": None, "ref_id": None, "athlete_id": None})
+
+    async def get(self) -> dict:
+        return await self.queue.get()
+
+
+class EventBus:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subs: set[Subscription] = set()
+        self._seq = 0
+        self._recent: deque = deque(maxlen=REPLAY_SIZE)
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subs)
+
+    def subscribe(self, athlete_id: Optional[int] = None, tables: Optional[set[str]] = None) -> Optional[Subscription]:
+        """Call from the event loop. None when MAX_SUBSCRIBERS streams are already open."""
+        sub = Subscription(asyncio.get_running_loop(), athlete_id, tables)
+        with self._lock:
+            if len(self._subs) >= MAX_SUBSCRIBERS:
+                return None
+            self._subs.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subs.discard(sub)
+
+    def since(self, last_id: int, sub: Subscription) -> Optional[list[dict]]:
+        """Buffered events after `last_id` that `sub` wants; None if they've been evicted."""
+        with self._lock:
+            if last_id > self._seq:
+                return None  # id from before a restart
+            if self._recent and self._recent[0]["id"] > last_id + 1:
+                return None
+            return [ev for ev in self._recent if ev["id"] > last_id and sub.wants(ev)]
+
+    def publish(self, changes: list[tuple[str, str, Optional[int], Optional[int]]]) -> None:
+        """changes: (op, table, ref_id, athlete_id). Safe to call from any thread."""
+        if not changes:
+            return
+        at = datetime.utcnow().isoformat()
+        with self._lock:
+            events = []
+            for op, table, ref_id, athlete_id in changes:
+                self._seq += 1
+                ev = {"id": self._seq, "op": op, "table": table, "ref_id": ref_id, "athlete_id": athlete_id, "at": at}
+                self._recent.append(ev)
+                events.append(ev)
+            subs = list(self._subs)
+        for sub in subs:
+            for ev in events:
+                if not sub.wants(ev):
+                    continue
+                try:
+                    sub.loop.call_soon_threadsafe(sub._offer, ev)
+                except RuntimeError:  # loop closed; the stream is gone
+                    self.unsubscribe(sub)
+                    break
+
+    def publish_bulk(self, table: str) -> None:
+        """Many rows of `table` changed outside the ORM (imports)."""
+        self.publish([("bulk", table, None, None)])
+
+
+bus = EventBus()
+
+
+def _athlete_id(obj: Any) -> Optional[int]:
+    if isinstance(obj, models.Athlete):
+        return obj.id
+    return getattr(obj, "athlete_id", None)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect(session: Session, flush_context) -> None:
+    # ids are assigned by now; the objects may be expired after commit
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    for op, objs in (("created", session.new), ("updated", session.dirty), ("deleted", session.deleted)):
+        for obj in objs:
+            if not isinstance(obj, PUBLISHED):
+                continue
+            if op == "updated" and not session.is_modified(obj, include_collections=False):
+                continue
+            key = (obj.__tablename__, obj.id)
+            # created then updated in one transaction is still "created"
+            if key not in pending or op == "deleted":
+                pending[key] = (op, obj.__tablename__, obj.id, _athlete_id(obj))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        bus.publish(list(pending.values()))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
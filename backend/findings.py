@@ -0,0 +1,122 @@
+# backend/findings.py
+"""
+Movement findings: the failed test items (selections_json) and over/under-
+active muscles (analysis_json) of a movement assessment, stored as rows of
+models.MovementFinding so "how many athletes show Knee Valgus" is an indexed
+COUNT instead of json.loads over every assessment.
+
+Stored JSON shapes (as saved by MovementAssessmentPage.jsx):
+    selections_json: {"Squat Test": ["Knee Valgus", ...], ...}
+    analysis_json:   {"over": ["Adductor Magnus", ...], "under": [...]}
+Malformed JSON simply yields no findings.
+
+Existing rows are filled by migration step 7; rebuild them all with:
+    python -m backend.findings
+"""
+from typing import Any, Optional
+import json
+
+from sqlalchemy import delete, exists, insert, select
+from sqlalchemy.orm import Session
+
+from . import models
+from .versions import record_external_bump
+
+FINDING_KINDS = ("issue", "over", "under")
+
+
+def load_json(raw: Optional[str]) -> Any:
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def extract(selections_json: Optional[str], analysis_json: Optional[str]) -> list[dict]:
+    """(kind, test, label) dicts, de-duplicated, in input order."""
+    found: dict[tuple, None] = {}
+
+    selections = load_json(selections_json)
+    if isinstance(selections, dict):
+        for test, labels in selections.items():
+            if isinstance(labels, list):
+                for label in labels:
+                    if isinstance(label, str) and label.strip():
+                        found[("issue", str(test), label.strip())] = None
+
+    analysis = load_json(analysis_json)
+    if isinstance(analysis, dict):
+        for kind in ("over", "under"):
+            labels = analysis.get(kind)
+            if isinstance(labels, list):
+                for label in labels:
+                    if isinstance(label, str) and label.strip():
+                        found[(kind, None, label.strip())] = None
+
+    return [{"kind": k, "test": t, "label": l} for k, t, l in found]
+
+
+def finding_rows(movement_id: int, athlete_id: int, selections_json: Optional[str], analysis_json: Optional[str]) -> list[dict]:
+    """Insert parameters for models.MovementFinding (bulk paths)."""
+    return [
+        {"movement_id": movement_id, "athlete_id": athlete_id, **f}
+        for f in extract(selections_json, analysis_json)
+    ]
+
+
+def apply_findings(obj: models.MovementAssessment) -> None:
+    """Sets obj.findings from its JSON columns (on-write path)."""
+    obj.findings = [
+        models.MovementFinding(athlete_id=obj.athlete_id, **f)
+        for f in extract(obj.selections_json, obj.analysis_json)
+    ]
+
+
+def backfill(db: Session, chunk_size: int = 5000, only_missing: bool = False) -> int:
+    """Rebuilds findings for stored movement assessments in chunks. Returns assessments processed."""
+    M, F = models.MovementAssessment, models.MovementFinding
+    last_id = 0
+    processed = 0
+    while True:
+        q = (
+            select(M.id, M.athlete_id, M.selections_json, M.analysis_json)
+            .where(M.id > last_id)
+            .order_by(M.id)
+            .limit(chunk_size)
+        )
+        if only_missing:
+            q = q.where(~exists().where(F.movement_id == M.id))
+        rows = db.execute(q).all()
+        if not rows:
+            break
+        ids = [r.id for r in rows]
+        db.execute(delete(F).where(F.movement_id.in_(ids)))
+        params = [p for r in rows for p in finding_rows(r.id, r.athlete_id, r.selections_json, r.analysis_json)]
+        if params:
+            db.execute(insert(F), params)
+        db.commit()
+        processed += len(rows)
+        last_id = ids[-1]
+    if processed:
+        record_external_bump(db, F.__tablename__)
+        db.commit()
+    return processed
+
+
+if __name__ == "__main__":
+    import argparse
+    from .database import SessionLocal
+
+    p = argparse.ArgumentParser(description="Rebuild movement findings from stored JSON")
+    p.add_argument("--chunk-size", type=int, default=5000)
+    p.add_argument("--only-missing", action="store_true", help="skip assessments that already have findings")
+    args = p.parse_args()
+
+    db = SessionLocal()
+    try:
+        n = backfill(db, chunk_size=args.chunk_size, only_missing=args.only_missing)
+        print(f"Rebuilt findings for {n} movement assessments.")
+    finally:
+        db.close()
@@ -0,0 +1,131 @@
+# backend/group_commit.py
+"""
+Group commit for small, frequent writes (notes, pin toggles).
+
+Each such request used to run its own transaction, i.e. one fsync per note
+on SQLite, so throughput was capped by the disk's flush rate no matter how
+many coaches were typing. Handlers now hand a write to `GroupCommitter.submit`,
+which blocks the calling (threadpool) request until its result is ready.
+One writer thread takes everything queued, waits up to COMMIT_WINDOW_MS for
+more (at most MAX_BATCH writes), runs them in order in ONE session and
+commits once. Each caller gets its own result back.
+
+A write is a function `fn(db) -> result`. It flushes what it needs, such as
+ids or defaults, and builds its result before the commit, since objects
+expire afterwards. If anything in a batch fails, the batch is rolled back and
+its writes are re-run one transaction each, so only the failing caller sees
+an error (the same fallback as imports). Writes must therefore be safe to
+re-run from scratch.
+
+Under no load a write waits at most COMMIT_WINDOW_MS before committing. Under
+load, batches fill while the previous commit is flushing.
+"""
+from concurrent.futures import Future
+from typing import Callable, Optional, TypeVar
+import os
+import queue
+import threading
+import time
+
+from sqlalchemy.orm import Session
+
+from .database import SessionLocal
+
+COMMIT_WINDOW_MS = float(os.getenv("GROUP_COMMIT_WINDOW_MS", "2"))
+MAX_BATCH = int(os.getenv("GROUP_COMMIT_MAX_BATCH", "200"))
+
+T = TypeVar("T")
+_STOP = object()
+
+
+class GroupCommitter:
+    def __init__(self, name: str, session_factory: Callable[[], Session] = SessionLocal):
+        self.name = name
+        self._session_factory = session_factory
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name=f"group-commit-{self.name}", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5) -> None:
+        """Commits what is already queued, then ends the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread:
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    def submit(self, fn: Callable[[Session], T]) -> T:
+        """Runs `fn` in the next group transaction; returns its result once committed, or raises its error."""
+        self.start()  # lazily, so scripts and tests need no lifespan
+        fut: Future = Future()
+        self._queue.put((fn, fut))
+        return fut.result()
+
+    # -----------------------------
+    # Writer thread
+    # -----------------------------
+    def _take_batch(self) -> tuple[list[tuple[Callable, Future]], bool]:
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + COMMIT_WINDOW_MS / 1000
+        while len(batch) < MAX_BATCH:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, stopping = self._take_batch()
+            if batch:
+                self._commit(batch)
+
+    def _commit(self, batch: list[tuple[Callable, Future]]) -> None:
+        db = self._session_factory()
+        try:
+            results = [fn(db) for fn, _fut in batch]
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            results = None
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+                return
+        finally:
+            db.close()
+
+        if results is not None:
+            for (_fn, fut), result in zip(batch, results):
+                fut.set_result(result)
+            return
+
+        # something in the batch failed: one transaction per write so only
+        # the offending caller gets the error
+        for fn, fut in batch:
+            db = self._session_factory()
+            try:
+                result = fn(db)
+                db.commit()
+                fut.set_result(result)
+            except Exception as e:
+                db.rollback()
+                fut.set_exception(e)
+            finally:
+                db.close()
+
+
+note_writer = GroupCommitter("notes")
@@ -0,0 +1,70 @@
+# backend/http_cache.py
+"""
+Conditional GET + serialized-response cache for read endpoints.
+
+`cached_json()` takes an ETag computed from `versions` *before* the data is
+read, then:
+  - answers 304 if the client's If-None-Match already has that tag,
+  - otherwise serves the JSON bytes cached under (url, tag) if present,
+  - otherwise builds the payload, serializes it once with the endpoint's
+    response schema and caches the bytes.
+Because the tag is part of the cache key, a write simply makes old entries
+unreachable; they age out of the bounded cache on their own.
+
+Responses carry `Cache-Control: private, no-cache`, so browsers keep them
+but revalidate every time, which is what turns the SPA's re-fetches into
+304s.
+"""
+from typing import Any, Awaitable, Callable
+import os
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from .cache import TTLCache
+
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "512"))
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "600"))
+# larger bodies are still ETagged, just not kept in memory
+MAX_CACHED_BODY = int(os.getenv("RESPONSE_CACHE_MAX_BODY", str(256 * 1024)))
+
+response_cache = TTLCache(ttl=RESPONSE_CACHE_TTL, maxsize=RESPONSE_CACHE_SIZE)
+
+_adapters: dict[Any, TypeAdapter] = {}
+
+
+def _adapter(schema: Any) -> TypeAdapter:
+    adapter = _adapters.get(schema)
+    if adapter is None:
+        adapter = _adapters[schema] = TypeAdapter(schema)
+    return adapter
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # weak comparison, as required for If-None-Match
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip() == "*" or tag.strip().removeprefix("W/") == opaque
+        for tag in if_none_match.split(",")
+    )
+
+
+async def cached_json(
+    request: Request,
+    etag: str,
+    build: Callable[[], Awaitable[Any]],
+    schema: Any,
+) -> Response:
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    key = (request.url.path, request.url.query, etag)
+    body = response_cache.get(key)
+    if body is None:
+        adapter = _adapter(schema)
+        body = adapter.dump_json(adapter.validate_python(await build(), from_attributes=True))
+        if len(body) <= MAX_CACHED_BODY:
+            response_cache.set(key, body)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,96 @@
+# backend/imaging.py
+"""
+Resized photo variants.
+
+Each uploaded photo gets a few downscaled copies (see VARIANTS) so list and
+card views don't download full-size phone photos. Variants are WebP when
+Pillow was built with WebP support, JPEG otherwise.
+
+Resizing is CPU-heavy, so it runs on a small dedicated pool (Pillow releases
+the GIL while decoding/resizing/encoding, so threads are enough) and never on
+the event loop or the shared request threadpool.
+
+Variants are served as immutable, so a file must never be visible half
+written: each one is encoded into its own temp file and renamed into place.
+A source has at most one job queued or running; asking again (a dedup
+re-upload, an on-demand request for a variant) joins that job.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+import os
+import tempfile
+import threading
+
+from PIL import Image, ImageOps, features
+
+# name -> longest side in px. Images smaller than that are not upscaled.
+VARIANTS = {
+    "thumb": 128,
+    "card": 480,
+    "full": 1600,
+}
+
+if features.check("webp"):
+    VARIANT_FORMAT, VARIANT_EXT, VARIANT_OPTIONS = "WEBP", ".webp", {"quality": 80, "method": 4}
+else:
+    VARIANT_FORMAT, VARIANT_EXT, VARIANT_OPTIONS = "JPEG", ".jpg", {"quality": 82, "optimize": True, "progressive": True}
+
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+
+_pool = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="imaging")
+_jobs_lock = threading.Lock()
+_jobs: dict[Path, Future] = {}
+
+
+def variant_name(stem: str, variant: str) -> str:
+    return f"{stem}_{variant}{VARIANT_EXT}"
+
+
+def make_variants(src: Path) -> list[Path]:
+    """Writes every missing variant of `src` next to it; returns their paths."""
+    written = []
+    with Image.open(src) as im:
+        im.seek(0)  # first frame of animated GIF/WebP
+        im = ImageOps.exif_transpose(im)  # phone photos are often rotated via EXIF
+        has_alpha = im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info)
+        im = im.convert("RGBA" if has_alpha and VARIANT_FORMAT == "WEBP" else "RGB")
+        for variant, size in VARIANTS.items():
+            dest = src.with_name(variant_name(src.stem, variant))
+            if dest.exists():
+                continue
+            copy = im.copy()
+            copy.thumbnail((size, size), Image.Resampling.LANCZOS)
+            fd, tmp = tempfile.mkstemp(dir=dest.parent, prefix=f".tmp-{dest.stem}-", suffix=VARIANT_EXT)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    copy.save(f, VARIANT_FORMAT, **VARIANT_OPTIONS)
+                os.replace(tmp, dest)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+            written.append(dest)
+    return written
+
+
+def _log_failure(src: Path, fut: Future) -> None:
+    err = fut.exception()
+    if err is not None:
+        print(f"[IMAGING][ERROR] variants for {src.name} failed: {err}")
+
+
+def _job_done(src: Path, fut: Future) -> None:
+    with _jobs_lock:
+        if _jobs.get(src) is fut:
+            del _jobs[src]
+    _log_failure(src, fut)
+
+
+def schedule_variants(src: Path) -> Future:
+    """Queues variant generation for `src` (or joins the job already queued) and returns immediately."""
+    with _jobs_lock:
+        fut = _jobs.get(src)
+        if fut is not None:
+            return fut
+        fut = _jobs[src] = _pool.submit(make_variants, src)
+    fut.add_done_callback(lambda f: _job_done(src, f))
+    return fut
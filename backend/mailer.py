@@ -0,0 +1,226 @@
+# backend/mailer.py
+"""
+Outbound mail queue.
+
+Request handlers call `enqueue_email(db, ...)`, which only inserts a row into
+`outbound_emails` as part of the caller's transaction, so the request returns
+without touching the mail server. A single background thread (`MailWorker`,
+started from main.py) drains the outbox over a reused SMTP connection and
+retries failures with exponential backoff. Because the queue lives in the
+database, pending messages survive restarts.
+
+SMTP settings (env):
+  SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASS, SMTP_FROM
+  SMTP_TLS = ssl | starttls | none   (default: ssl on port 465, else starttls)
+With SMTP_TLS=none no login is attempted, which suits a local stand-in such as
+`python -m aiosmtpd -n -l localhost:1025`. If SMTP isn't configured the
+message body is printed to the log instead (dev mode), as before.
+"""
+from datetime import datetime, timedelta
+from email.mime.text import MIMEText
+from typing import Optional
+import os
+import smtplib
+import threading
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import Session
+
+from .database import SessionLocal
+from . import models
+
+MAX_ATTEMPTS = int(os.getenv("MAIL_MAX_ATTEMPTS", "6"))
+BACKOFF_BASE = float(os.getenv("MAIL_BACKOFF_SECONDS", "30"))   # 30s, 60s, 120s, ...
+BACKOFF_MAX = float(os.getenv("MAIL_BACKOFF_MAX_SECONDS", "3600"))
+POLL_INTERVAL = float(os.getenv("MAIL_POLL_SECONDS", "15"))
+IDLE_DISCONNECT = float(os.getenv("MAIL_IDLE_DISCONNECT_SECONDS", "60"))
+BATCH_SIZE = 50
+# a 'sending' row older than this was claimed by a sender that died
+CLAIM_TIMEOUT = timedelta(minutes=10)
+
+
+def _smtp_settings() -> dict:
+    port = int(os.getenv("SMTP_PORT", "0") or 0)
+    user = os.getenv("SMTP_USER")
+    return {
+        "host": os.getenv("SMTP_HOST"),
+        "port": port,
+        "user": user,
+        "pwd": os.getenv("SMTP_PASS"),
+        "sender": os.getenv("SMTP_FROM", user or "no-reply@example.com"),
+        "tls": os.getenv("SMTP_TLS") or ("ssl" if port == 465 else "starttls"),
+    }
+
+
+def enqueue_email(db: Session, to_email: str, subject: str, body: str) -> models.OutboundEmail:
+    """Adds a message to the outbox; it is sent once the caller commits."""
+    msg = models.OutboundEmail(to_email=to_email, subject=subject, body=body)
+    db.add(msg)
+    return msg
+
+
+class SMTPConnection:
+    """One SMTP session kept open between messages and re-opened on failure."""
+
+    def __init__(self):
+        self._server: Optional[smtplib.SMTP] = None
+        self._settings: dict = {}
+
+    def _open(self, s: dict) -> smtplib.SMTP:
+        if s["tls"] == "ssl":
+            server = smtplib.SMTP_SSL(s["host"], s["port"], timeout=30)
+        else:
+            server = smtplib.SMTP(s["host"], s["port"], timeout=30)
+            if s["tls"] == "starttls":
+                server.ehlo()
+                server.starttls()
+                server.ehlo()
+        if s["tls"] != "none":
+            server.login(s["user"], s["pwd"])
+        return server
+
+    def _alive(self) -> bool:
+        try:
+            return self._server is not None and self._server.noop()[0] == 250
+        except smtplib.SMTPException:
+            return False
+        except OSError:
+            return False
+
+    def send(self, s: dict, to_email: str, message: str) -> None:
+        if s != self._settings or not self._alive():
+            self.close()
+            self._server = self._open(s)
+            self._settings = s
+        self._server.sendmail(s["sender"], [to_email], message)
+
+    def close(self) -> None:
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+        self._server = None
+
+
+class MailWorker:
+    def __init__(self):
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._conn = SMTPConnection()
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="mail-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self._conn.close()
+
+    def wake(self) -> None:
+        """Nudge the sender after enqueueing so it doesn't wait for the next poll."""
+        self._wake.set()
+
+    def _run(self) -> None:
+        last_activity = datetime.utcnow()
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                if self.drain():
+                    last_activity = datetime.utcnow()
+            except Exception as e:
+                print(f"[MAIL][ERROR] outbox drain failed: {e}")
+            # keep the SMTP connection only while there is traffic
+            if (datetime.utcnow() - last_activity).total_seconds() > IDLE_DISCONNECT:
+                self._conn.close()
+            self._wake.wait(POLL_INTERVAL)
+
+    def _claim(self, db: Session) -> list[models.OutboundEmail]:
+        now = datetime.utcnow()
+        E = models.OutboundEmail
+        due = db.execute(
+            select(E.id)
+            .where(
+                or_(
+                    (E.status == "pending") & (E.next_attempt_at <= now),
+                    (E.status == "sending") & (E.claimed_at < now - CLAIM_TIMEOUT),
+                )
+            )
+            .order_by(E.next_attempt_at)
+            .limit(BATCH_SIZE)
+        ).scalars().all()
+        claimed = []
+        for msg_id in due:
+            # conditional UPDATE so two processes never send the same row
+            res = db.execute(
+                update(E)
+                .where(
+                    E.id == msg_id,
+                    or_(
+                        E.status == "pending",
+                        (E.status == "sending") & (E.claimed_at < now - CLAIM_TIMEOUT),
+                    ),
+                )
+                .values(status="sending", claimed_at=now)
+            )
+            if res.rowcount:
+                claimed.append(msg_id)
+        db.commit()
+        return [db.get(E, i) for i in claimed]
+
+    def drain(self) -> bool:
+        """Sends every due message once. Returns True if anything was attempted."""
+        s = _smtp_settings()
+        configured = s["host"] and s["port"] and (s["tls"] == "none" or (s["user"] and s["pwd"]))
+        db = SessionLocal()
+        try:
+            batch = self._claim(db)
+            for msg in batch:
+                if not configured:
+                    print(f"[DEV] Email to {msg.to_email} ({msg.subject}):\n{msg.body}")
+                    self._mark_sent(db, msg)
+                    continue
+                mime = MIMEText(msg.body)
+                mime["Subject"] = msg.subject
+                mime["From"] = s["sender"]
+                mime["To"] = msg.to_email
+                try:
+                    self._conn.send(s, msg.to_email, mime.as_string())
+                except (smtplib.SMTPException, OSError) as e:
+                    self._conn.close()
+                    self._mark_failed(db, msg, e)
+                else:
+                    self._mark_sent(db, msg)
+                    print(f"[MAIL] Sent '{msg.subject}' to {msg.to_email}")
+            return bool(batch)
+        finally:
+            db.close()
+
+    def _mark_sent(self, db: Session, msg: models.OutboundEmail) -> None:
+        msg.status = "sent"
+        msg.sent_at = datetime.utcnow()
+        msg.attempts += 1
+        db.commit()
+
+    def _mark_failed(self, db: Session, msg: models.OutboundEmail, err: Exception) -> None:
+        msg.attempts += 1
+        msg.last_error = str(err)
+        if msg.attempts >= MAX_ATTEMPTS:
+            msg.status = "failed"
+            print(f"[MAIL][ERROR] giving up on message {msg.id} to {msg.to_email}: {err}")
+        else:
+            delay = min(BACKOFF_BASE * 2 ** (msg.attempts - 1), BACKOFF_MAX)
+            msg.status = "pending"
+            msg.next_attempt_at = datetime.utcnow() + timedelta(seconds=delay)
+            print(f"[MAIL][ERROR] {err} (retry {msg.attempts}/{MAX_ATTEMPTS} in {delay:.0f}s)")
+        db.commit()
+
+
+mail_worker = MailWorker()
@@ -1,17 +1,42 @@
 # backend/main.py
 from fastapi import FastAPI, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from .database import Base, engine
-from .routers import athletes, assessments, movements, injuries, comments, dashboard, auth
-from fastapi.staticfiles import StaticFiles
-from pathlib import Path
-from uuid import uuid4
-import shutil
+from fastapi.middleware.gzip import GZipMiddleware
+from contextlib import asynccontextmanager
+from .database import engine
+from .migrations import migrate
+from .mailer import mail_worker
+from .group_commit import note_writer
+from .versions import version_watcher
+from .routers import athletes, assessments, movements, injuries, comments, dashboard, auth, imports, exports, analytics, search, events
+from .responses import ORJSONResponse
+from .uploads import UPLOAD_DIR, UploadFiles, save_upload
 import os
 
-Base.metadata.create_all(bind=engine)
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:  # brotli is optional; gzip only
+    BrotliMiddleware = None
 
-app = FastAPI(title="Dashboard API", version="0.1.0")
+migrate(engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # background workers live for the lifetime of the server process
+    mail_worker.start()
+    note_writer.start()
+    version_watcher.start()
+    yield
+    version_watcher.stop()
+    note_writer.stop()
+    mail_worker.stop()
+
+app = FastAPI(
+    title="Dashboard API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,23 +46,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Response compression. Small bodies aren't worth the CPU; uploads are
+# already-compressed images (and may be served as byte ranges); the SSE
+# stream must reach the client as each event is written, not when a
+# compressor's buffer fills.
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+NO_COMPRESS_PATHS = [r"^(/api)?/uploads/", r"^/api/events"]
+if BrotliMiddleware is not None:
+    app.add_middleware(
+        BrotliMiddleware,
+        quality=4,
+        minimum_size=COMPRESS_MIN_BYTES,
+        gzip_fallback=True,
+        excluded_handlers=NO_COMPRESS_PATHS,
+    )
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESS_MIN_BYTES, compresslevel=6)
+
 API_PREFIX = "/api"
 
 # Static uploads (mount at both /uploads and /api/uploads for convenience)
-UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=str(UPLOAD_DIR)), name="uploads")
-app.mount(f"{API_PREFIX}/uploads", StaticFiles(directory=str(UPLOAD_DIR)), name="uploads_api")
+app.mount("/uploads", UploadFiles(directory=str(UPLOAD_DIR)), name="uploads")
+app.mount(f"{API_PREFIX}/uploads", UploadFiles(directory=str(UPLOAD_DIR)), name="uploads_api")
 
 # Upload endpoints at /api/upload
 @app.post(f"{API_PREFIX}/upload")
 async def upload_api(file: UploadFile = File(...)):
-    ext = Path(file.filename).suffix.lower()
-    name = f"{uuid4().hex}{ext}"
-    dest = UPLOAD_DIR / name
-    with dest.open("wb") as f:
-        shutil.copyfileobj(file.file, f)
-    return {"url": f"/uploads/{name}"}
+    stored = await save_upload(file)
+    return {"url": stored.url}
 
 # (Optional backwards-compat: older code hitting /upload will still work locally)
 @app.post("/upload")
@@ -52,6 +89,11 @@ app.include_router(movements.router,  prefix=API_PREFIX)
 app.include_router(injuries.router,   prefix=API_PREFIX)
 app.include_router(comments.router,   prefix=API_PREFIX)
 app.include_router(dashboard.router,  prefix=API_PREFIX)
+app.include_router(imports.router,    prefix=API_PREFIX)
+app.include_router(exports.router,    prefix=API_PREFIX)
+app.include_router(analytics.router,  prefix=API_PREFIX)
+app.include_router(search.router,     prefix=API_PREFIX)
+app.include_router(events.router,     prefix=API_PREFIX)
 
 @app.get("/", tags=["root"])
 def root():
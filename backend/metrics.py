@@ -0,0 +1,155 @@
+# backend/metrics.py
+"""
+Assessment metrics, mirroring frontend/src/utils/assessmentMetrics.js
+(computeAssessmentMetrics + makeRecommendations) so they can be stored on
+the Assessment row instead of recomputed in every browser.
+
+Everything is written over NumPy column arrays; a single assessment is just
+a batch of one, so the on-write path and the backfill can't drift apart.
+
+Existing rows are filled by migration step 2; recompute them all, e.g. after
+changing the formulas, with:
+    python -m backend.metrics
+"""
+from typing import Any
+import json
+
+import numpy as np
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from . import models
+from .versions import record_external_bump
+
+# target force = TARGET_PER_KG * body weight when no custom_target is given
+TARGET_PER_KG = 6.68
+
+INPUT_FIELDS = ("weight", "cmf_left", "cmf_right", "cmp_left", "cmp_right", "custom_target")
+
+
+def _col(rows: list[dict], name: str) -> np.ndarray:
+    # missing / null inputs count as 0, like clampNumber() on the frontend
+    return np.array([r.get(name) or 0 for r in rows], dtype=float)
+
+
+def _side_notes(ratio: np.ndarray, pct: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    strength = np.where(ratio >= 1, "meets power expectations", "needs more power")
+    deficit = np.select(
+        [pct > 25, pct > 10],
+        ["significant force deficit", "moderate force deficit"],
+        default="on track",
+    )
+    return strength, deficit
+
+
+def compute_batch(rows: list[dict]) -> list[dict[str, Any]]:
+    """Computes the stored metric columns for each input row (dicts with INPUT_FIELDS + goal)."""
+    if not rows:
+        return []
+
+    weight = _col(rows, "weight")
+    cmf_l, cmf_r = _col(rows, "cmf_left"), _col(rows, "cmf_right")
+    cmp_l, cmp_r = _col(rows, "cmp_left"), _col(rows, "cmp_right")
+    custom = _col(rows, "custom_target")
+
+    target = np.where(custom > 0, custom, np.round(weight * TARGET_PER_KG))
+    deficit_l = np.maximum(0, target - cmf_l)
+    deficit_r = np.maximum(0, target - cmf_r)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct_l = np.where(target > 0, np.round(deficit_l / target * 100, 1), 0.0)
+        pct_r = np.where(target > 0, np.round(deficit_r / target * 100, 1), 0.0)
+        ratio_l = np.where(cmf_l > 0, np.round(cmp_l / cmf_l, 2), 0.0)
+        ratio_r = np.where(cmf_r > 0, np.round(cmp_r / cmf_r, 2), 0.0)
+        # left/right CMF imbalance as % of the stronger side
+        stronger = np.maximum(cmf_l, cmf_r)
+        asym = np.where(stronger > 0, np.round(np.abs(cmf_l - cmf_r) / stronger * 100, 1), 0.0)
+
+    badge = np.select(
+        [
+            (ratio_l >= 1) & (ratio_r >= 1) & (pct_l < 10) & (pct_r < 10),
+            (pct_l > 25) | (pct_r > 25),
+        ],
+        ["Excellent", "High Deficit"],
+        default="Improving",
+    )
+    strength_l, deficit_note_l = _side_notes(ratio_l, pct_l)
+    strength_r, deficit_note_r = _side_notes(ratio_r, pct_r)
+
+    out = []
+    for i, row in enumerate(rows):
+        recommendations = {
+            "badges": [str(badge[i])],
+            "notes": {
+                "left": [str(strength_l[i]), str(deficit_note_l[i])],
+                "right": [str(strength_r[i]), str(deficit_note_r[i])],
+            },
+            "goal": row.get("goal") or "—",
+        }
+        out.append({
+            "target_force": float(target[i]),
+            "deficit_left": float(deficit_l[i]),
+            "deficit_right": float(deficit_r[i]),
+            "percent_below_left": float(pct_l[i]),
+            "percent_below_right": float(pct_r[i]),
+            "ratio_left": float(ratio_l[i]),
+            "ratio_right": float(ratio_r[i]),
+            "asymmetry": float(asym[i]),
+            "recommendation_summary": json.dumps(recommendations, ensure_ascii=False),
+        })
+    return out
+
+
+def compute_metrics(row: dict) -> dict[str, Any]:
+    return compute_batch([row])[0]
+
+
+def apply_metrics(obj: models.Assessment) -> None:
+    """Fills the computed columns on an Assessment before it is flushed."""
+    row = {name: getattr(obj, name) for name in INPUT_FIELDS + ("goal",)}
+    for k, v in compute_metrics(row).items():
+        setattr(obj, k, v)
+
+
+def backfill(db: Session, chunk_size: int = 5000, only_missing: bool = False) -> int:
+    """Recomputes metrics for stored assessments in chunks. Returns rows updated."""
+    A = models.Assessment
+    cols = [A.id, A.goal] + [getattr(A, f) for f in INPUT_FIELDS]
+    last_id = 0
+    updated = 0
+    while True:
+        q = select(*cols).where(A.id > last_id).order_by(A.id).limit(chunk_size)
+        if only_missing:
+            q = q.where(A.target_force.is_(None))
+        rows = [dict(r._mapping) for r in db.execute(q)]
+        if not rows:
+            break
+        params = [
+            {"id": r["id"], **m} for r, m in zip(rows, compute_batch(rows))
+        ]
+        db.execute(update(A), params)  # executemany UPDATE ... WHERE id = ?
+        db.commit()
+        updated += len(rows)
+        last_id = rows[-1]["id"]
+    if updated:
+        # running servers cache responses built from this table
+        record_external_bump(db, A.__tablename__)
+        db.commit()
+    return updated
+
+
+if __name__ == "__main__":
+    import argparse
+    from .database import SessionLocal
+
+    p = argparse.ArgumentParser(description="Recompute stored assessment metrics")
+    p.add_argument("--chunk-size", type=int, default=5000)
+    p.add_argument("--only-missing", action="store_true", help="skip rows that already have metrics")
+    args = p.parse_args()
+
+    db = SessionLocal()
+    try:
+        n = backfill(db, chunk_size=args.chunk_size, only_missing=args.only_missing)
+        print(f"Updated metrics for {n} assessments.")
+    finally:
+        db.close()
@@ -0,0 +1,172 @@
+# backend/migrations.py
+"""
+Minimal versioned schema migrations.
+
+`Base.metadata.create_all` only creates tables that don't exist yet; it never
+touches tables already in an existing app.db. Anything that changes an
+existing table (new index, new column, ...) goes here as a numbered step.
+Applied versions are recorded in `schema_migrations`, and every step is
+written to be idempotent so it is also safe on a freshly created database
+(where create_all has already built the current schema).
+
+Add new steps to the end of MIGRATIONS; never renumber or edit applied ones.
+"""
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from .database import Base
+from . import findings, metrics, models, movement_metrics, risk, search
+
+_meta = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _meta,
+    Column("version", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+# -----------------------------
+# Helpers
+# -----------------------------
+def _create_indexes(conn: Connection, *names: str) -> None:
+    """
+    Create the named model indexes, skipping existing ones. Steps list their
+    indexes by name rather than reading `table.indexes`: the models always
+    describe the latest schema, and an early step must not build an index
+    on a column that a later step adds.
+    """
+    indexes = {ix.name: ix for table in Base.metadata.tables.values() for ix in table.indexes}
+    for name in names:
+        indexes[name].create(conn, checkfirst=True)
+
+
+def _add_columns(conn: Connection, table, *column_names: str) -> None:
+    """ALTER TABLE ... ADD COLUMN for columns declared on the model but missing in the DB."""
+    existing = {c["name"] for c in inspect(conn).get_columns(table.name)}
+    for name in column_names:
+        if name in existing:
+            continue
+        col = table.c[name]
+        ddl_type = col.type.compile(dialect=conn.dialect)
+        conn.exec_driver_sql(f'ALTER TABLE {table.name} ADD COLUMN "{name}" {ddl_type}')
+
+
+# -----------------------------
+# Steps
+# -----------------------------
+def _0001_per_athlete_indexes(conn: Connection) -> None:
+    _create_indexes(
+        conn,
+        "ix_athletes_created_at",
+        "ix_assessments_athlete_date",
+        "ix_assessments_created_at",
+        "ix_movement_assessments_athlete_created",
+        "ix_movement_assessments_created_at",
+        "ix_injuries_athlete_date",
+        "ix_injuries_status_athlete",
+        "ix_injuries_created_at",
+        "ix_notes_athlete_pinned_created",
+        "ix_users_reset_token",
+    )
+
+
+def _0002_assessment_metrics(conn: Connection) -> None:
+    _add_columns(
+        conn,
+        models.Assessment.__table__,
+        "target_force",
+        "deficit_left",
+        "deficit_right",
+        "percent_below_left",
+        "percent_below_right",
+        "asymmetry",
+    )
+    # compute existing rows now; step 6 scores risk from their asymmetry
+    with Session(bind=conn) as db:
+        metrics.backfill(db, only_missing=True)
+
+
+def _0003_photo_url_index(conn: Connection) -> None:
+    _create_indexes(conn, "ix_athletes_photo_url")
+
+
+def _0004_search_index(conn: Connection) -> None:
+    search.install(conn)
+
+
+def _0005_movement_metrics(conn: Connection) -> None:
+    _add_columns(
+        conn,
+        models.MovementAssessment.__table__,
+        "total_fails",
+        "fails_by_category",
+        "red_flags",
+        "red_flag_count",
+        "top_issues",
+        "movement_score",
+        "movement_badge",
+    )
+    _create_indexes(conn, "ix_movement_assessments_red_flags")
+    # score existing screens now, so red flags (and step 6's risk rows) are
+    # there without a manual backfill
+    with Session(bind=conn) as db:
+        movement_metrics.backfill(db, only_missing=True)
+
+
+def _0006_athlete_risk(conn: Connection) -> None:
+    # the table itself comes from create_all; injury totals are kept by
+    # deltas, so existing athletes must start from a full rebuild (after
+    # steps 2 and 5 have filled asymmetry and red flags)
+    with Session(bind=conn) as db:
+        risk.rebuild(db)
+
+
+def _0007_movement_findings(conn: Connection) -> None:
+    # the table comes from create_all; derive rows for screens saved before it
+    with Session(bind=conn) as db:
+        findings.backfill(db, only_missing=True)
+
+
+MIGRATIONS: list[tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "per_athlete_indexes", _0001_per_athlete_indexes),
+    (2, "assessment_metrics", _0002_assessment_metrics),
+    (3, "photo_url_index", _0003_photo_url_index),
+    (4, "search_index", _0004_search_index),
+    (5, "movement_metrics", _0005_movement_metrics),
+    (6, "athlete_risk", _0006_athlete_risk),
+    (7, "movement_findings", _0007_movement_findings),
+]
+
+
+def migrate(engine: Engine) -> list[int]:
+    """Create missing tables, then apply pending migration steps. Returns the versions applied."""
+    Base.metadata.create_all(bind=engine)
+    _meta.create_all(bind=engine)
+
+    applied: list[int] = []
+    with engine.begin() as conn:
+        done = set(conn.execute(select(schema_migrations.c.version)).scalars())
+        for version, name, step in MIGRATIONS:
+            if version in done:
+                continue
+            step(conn)
+            conn.execute(
+                schema_migrations.insert().values(
+                    version=version, name=name, applied_at=datetime.utcnow()
+                )
+            )
+            applied.append(version)
+    return applied
+
+
+if __name__ == "__main__":
+    from .database import engine
+
+    ran = migrate(engine)
+    print("Applied migrations:", ran or "none (up to date)")
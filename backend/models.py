@@ -1,5 +1,5 @@
 # backend/models.py
-from sqlalchemy import Column, Integer, String, Float, Text, Boolean, Date, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Float, Text, Boolean, Date, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, timedelta
 from .database import Base
@@ -7,6 +7,9 @@ from typing import Optional
 
 class Athlete(Base):
     __tablename__ = "athletes"
+    __table_args__ = (
+        Index("ix_athletes_created_at", "created_at"),
+    )
     id = Column(Integer, primary_key=True, index=True)
 
     # Basic identity
@@ -16,7 +19,7 @@ class Athlete(Base):
     gender = Column(String, nullable=True)
     sport = Column(String, nullable=True)
     position = Column(String, nullable=True)
-    photo_url = Column(String, nullable=True)
+    photo_url = Column(String, nullable=True, index=True)  # indexed for upload ref-counting
     email = Column(String, nullable=True)
     city = Column(String, nullable=True)
 
@@ -91,10 +94,21 @@ class Athlete(Base):
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
+    risk = relationship(
+        "AthleteRisk",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
 
 class Assessment(Base):
     __tablename__ = "assessments"
+    __table_args__ = (
+        # assessments.list_by_athlete: WHERE athlete_id = ? ORDER BY date DESC, created_at DESC
+        Index("ix_assessments_athlete_date", "athlete_id", "date", "created_at"),
+        Index("ix_assessments_created_at", "created_at"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     athlete_id = Column(Integer, ForeignKey("athletes.id", ondelete="CASCADE"), nullable=False)
 
@@ -109,7 +123,15 @@ class Assessment(Base):
     ratio_right = Column(Float, nullable=True)
     custom_target = Column(Float, nullable=True)
     goal = Column(String, nullable=True)
-    recommendation_summary = Column(Text, nullable=True)
+    recommendation_summary = Column(Text, nullable=True)  # JSON: {badges, notes:{left,right}, goal}
+
+    # Computed by backend/metrics.py on write
+    target_force = Column(Float, nullable=True)
+    deficit_left = Column(Float, nullable=True)
+    deficit_right = Column(Float, nullable=True)
+    percent_below_left = Column(Float, nullable=True)
+    percent_below_right = Column(Float, nullable=True)
+    asymmetry = Column(Float, nullable=True)              # |CMF L - R| as % of stronger side
     coach_comment = Column(Text, nullable=True)
 
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -118,6 +140,13 @@ class Assessment(Base):
 
 class MovementAssessment(Base):
     __tablename__ = "movement_assessments"
+    __table_args__ = (
+        # movements.list_by_athlete: WHERE athlete_id = ? ORDER BY created_at
+        Index("ix_movement_assessments_athlete_created", "athlete_id", "created_at"),
+        Index("ix_movement_assessments_created_at", "created_at"),
+        # red-flag roster views: WHERE red_flag_count > 0
+        Index("ix_movement_assessments_red_flags", "red_flag_count", "athlete_id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     athlete_id = Column(Integer, ForeignKey("athletes.id", ondelete="CASCADE"), nullable=False)
 
@@ -126,12 +155,56 @@ class MovementAssessment(Base):
     athlete_comment = Column(Text, nullable=True)
     coach_comment = Column(Text, nullable=True)
 
+    # Computed on write from selections_json (backend/movement_metrics.py)
+    total_fails = Column(Integer, nullable=True)
+    fails_by_category = Column(Text, nullable=True)   # JSON {test: count}
+    red_flags = Column(Text, nullable=True)           # JSON [label]
+    red_flag_count = Column(Integer, nullable=True)
+    top_issues = Column(Text, nullable=True)          # JSON [{label, score}]
+    movement_score = Column(Float, nullable=True)     # 0-100, higher is better
+    movement_badge = Column(String, nullable=True)    # High Risk | Needs Work | Solid
+
     created_at = Column(DateTime, default=datetime.utcnow)
     athlete = relationship("Athlete", back_populates="movement_assessments")
+    findings = relationship(
+        "MovementFinding",
+        back_populates="movement",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+
+class MovementFinding(Base):
+    """
+    One row per failed test item or over/under-active muscle of a movement
+    assessment, derived from selections_json / analysis_json (see
+    backend/findings.py) so they can be counted with indexed SQL.
+    """
+    __tablename__ = "movement_findings"
+    __table_args__ = (
+        # findings aggregation: WHERE kind = ? [AND label = ?] ... COUNT(DISTINCT athlete_id)
+        Index("ix_movement_findings_kind_label_athlete", "kind", "label", "athlete_id"),
+        Index("ix_movement_findings_movement", "movement_id"),
+    )
+    id = Column(Integer, primary_key=True)
+    movement_id = Column(Integer, ForeignKey("movement_assessments.id", ondelete="CASCADE"), nullable=False)
+    athlete_id = Column(Integer, ForeignKey("athletes.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(String, nullable=False)   # issue | over | under
+    test = Column(String, nullable=True)    # test name for kind=issue, e.g. "Squat Test"
+    label = Column(String, nullable=False)  # "Knee Valgus", "Adductor Magnus", ...
+
+    movement = relationship("MovementAssessment", back_populates="findings")
 
 
 class Injury(Base):
     __tablename__ = "injuries"
+    __table_args__ = (
+        # injuries.list_by_athlete: WHERE athlete_id = ? ORDER BY date_reported DESC, created_at DESC
+        Index("ix_injuries_athlete_date", "athlete_id", "date_reported", "created_at"),
+        # dashboard: COUNT(DISTINCT athlete_id) WHERE status IN (...)
+        Index("ix_injuries_status_athlete", "status", "athlete_id"),
+        Index("ix_injuries_created_at", "created_at"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     athlete_id = Column(Integer, ForeignKey("athletes.id", ondelete="CASCADE"), nullable=False)
 
@@ -150,8 +223,44 @@ class Injury(Base):
     athlete = relationship("Athlete", back_populates="injuries")
 
 
+class AthleteRisk(Base):
+    """
+    Per-athlete risk/readiness, kept up to date incrementally by
+    backend/risk.py whenever injuries, assessments or movement screens are
+    written, so "highest risk first" is an index scan.
+    """
+    __tablename__ = "athlete_risk"
+    __table_args__ = (
+        Index("ix_athlete_risk_score", "risk_score"),
+    )
+    athlete_id = Column(Integer, ForeignKey("athletes.id", ondelete="CASCADE"), primary_key=True)
+
+    # injuries: running sums over non-resolved injuries (delta-updated)
+    injury_risk = Column(Float, nullable=False, default=0)      # sum of severity x stage weights
+    active_injuries = Column(Integer, nullable=False, default=0)
+
+    # latest assessment (by date, then id)
+    assessment_id = Column(Integer, nullable=True)
+    assessment_date = Column(Date, nullable=True)
+    asymmetry = Column(Float, nullable=True)
+
+    # latest movement screen (by created_at, then id)
+    movement_id = Column(Integer, nullable=True)
+    movement_at = Column(DateTime, nullable=True)
+    red_flag_count = Column(Integer, nullable=True)
+    movement_score = Column(Float, nullable=True)
+
+    risk_score = Column(Float, nullable=False, default=0)       # 0-100, higher = more risk
+    risk_band = Column(String, nullable=False, default="Low")   # Low | Moderate | High
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 class Note(Base):
     __tablename__ = "notes"
+    __table_args__ = (
+        # notes listing: WHERE athlete_id = ? ORDER BY pinned DESC, created_at DESC
+        Index("ix_notes_athlete_pinned_created", "athlete_id", "pinned", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     athlete_id: Mapped[int] = mapped_column(ForeignKey("athletes.id", ondelete="CASCADE"), nullable=False)
@@ -172,6 +281,38 @@ class User(Base):
     password_hash = Column(String, nullable=False)
     role = Column(String, default="owner")         # owner / coach etc.
     is_active = Column(Boolean, default=True)
-    reset_token = Column(String, nullable=True)
+    reset_token = Column(String, nullable=True, index=True)
     reset_expires = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class OutboundEmail(Base):
+    """Persistent outbox drained by backend/mailer.py; survives restarts."""
+    __tablename__ = "outbound_emails"
+    __table_args__ = (
+        # sender polls: WHERE status = 'pending' AND next_attempt_at <= now
+        Index("ix_outbound_emails_status_next", "status", "next_attempt_at"),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    to_email = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    body = Column(Text, nullable=False)
+    status = Column(String, nullable=False, default="pending")  # pending | sending | sent | failed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    claimed_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    sent_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class TableVersion(Base):
+    """
+    Version counters for writes made outside the server process (CLI
+    rebuilds/backfills). Running servers poll this table and bump their
+    in-process ETag counters when a row changes (backend/versions.py).
+    """
+    __tablename__ = "table_versions"
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
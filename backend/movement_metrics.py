@@ -0,0 +1,128 @@
+# backend/movement_metrics.py
+"""
+Movement screen scoring, mirroring frontend/src/utils/movementMetrics.js
+(computeMovementMetrics + the badge rule of makeMovementRecommendations) so
+the results are stored on MovementAssessment and roster-wide questions
+("who has red flags?") become plain indexed queries.
+
+Stored per assessment:
+    total_fails         failed items across all tests
+    fails_by_category   {"Squat Test": 2, ...}              (JSON)
+    red_flags           ["Knee Valgus", ...] one per test it failed in (JSON)
+    red_flag_count      len(red_flags)
+    top_issues          [{"label", "score"}] up to 5, score = tests failed (JSON)
+    movement_score      0-100 composite, higher is better (server-side only)
+    movement_badge      High Risk | Needs Work | Solid | None
+
+Existing rows are filled by migration step 5; recompute them all, e.g. after
+changing the scoring, with:
+    python -m backend.movement_metrics
+"""
+from typing import Any, Optional
+import json
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from . import models
+from .findings import load_json
+from .versions import record_external_bump
+
+RED_FLAGS = frozenset({"Knee Valgus", "Contralateral Hip Drop", "Excessive Lumbar Lordosis"})
+TOP_ISSUES = 5
+# composite: start at 100, lose FAIL_PENALTY per failed item and
+# RED_FLAG_PENALTY more per red-flag item
+FAIL_PENALTY = 4
+RED_FLAG_PENALTY = 8
+
+
+def compute_movement_metrics(selections_json: Optional[str]) -> dict[str, Any]:
+    """Stored metric columns for one assessment's selections_json."""
+    selections = load_json(selections_json)
+    if not isinstance(selections, dict):
+        selections = {}
+
+    by_category: dict[str, int] = {}
+    red_flags: list[str] = []
+    issue_scores: dict[str, int] = {}
+    for test, labels in selections.items():
+        failed = list(dict.fromkeys(
+            l.strip() for l in (labels if isinstance(labels, list) else [])
+            if isinstance(l, str) and l.strip()
+        ))
+        by_category[str(test)] = len(failed)
+        for label in failed:
+            if label in RED_FLAGS:
+                red_flags.append(label)
+            issue_scores[label] = issue_scores.get(label, 0) + 1
+
+    total_fails = sum(by_category.values())
+    # stable sort, like Array.prototype.sort: ties keep first-seen order
+    top = sorted(issue_scores.items(), key=lambda kv: -kv[1])[:TOP_ISSUES]
+
+    if len(red_flags) >= 2:
+        badge = "High Risk"
+    elif total_fails >= 5:
+        badge = "Needs Work"
+    elif total_fails <= 1:
+        badge = "Solid"
+    else:
+        badge = None
+
+    score = max(0, 100 - FAIL_PENALTY * total_fails - RED_FLAG_PENALTY * len(red_flags))
+    return {
+        "total_fails": total_fails,
+        "fails_by_category": json.dumps(by_category, ensure_ascii=False),
+        "red_flags": json.dumps(red_flags, ensure_ascii=False),
+        "red_flag_count": len(red_flags),
+        "top_issues": json.dumps([{"label": l, "score": s} for l, s in top], ensure_ascii=False),
+        "movement_score": float(score),
+        "movement_badge": badge,
+    }
+
+
+def apply_movement_metrics(obj: models.MovementAssessment) -> None:
+    """Fills the computed columns on a MovementAssessment before it is flushed."""
+    for k, v in compute_movement_metrics(obj.selections_json).items():
+        setattr(obj, k, v)
+
+
+def backfill(db: Session, chunk_size: int = 5000, only_missing: bool = False) -> int:
+    """Recomputes movement metrics for stored assessments in chunks. Returns rows updated."""
+    M = models.MovementAssessment
+    last_id = 0
+    updated = 0
+    while True:
+        q = select(M.id, M.selections_json).where(M.id > last_id).order_by(M.id).limit(chunk_size)
+        if only_missing:
+            q = q.where(M.total_fails.is_(None))
+        rows = db.execute(q).all()
+        if not rows:
+            break
+        params = [{"id": r.id, **compute_movement_metrics(r.selections_json)} for r in rows]
+        db.execute(update(M), params)  # executemany UPDATE ... WHERE id = ?
+        db.commit()
+        updated += len(rows)
+        last_id = rows[-1].id
+    if updated:
+        # running servers cache responses built from this table
+        record_external_bump(db, M.__tablename__)
+        db.commit()
+    return updated
+
+
+if __name__ == "__main__":
+    import argparse
+    from .database import SessionLocal
+
+    p = argparse.ArgumentParser(description="Recompute stored movement screen metrics")
+    p.add_argument("--chunk-size", type=int, default=5000)
+    p.add_argument("--only-missing", action="store_true", help="skip rows that already have metrics")
+    args = p.parse_args()
+
+    db = SessionLocal()
+    try:
+        n = backfill(db, chunk_size=args.chunk_size, only_missing=args.only_missing)
+        print(f"Updated metrics for {n} movement assessments.")
+    finally:
+        db.close()
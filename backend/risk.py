@@ -0,0 +1,267 @@
+# backend/risk.py
+"""
+Per-athlete risk / readiness, materialized in models.AthleteRisk and kept
+current incrementally on write: a new or changed injury, assessment or
+movement screen adjusts only its own athlete's row, so
+GET /athletes/at-risk is an ORDER BY on an indexed column instead of a
+recomputation over the whole roster.
+
+Inputs (each mirrors what the browser already shows):
+    injuries    running sum of severity x stage weight over unresolved
+                injuries (injuryUtils.js normalizeInjury), updated by deltas
+    asymmetry   from the athlete's latest assessment (backend/metrics.py)
+    red flags   from the athlete's latest movement screen
+                (backend/movement_metrics.py)
+
+risk_score, 0-100 with higher = more risk:
+    INJURY_POINTS    * min(injury_risk, INJURY_CAP) / INJURY_CAP
+  + ASYMMETRY_POINTS * min(asymmetry, ASYMMETRY_CAP) / ASYMMETRY_CAP
+  + RED_FLAG_POINTS  * min(red_flag_count, RED_FLAG_CAP) / RED_FLAG_CAP
+readiness = 100 - risk_score.
+
+The apply_* functions work inside the caller's transaction (call them
+before commit). Rebuild every row from the source tables, e.g. after
+changing the weights (running servers notice through table_versions, see
+backend/versions.py):
+    python -m backend.risk
+"""
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime
+from typing import Any, Optional
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from . import models
+from .versions import record_external_bump
+
+# injuryUtils.js: riskScore = severity (0-10) x stage weight. The injury form
+# stores severity/status as words, mapped the way AthleteProfile.jsx does.
+SEVERITY_SCORES = {"minor": 3, "moderate": 6, "severe": 8}
+DEFAULT_SEVERITY = 5
+STAGE_WEIGHTS = {"active": 1.0, "recovering": 0.6}  # acute / subacute
+OTHER_STAGE_WEIGHT = 0.3                            # rtp
+RESOLVED = "resolved"                               # no longer counts
+
+INJURY_POINTS, INJURY_CAP = 50, 10.0
+ASYMMETRY_POINTS, ASYMMETRY_CAP = 25, 30.0          # % L/R difference
+RED_FLAG_POINTS, RED_FLAG_CAP = 25, 3
+
+HIGH, MODERATE = 50, 25
+
+
+def _get(row: Any, key: str) -> Any:
+    return row.get(key) if isinstance(row, Mapping) else getattr(row, key)
+
+
+def _severity(raw: Any) -> float:
+    if raw is None or raw == "":
+        return DEFAULT_SEVERITY
+    try:
+        return min(10.0, max(0.0, float(raw)))
+    except (TypeError, ValueError):
+        return SEVERITY_SCORES.get(str(raw).strip().lower(), DEFAULT_SEVERITY)
+
+
+def _is_open(status: Optional[str]) -> bool:
+    return (status or "").strip().lower() != RESOLVED
+
+
+def injury_weight(severity: Any, status: Optional[str]) -> float:
+    """One injury's riskScore (0-10); 0 once it is resolved."""
+    if not _is_open(status):
+        return 0.0
+    stage = (status or "active").strip().lower()
+    return round(_severity(severity) * STAGE_WEIGHTS.get(stage, OTHER_STAGE_WEIGHT), 1)
+
+
+def score(injury_risk: float, asymmetry: Optional[float], red_flag_count: Optional[int]) -> tuple[float, str]:
+    """(risk_score, risk_band) for one athlete's stored inputs."""
+    total = (
+        INJURY_POINTS * min(injury_risk or 0, INJURY_CAP) / INJURY_CAP
+        + ASYMMETRY_POINTS * min(asymmetry or 0, ASYMMETRY_CAP) / ASYMMETRY_CAP
+        + RED_FLAG_POINTS * min(red_flag_count or 0, RED_FLAG_CAP) / RED_FLAG_CAP
+    )
+    total = round(total, 1)
+    band = "High" if total >= HIGH else "Moderate" if total >= MODERATE else "Low"
+    return total, band
+
+
+def _rescore(r: models.AthleteRisk) -> None:
+    r.risk_score, r.risk_band = score(r.injury_risk, r.asymmetry, r.red_flag_count)
+
+
+def _rows(db: Session, athlete_ids: Iterable[int]) -> dict[int, models.AthleteRisk]:
+    """Risk rows for these athletes, created if missing and locked for update."""
+    ids = sorted(set(athlete_ids))
+    if not ids:
+        return {}
+    R = models.AthleteRisk
+    db.flush()  # the reload below must not discard pending changes to these rows
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        ins = (sqlite_insert if dialect == "sqlite" else pg_insert)(R)
+        db.execute(ins.on_conflict_do_nothing(index_elements=["athlete_id"]), [{"athlete_id": i} for i in ids])
+    else:
+        have = set(db.scalars(select(R.athlete_id).where(R.athlete_id.in_(ids))))
+        missing = [{"athlete_id": i} for i in ids if i not in have]
+        if missing:
+            db.execute(insert(R), missing)
+    q = (
+        select(R)
+        .where(R.athlete_id.in_(ids))
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return {r.athlete_id: r for r in db.scalars(q)}
+
+
+# -----------------------------
+# Incremental updates
+# -----------------------------
+def apply_injuries(db: Session, changes: Iterable[tuple[Any, Any]]) -> None:
+    """
+    (old, new) pairs of injury values (ORM objects or dicts with athlete_id,
+    severity, status): (None, new) for an insert, (old, None) for a delete.
+    Only the difference each change makes is added to the running totals.
+    """
+    deltas: dict[int, list] = {}  # athlete_id -> [injury_risk delta, active_injuries delta]
+    for old, new in changes:
+        for row, sign in ((old, -1), (new, 1)):
+            if row is None:
+                continue
+            d = deltas.setdefault(_get(row, "athlete_id"), [0.0, 0])
+            d[0] += sign * injury_weight(_get(row, "severity"), _get(row, "status"))
+            d[1] += sign * _is_open(_get(row, "status"))
+    for athlete_id, r in _rows(db, deltas).items():
+        d_risk, d_active = deltas[athlete_id]
+        r.injury_risk = max(0.0, round((r.injury_risk or 0) + d_risk, 4))
+        r.active_injuries = max(0, (r.active_injuries or 0) + d_active)
+        _rescore(r)
+
+
+def _assessment_key(d: Optional[date], id_: int) -> tuple:
+    # assessments list newest first by date (undated last), then by creation
+    return (d is not None, d or date.min, id_)
+
+
+def _movement_key(at: Optional[datetime], id_: int) -> tuple:
+    return (at or datetime.min, id_)
+
+
+def _latest(rows: Iterable[Any], key) -> dict[int, Any]:
+    best: dict[int, tuple] = {}
+    for row in rows:
+        k = key(row)
+        athlete_id = _get(row, "athlete_id")
+        if athlete_id not in best or k > best[athlete_id][0]:
+            best[athlete_id] = (k, row)
+    return {athlete_id: row for athlete_id, (_k, row) in best.items()}
+
+
+def _set_assessment(r: models.AthleteRisk, row: Any) -> None:
+    r.assessment_id = _get(row, "id") if row is not None else None
+    r.assessment_date = _get(row, "date") if row is not None else None
+    r.asymmetry = _get(row, "asymmetry") if row is not None else None
+
+
+def _set_movement(r: models.AthleteRisk, row: Any) -> None:
+    r.movement_id = _get(row, "id") if row is not None else None
+    r.movement_at = _get(row, "created_at") if row is not None else None
+    r.red_flag_count = _get(row, "red_flag_count") if row is not None else None
+    r.movement_score = _get(row, "movement_score") if row is not None else None
+
+
+def apply_assessments(db: Session, rows: Iterable[Any]) -> None:
+    """
+    New or changed assessments (ORM objects or dicts with id, athlete_id,
+    date, asymmetry). The athlete's row follows the latest one; only if the
+    current latest is moved back in time is that athlete's latest looked up again.
+    """
+    key = lambda row: _assessment_key(_get(row, "date"), _get(row, "id"))
+    latest = _latest(rows, key)
+    for athlete_id, r in _rows(db, latest).items():
+        row = latest[athlete_id]
+        if r.assessment_id is None or key(row) >= _assessment_key(r.assessment_date, r.assessment_id):
+            _set_assessment(r, row)
+        elif r.assessment_id == _get(row, "id"):
+            A = models.Assessment
+            _set_assessment(r, db.execute(
+                select(A.id, A.athlete_id, A.date, A.asymmetry)
+                .where(A.athlete_id == athlete_id)
+                .order_by(A.date.desc().nullslast(), A.id.desc())
+                .limit(1)
+            ).first())
+        _rescore(r)
+
+
+def apply_movements(db: Session, rows: Iterable[Any]) -> None:
+    """
+    New or changed movement screens (ORM objects or dicts with id,
+    athlete_id, created_at, red_flag_count, movement_score), latest wins.
+    """
+    key = lambda row: _movement_key(_get(row, "created_at"), _get(row, "id"))
+    latest = _latest(rows, key)
+    for athlete_id, r in _rows(db, latest).items():
+        row = latest[athlete_id]
+        if r.movement_id is None or key(row) >= _movement_key(r.movement_at, r.movement_id):
+            _set_movement(r, row)
+        _rescore(r)
+
+
+# -----------------------------
+# Full rebuild
+# -----------------------------
+def rebuild(db: Session, chunk_size: int = 1000) -> int:
+    """
+    Recomputes every athlete's row from the source tables, chunked by
+    athlete, through the same apply_* code as the write path. Returns athletes processed.
+    """
+    A, I, S, M = models.Athlete, models.Injury, models.Assessment, models.MovementAssessment
+    R = models.AthleteRisk
+    db.execute(delete(R).where(~R.athlete_id.in_(select(A.id))))
+    last_id = 0
+    processed = 0
+    while True:
+        ids = db.scalars(select(A.id).where(A.id > last_id).order_by(A.id).limit(chunk_size)).all()
+        if not ids:
+            break
+        db.execute(delete(R).where(R.athlete_id.in_(ids)))
+        _rows(db, ids)
+        injuries = db.execute(select(I.athlete_id, I.severity, I.status).where(I.athlete_id.in_(ids))).mappings().all()
+        apply_injuries(db, ((None, row) for row in injuries))
+        apply_assessments(db, db.execute(
+            select(S.id, S.athlete_id, S.date, S.asymmetry).where(S.athlete_id.in_(ids))
+        ).mappings().all())
+        apply_movements(db, db.execute(
+            select(M.id, M.athlete_id, M.created_at, M.red_flag_count, M.movement_score)
+            .where(M.athlete_id.in_(ids))
+        ).mappings().all())
+        db.commit()
+        db.expunge_all()
+        processed += len(ids)
+        last_id = ids[-1]
+    # running servers cache responses built from this table
+    record_external_bump(db, models.AthleteRisk.__tablename__)
+    db.commit()
+    return processed
+
+
+if __name__ == "__main__":
+    import argparse
+    from .database import SessionLocal
+    from .versions import VERSION_POLL_SECONDS
+
+    p = argparse.ArgumentParser(description="Rebuild the per-athlete risk table")
+    p.add_argument("--chunk-size", type=int, default=1000)
+    args = p.parse_args()
+
+    db = SessionLocal()
+    try:
+        n = rebuild(db, chunk_size=args.chunk_size)
+        print(f"Rebuilt risk for {n} athletes.")
+        print(f"Running servers pick up the change within {VERSION_POLL_SECONDS:g}s; no restart needed.")
+    finally:
+        db.close()
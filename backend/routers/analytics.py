@@ -0,0 +1,173 @@
+# backend/routers/analytics.py
+from fastapi import APIRouter, Depends, Query
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, List, Literal, Optional
+import os
+import warnings
+
+import numpy as np
+
+from ..database import get_async_db
+from ..cache import TTLCache
+from .. import models, schemas
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+GroupField = Literal["sport", "level", "position", "club_team"]
+MetricField = Literal[
+    "cmf_left", "cmf_right", "cmp_left", "cmp_right",
+    "ratio_left", "ratio_right", "asymmetry",
+    "percent_below_left", "percent_below_right",
+]
+DEFAULT_METRICS = ["cmf_left", "cmf_right", "ratio_left", "ratio_right", "asymmetry"]
+PERCENTILES = (10, 25, 50, 75, 90)
+
+# Cohort reports are keyed by the full filter set; a short TTL keeps them
+# fresh enough for benchmarking without recomputing on every click.
+COHORT_TTL = float(os.getenv("ANALYTICS_CACHE_TTL", "60"))
+cohort_cache = TTLCache(ttl=COHORT_TTL, maxsize=256)
+
+
+def _source(group_by: list[str], metrics: list[str], filters: dict[str, str], latest_only: bool):
+    """
+    Assessments joined to their athlete's cohort fields. With latest_only, a
+    ROW_NUMBER() window keeps each athlete's most recent assessment so
+    athletes who test often don't dominate their cohort.
+    """
+    A, Ath = models.Assessment, models.Athlete
+    rn = func.row_number().over(
+        partition_by=A.athlete_id,
+        order_by=(A.date.desc().nullslast(), A.created_at.desc()),
+    ).label("rn")
+    q = (
+        select(
+            A.athlete_id,
+            *[getattr(Ath, g) for g in group_by],
+            *[getattr(A, m) for m in metrics],
+            rn,
+        )
+        .join(Ath, Ath.id == A.athlete_id)
+    )
+    for field, value in filters.items():
+        q = q.where(getattr(Ath, field) == value)
+    sub = q.subquery()
+    where = [sub.c.rn == 1] if latest_only else []
+    return sub, where
+
+
+def _percentiles_numpy(rows: list, n_groups: int, metrics: list[str]) -> dict[tuple, dict[str, list]]:
+    """rows: (*group_key, *metric_values) sorted by group key."""
+    out: dict[tuple, dict[str, list]] = {}
+    if not rows:
+        return out
+    keys = [tuple(r[:n_groups]) for r in rows]
+    values = np.array([r[n_groups:] for r in rows], dtype=float)  # None -> nan
+    bounds = [0] + [i for i in range(1, len(keys)) if keys[i] != keys[i - 1]] + [len(keys)]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)  # all-NaN column -> NaN
+        for lo, hi in zip(bounds, bounds[1:]):
+            block = values[lo:hi]
+            pct = np.nanpercentile(block, PERCENTILES, axis=0)  # shape (len(PERCENTILES), len(metrics))
+            out[keys[lo]] = {m: pct[:, j].tolist() for j, m in enumerate(metrics)}
+    return out
+
+
+def _stat(v: Any) -> Optional[float]:
+    if v is None:
+        return None
+    v = float(v)
+    return None if np.isnan(v) else round(v, 3)
+
+
+async def _compute(
+    db: AsyncSession, group_by: list[str], metrics: list[str], filters: dict[str, str], latest_only: bool
+) -> schemas.CohortReport:
+    sub, where = _source(group_by, metrics, filters, latest_only)
+    keys = [sub.c[g] for g in group_by]
+    is_postgres = db.bind.dialect.name == "postgresql"
+
+    cols = [
+        *keys,
+        func.count(func.distinct(sub.c.athlete_id)).label("athletes"),
+        func.count().label("assessments"),
+    ]
+    for m in metrics:
+        c = sub.c[m]
+        cols += [func.avg(c), func.min(c), func.max(c)]
+        if is_postgres:
+            cols += [func.percentile_cont(p / 100).within_group(c) for p in PERCENTILES]
+    agg_rows = (await db.execute(select(*cols).where(*where).group_by(*keys).order_by(*keys))).all()
+
+    pct_by_key: dict[tuple, dict[str, list]] = {}
+    if not is_postgres:
+        # No percentile_cont on SQLite: fetch just (group, metric) columns and do it in NumPy
+        value_rows = (
+            await db.execute(
+                select(*keys, *[sub.c[m] for m in metrics]).where(*where).order_by(*keys)
+            )
+        ).all()
+        pct_by_key = await run_in_threadpool(_percentiles_numpy, value_rows, len(group_by), metrics)
+
+    n = len(group_by)
+    per_metric = 3 + (len(PERCENTILES) if is_postgres else 0)
+    cohorts = []
+    for row in agg_rows:
+        key = tuple(row[:n])
+        stats = {}
+        for j, m in enumerate(metrics):
+            base = n + 2 + j * per_metric
+            mean, lo, hi = row[base], row[base + 1], row[base + 2]
+            pcts = row[base + 3: base + per_metric] if is_postgres else pct_by_key.get(key, {}).get(m, [None] * len(PERCENTILES))
+            stats[m] = schemas.MetricStats(
+                mean=_stat(mean),
+                min=_stat(lo),
+                max=_stat(hi),
+                percentiles={f"p{p}": _stat(v) for p, v in zip(PERCENTILES, pcts)},
+            )
+        cohorts.append(
+            schemas.Cohort(
+                key=dict(zip(group_by, key)),
+                athletes=row[n],
+                assessments=row[n + 1],
+                metrics=stats,
+            )
+        )
+
+    return schemas.CohortReport(
+        group_by=group_by,
+        filters=filters,
+        latest_only=latest_only,
+        cohorts=cohorts,
+    )
+
+
+@router.get("/cohorts", response_model=schemas.CohortReport)
+async def cohorts(
+    group_by: List[GroupField] = Query(["sport"]),
+    metrics: List[MetricField] = Query(DEFAULT_METRICS),
+    sport: Optional[str] = None,
+    level: Optional[str] = None,
+    position: Optional[str] = None,
+    club_team: Optional[str] = None,
+    latest_only: bool = True,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Assessment metric distributions per cohort. Repeat `group_by` / `metrics`
+    for several (e.g. ?group_by=sport&group_by=level). Cohort filters narrow
+    the athletes considered. Mean/min/max come from SQL GROUP BY; percentiles
+    use percentile_cont on Postgres and NumPy elsewhere.
+    """
+    group_by = list(dict.fromkeys(group_by))
+    metrics = list(dict.fromkeys(metrics))
+    filters = {
+        k: v
+        for k, v in (("sport", sport), ("level", level), ("position", position), ("club_team", club_team))
+        if v is not None
+    }
+    cache_key = (tuple(group_by), tuple(metrics), tuple(sorted(filters.items())), latest_only)
+    return await cohort_cache.aget_or_set(
+        cache_key, lambda: _compute(db, group_by, metrics, filters, latest_only)
+    )
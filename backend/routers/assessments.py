@@ -1,24 +1,124 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import Date, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-from ..database import get_db
+from typing import List, Literal, Optional
+from datetime import date as _date
+import numpy as np
+from ..database import get_db, get_async_db
 from .. import models, schemas
+from ..http_cache import cached_json
+from ..versions import versions
+from ..metrics import apply_metrics
+from ..risk import apply_assessments
+from ..timeseries import bucket_aggregate, lttb_indices
 
 router = APIRouter(prefix="/assessments", tags=["assessments"])
 
-@router.get("/athlete/{athlete_id}", response_model=List[schemas.AssessmentOut])
-def list_by_athlete(athlete_id: int, db: Session = Depends(get_db)):
+def _list_query(athlete_id: int):
+    """One athlete's assessments, newest first (ix_assessments_athlete_date)."""
     return (
-        db.query(models.Assessment)
-        .filter(models.Assessment.athlete_id == athlete_id)
+        select(models.Assessment)
+        .where(models.Assessment.athlete_id == athlete_id)
         .order_by(models.Assessment.date.desc().nullslast(), models.Assessment.created_at.desc())
-        .all()
     )
 
+@router.get("/athlete/{athlete_id}", response_model=List[schemas.AssessmentOut])
+async def list_by_athlete(athlete_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    async def load():
+        result = await db.execute(_list_query(athlete_id))
+        return result.scalars().all()
+
+    etag = versions.athlete_tag(athlete_id, "assessments")
+    return await cached_json(request, etag, load, List[schemas.AssessmentOut])
+
+SERIES_FIELDS = ("cmf_left", "cmf_right", "cmp_left", "cmp_right", "ratio_left", "ratio_right")
+SeriesField = Literal["cmf_left", "cmf_right", "cmp_left", "cmp_right", "ratio_left", "ratio_right"]
+
+
+def _to_list(values: np.ndarray) -> list[Optional[float]]:
+    return [None if np.isnan(v) else float(v) for v in values]
+
+
+def _build_series(
+    athlete_id: int,
+    rows: list,
+    bucket: Optional[str],
+    max_points: Optional[int],
+    lttb_metric: str,
+) -> schemas.AssessmentSeries:
+    x = np.array([r.day.toordinal() for r in rows], dtype=np.int64)
+    cols = {
+        name: np.array([getattr(r, name) for r in rows], dtype=float)  # None -> nan
+        for name in SERIES_FIELDS
+    }
+    mins = maxes = None
+    mode = "raw"
+
+    if bucket and len(rows):
+        x, cols, mins, maxes = bucket_aggregate(x, cols, bucket)
+        mode = bucket
+
+    if max_points and len(x) > max_points:
+        keep = lttb_indices(x.astype(float), cols[lttb_metric], max_points)
+        x = x[keep]
+        cols = {k: v[keep] for k, v in cols.items()}
+        if mins is not None:
+            mins = {k: v[keep] for k, v in mins.items()}
+            maxes = {k: v[keep] for k, v in maxes.items()}
+        mode = "lttb" if mode == "raw" else f"{mode}+lttb"
+
+    return schemas.AssessmentSeries(
+        athlete_id=athlete_id,
+        mode=mode,
+        source_points=len(rows),
+        dates=[_date.fromordinal(int(d)) for d in x],
+        series={k: _to_list(v) for k, v in cols.items()},
+        series_min={k: _to_list(v) for k, v in mins.items()} if mins is not None else None,
+        series_max={k: _to_list(v) for k, v in maxes.items()} if maxes is not None else None,
+    )
+
+
+@router.get("/athlete/{athlete_id}/series", response_model=schemas.AssessmentSeries)
+async def series_by_athlete(
+    athlete_id: int,
+    start: Optional[_date] = None,
+    end: Optional[_date] = None,
+    bucket: Optional[Literal["week", "month"]] = None,
+    max_points: Optional[int] = Query(None, ge=3, le=5000),
+    lttb_metric: SeriesField = "cmf_left",
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Chart-ready columnar series, oldest first. Points are dated by `date`,
+    falling back to the day the assessment was created.
+
+    - `start`/`end`: inclusive date range
+    - `bucket=week|month`: one point per bucket with mean, plus series_min/series_max
+    - `max_points`: LTTB-downsample to at most this many points (shape-preserving,
+      driven by `lttb_metric`); applied after bucketing if both are given
+    """
+    A = models.Assessment
+    day = func.coalesce(A.date, func.date(A.created_at, type_=Date), type_=Date).label("day")
+    q = select(day, *[getattr(A, f) for f in SERIES_FIELDS]).where(A.athlete_id == athlete_id)
+    if start is not None:
+        q = q.where(day >= start)
+    if end is not None:
+        q = q.where(day <= end)
+    rows = (await db.execute(q.order_by(day.asc(), A.created_at.asc()))).all()
+
+    # NumPy work happens off the event loop
+    return await run_in_threadpool(_build_series, athlete_id, rows, bucket, max_points, lttb_metric)
+
+
 @router.post("/", response_model=schemas.AssessmentOut)
 def create_assessment(payload: schemas.AssessmentCreate, db: Session = Depends(get_db)):
     obj = models.Assessment(**payload.model_dump())
+    apply_metrics(obj)
     db.add(obj)
+    db.flush()  # id for the risk row
+    apply_assessments(db, [obj])
     db.commit()
     db.refresh(obj)
     return obj
@@ -1,24 +1,207 @@
 # backend/routers/athletes.py
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Any
-from pathlib import Path
+from typing import List, Any, Literal, Optional, Union
 
-from ..database import get_db
+from ..database import get_db, get_async_db
 from .. import models, schemas
+from ..http_cache import cached_json
+from ..uploads import release
+from ..versions import versions
 
 router = APIRouter(prefix="/athletes", tags=["athletes"])
 
-@router.get("/", response_model=List[schemas.AthleteOut])
-def list_athletes(db: Session = Depends(get_db)):
-    return db.query(models.Athlete).order_by(models.Athlete.id.desc()).all()
+# Columns backing schemas.AthleteSummary (selected directly, no ORM hydration)
+SUMMARY_COLUMNS = [
+    getattr(models.Athlete, name) for name in schemas.AthleteSummary.model_fields
+]
+
+MAX_PAGE_SIZE = 500
+
+
+@router.get(
+    "/",
+    response_model=Union[schemas.AthletePage, List[schemas.AthleteSummary], List[schemas.AthleteOut]],
+)
+async def list_athletes(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after_id: Optional[int] = Query(None, ge=1),
+    view: Literal["full", "summary"] = "full",
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Without `limit`/`after_id` this returns the whole roster as a plain list
+    (newest first), exactly as before.
+
+    With `limit` (and optionally `after_id`) it switches to keyset pagination
+    on the primary key: each page is `WHERE id < after_id ORDER BY id DESC
+    LIMIT n`, so page cost stays flat no matter how deep you go. Feed
+    `next_after_id` back as `after_id` to get the following page.
+
+    `view=summary` selects only the roster columns instead of all ~45.
+    """
+    summary = view == "summary"
+    q = select(*SUMMARY_COLUMNS) if summary else select(models.Athlete)
+    q = q.order_by(models.Athlete.id.desc())
+
+    async def fetch(stmt):
+        result = await db.execute(stmt)
+        return result.all() if summary else result.scalars().all()
+
+    if limit is None and after_id is None:
+        rows = await fetch(q)
+        if summary:
+            return [schemas.AthleteSummary.model_validate(r) for r in rows]
+        return rows
+
+    limit = limit or MAX_PAGE_SIZE
+    if after_id is not None:
+        q = q.where(models.Athlete.id < after_id)
+    # fetch one extra row to know whether another page exists
+    rows = await fetch(q.limit(limit + 1))
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    out_schema = schemas.AthleteSummary if summary else schemas.AthleteOut
+    return schemas.AthletePage(
+        items=[out_schema.model_validate(r) for r in rows],
+        limit=limit,
+        next_after_id=rows[-1].id if has_more else None,
+    )
+
+# static paths must be declared before /{athlete_id}
+@router.get("/at-risk", response_model=List[schemas.AthleteRiskOut])
+async def at_risk(
+    request: Request,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    min_score: float = Query(0, ge=0, le=100),
+    band: Optional[Literal["Low", "Moderate", "High"]] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Athletes ranked by the materialized risk score (backend/risk.py),
+    highest first. The scores are maintained on write, so this is a scan of
+    ix_athlete_risk_score however large the roster is.
+    """
+    R, A = models.AthleteRisk, models.Athlete
+    q = (
+        select(R, A.first_name, A.last_name, A.sport)
+        .join(A, A.id == R.athlete_id)
+        .where(R.risk_score >= min_score)
+        .order_by(R.risk_score.desc(), R.athlete_id)
+        .limit(limit)
+    )
+    if band is not None:
+        q = q.where(R.risk_band == band)
+
+    async def load():
+        rows = (await db.execute(q)).all()
+        return [
+            schemas.AthleteRiskOut(
+                athlete_id=r.athlete_id,
+                athlete_name=f"{first} {last}".strip(),
+                sport=sport,
+                risk_score=r.risk_score,
+                readiness=round(100 - r.risk_score, 1),
+                risk_band=r.risk_band,
+                injury_risk=r.injury_risk,
+                active_injuries=r.active_injuries,
+                asymmetry=r.asymmetry,
+                assessment_date=r.assessment_date,
+                red_flag_count=r.red_flag_count,
+                movement_score=r.movement_score,
+                updated_at=r.updated_at,
+            )
+            for r, first, last, sport in rows
+        ]
+
+    etag = versions.tables_tag(models.AthleteRisk.__tablename__, "athletes")
+    return await cached_json(request, etag, load, List[schemas.AthleteRiskOut])
 
 @router.get("/{athlete_id}", response_model=schemas.AthleteOut)
-def get_athlete(athlete_id: int, db: Session = Depends(get_db)):
-    obj = db.get(models.Athlete, athlete_id)  # SQLAlchemy 2.x style
-    if not obj:
-        raise HTTPException(status_code=404, detail="Athlete not found")
-    return obj
+async def get_athlete(athlete_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    async def load():
+        obj = await db.get(models.Athlete, athlete_id)
+        if not obj:
+            raise HTTPException(status_code=404, detail="Athlete not found")
+        return obj
+
+    etag = versions.athlete_tag(athlete_id, "athletes")
+    return await cached_json(request, etag, load, schemas.AthleteOut)
+
+# profile collection -> (model, ORDER BY); all newest first
+PROFILE_COLLECTIONS = {
+    "assessments": (models.Assessment, (models.Assessment.date.desc().nullslast(), models.Assessment.created_at.desc())),
+    "movements": (models.MovementAssessment, (models.MovementAssessment.created_at.desc(),)),
+    "injuries": (models.Injury, (models.Injury.date_reported.desc(), models.Injury.created_at.desc())),
+    "notes": (models.Note, (models.Note.pinned.desc(), models.Note.created_at.desc())),
+}
+ProfileCollection = Literal["assessments", "movements", "injuries", "notes"]
+
+
+def _profile_query(name: str, athlete_id: int):
+    model, order_by = PROFILE_COLLECTIONS[name]
+    return select(model).where(model.athlete_id == athlete_id).order_by(*order_by)
+
+
+@router.get("/{athlete_id}/profile", response_model=schemas.AthleteProfile)
+async def athlete_profile(
+    athlete_id: int,
+    request: Request,
+    include: List[ProfileCollection] = Query(list(PROFILE_COLLECTIONS)),
+    view: Literal["full", "summary"] = "full",
+    assessments_limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    movements_limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    injuries_limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    notes_limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Everything the profile page shows in one request / one session: the
+    athlete plus the collections in `include` (default: all four), each
+    newest first. That's 1 + len(include) indexed queries no matter how much
+    history the athlete has.
+
+    - `view=summary` returns only the roster columns for the athlete
+    - `<collection>_limit` keeps the N most recent rows; `has_more` reports
+      whether older ones were cut off
+    """
+    include = list(dict.fromkeys(include))
+    limits = {
+        "assessments": assessments_limit,
+        "movements": movements_limit,
+        "injuries": injuries_limit,
+        "notes": notes_limit,
+    }
+
+    async def load():
+        if view == "summary":
+            row = (await db.execute(select(*SUMMARY_COLUMNS).where(models.Athlete.id == athlete_id))).first()
+            athlete = schemas.AthleteSummary.model_validate(row) if row else None
+        else:
+            obj = await db.get(models.Athlete, athlete_id)
+            athlete = schemas.AthleteOut.model_validate(obj) if obj else None
+        if athlete is None:
+            raise HTTPException(status_code=404, detail="Athlete not found")
+
+        out = {"athlete": athlete, "has_more": {}}
+        for name in include:
+            q = _profile_query(name, athlete_id)
+            limit = limits[name]
+            if limit is not None:
+                q = q.limit(limit + 1)  # one extra row to detect more
+            rows = (await db.execute(q)).scalars().all()
+            if limit is not None:
+                out["has_more"][name] = len(rows) > limit
+                rows = rows[:limit]
+            out[name] = rows
+        return out
+
+    tables = ["athletes", *(PROFILE_COLLECTIONS[name][0].__tablename__ for name in include)]
+    etag = versions.athlete_tag(athlete_id, *tables)
+    return await cached_json(request, etag, load, schemas.AthleteProfile)
 
 @router.post("/", response_model=schemas.AthleteOut, status_code=status.HTTP_201_CREATED)
 def create_athlete(payload: schemas.AthleteCreate, db: Session = Depends(get_db)):
@@ -29,13 +212,13 @@ def create_athlete(payload: schemas.AthleteCreate, db: Session = Depends(get_db)
     return obj
 
 @router.get("/{athlete_id}/notes", response_model=List[schemas.NoteOut])
-def notes_for_athlete(athlete_id: int, db: Session = Depends(get_db)):
-    return (
-        db.query(models.Note)
-        .filter(models.Note.athlete_id == athlete_id)
+async def notes_for_athlete(athlete_id: int, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(
+        select(models.Note)
+        .where(models.Note.athlete_id == athlete_id)
         .order_by(models.Note.pinned.desc(), models.Note.created_at.desc())
-        .all()
     )
+    return result.scalars().all()
 
 @router.patch("/{athlete_id}", response_model=schemas.AthleteOut)
 def update_athlete(athlete_id: int, payload: schemas.AthleteUpdate, db: Session = Depends(get_db)):
@@ -43,9 +226,12 @@ def update_athlete(athlete_id: int, payload: schemas.AthleteUpdate, db: Session
     if not obj:
         raise HTTPException(status_code=404, detail="Athlete not found")
     data: dict[str, Any] = payload.model_dump(exclude_unset=True)
+    old_photo = obj.photo_url
     for k, v in data.items():
         setattr(obj, k, v)
     db.commit()
+    if obj.photo_url != old_photo:
+        release(db, old_photo)
     db.refresh(obj)
     return obj
 
@@ -55,20 +241,15 @@ def delete_athlete(athlete_id: int, db: Session = Depends(get_db)):
     Permanently delete an athlete and all related records (assessments,
     movement assessments, injuries, notes). The ORM relationships in
     models.py are configured with cascade, so children are removed as well.
-    Also attempts to delete the local photo file if stored under /uploads.
+    Also deletes the local photo file under /uploads once no other athlete
+    uses it (uploads are content-addressed, so files can be shared).
     """
     obj = db.get(models.Athlete, athlete_id)
     if not obj:
         raise HTTPException(status_code=404, detail="Athlete not found")
 
-    # best-effort cleanup of uploaded avatar
-    try:
-        if obj.photo_url and obj.photo_url.startswith("/uploads/"):
-            rel = obj.photo_url.split("/uploads/", 1)[-1]
-            (Path("uploads") / rel).unlink(missing_ok=True)
-    except Exception:
-        pass  # non-fatal
-
+    photo_url = obj.photo_url
     db.delete(obj)
     db.commit()
+    release(db, photo_url)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,16 +1,24 @@
 # backend/routers/auth.py
 from fastapi import APIRouter, Depends, HTTPException, Response, Request, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from uuid import uuid4
-from email.mime.text import MIMEText
 from typing import Optional
 import os
-import smtplib
 
-from ..database import get_db
+from ..database import get_db, get_async_db
+from ..cache import TTLCache
+from ..mailer import enqueue_email, mail_worker
 from .. import models, schemas
-from ..security import hash_password, verify_password, create_token, decode_token
+from ..security import (
+    PasswordHasherBusy,
+    create_token,
+    decode_token,
+    hash_password_async,
+    verify_and_update_async,
+)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -35,48 +43,14 @@ ENABLE_REGISTER = os.getenv("ENABLE_REGISTER", "0") == "1"
 # -----------------------------
 # Email (Password Reset)
 # -----------------------------
-def send_reset_email(to_email: str, reset_url: str):
+def send_reset_email(db: Session, to_email: str, reset_url: str):
     """
-    Works with:
-      - SMTP_PORT=465  -> implicit TLS (SMTP_SSL)
-      - SMTP_PORT=587 or 2525 -> STARTTLS (SMTP + starttls)
-    If SMTP_* env vars are missing, prints the link to the log.
+    Queues the reset email in the outbox (see backend/mailer.py); it goes out
+    when the caller commits, from the background sender, so the request never
+    waits on the mail server.
     """
-    import os, smtplib
-    from email.mime.text import MIMEText
-
-    host = os.getenv("SMTP_HOST")
-    port = int(os.getenv("SMTP_PORT", "0") or 0)
-    user = os.getenv("SMTP_USER")
-    pwd  = os.getenv("SMTP_PASS")
-    sender = os.getenv("SMTP_FROM", user or "no-reply@example.com")
-
     body = f"Click to reset your password:\n\n{reset_url}\n\nThis link expires in 30 minutes."
-    msg = MIMEText(body)
-    msg["Subject"] = "Password reset"
-    msg["From"] = sender
-    msg["To"] = to_email
-
-    if not (host and port and user and pwd):
-        print(f"[DEV] Reset link for {to_email}: {reset_url}")
-        return
-
-    try:
-        if port == 465:
-            with smtplib.SMTP_SSL(host, port) as server:
-                server.login(user, pwd)
-                server.sendmail(sender, [to_email], msg.as_string())
-        else:
-            # 587 or 2525 -> STARTTLS
-            with smtplib.SMTP(host, port) as server:
-                server.ehlo()
-                server.starttls()
-                server.ehlo()
-                server.login(user, pwd)
-                server.sendmail(sender, [to_email], msg.as_string())
-        print(f"[MAIL] Reset email sent to {to_email}")
-    except Exception as e:
-        print(f"[MAIL][ERROR] {e}")
+    enqueue_email(db, to_email, "Password reset", body)
 
 
 # -----------------------------
@@ -98,25 +72,97 @@ def clear_auth_cookie(resp: Response):
     resp.delete_cookie(COOKIE_NAME, path="/")
 
 
-def current_user(request: Request, db: Session) -> Optional[models.User]:
-    token = request.cookies.get(COOKIE_NAME)
-    if not token:
+# -----------------------------
+# Authenticated-user cache
+# -----------------------------
+# token -> user id (skips JWT decode), user id -> UserOut snapshot (skips the
+# DB lookup). Both are bounded and short-lived; invalidate_user() must be
+# called whenever a user's password, role or active flag changes.
+AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL", "60"))
+AUTH_CACHE_SIZE = int(os.getenv("AUTH_CACHE_SIZE", "1024"))
+_token_cache = TTLCache(ttl=AUTH_CACHE_TTL, maxsize=AUTH_CACHE_SIZE)
+_user_cache = TTLCache(ttl=AUTH_CACHE_TTL, maxsize=AUTH_CACHE_SIZE)
+# Tokens cleared via /logout stay rejected by this process until they expire.
+_revoked_tokens = TTLCache(ttl=ACCESS_TOKEN_MAX_AGE, maxsize=10_000)
+
+
+def invalidate_user(user_id: int) -> None:
+    _user_cache.invalidate(user_id)
+
+
+def revoke_token(token: str) -> None:
+    _token_cache.invalidate(token)
+    _revoked_tokens.set(token, True)
+
+
+def _token_user_id(token: str) -> Optional[int]:
+    if _revoked_tokens.get(token):
         return None
+    uid = _token_cache.get(token)
+    if uid is not None:
+        return uid
     try:
-        payload = decode_token(token)
-        uid = payload.get("sub")
-        if not uid:
-            return None
-        return db.query(models.User).get(int(uid))
+        sub = decode_token(token).get("sub")
+        uid = int(sub) if sub else None
     except Exception:
         return None
+    if uid is not None:
+        _token_cache.set(token, uid)
+    return uid
+
+
+async def get_current_user(
+    request: Request, db: AsyncSession = Depends(get_async_db)
+) -> Optional[schemas.UserOut]:
+    """
+    Dependency: the logged-in user or None. On a warm cache this is two dict
+    lookups; the DB is only hit when the user snapshot has expired.
+    """
+    token = request.cookies.get(COOKIE_NAME)
+    if not token:
+        return None
+    uid = _token_user_id(token)
+    if uid is None:
+        return None
+    user = _user_cache.get(uid)
+    if user is None:
+        obj = await db.get(models.User, uid)
+        if obj is None:
+            return None
+        user = schemas.UserOut.model_validate(obj)
+        _user_cache.set(uid, user)
+    return user if user.is_active else None
+
+
+async def require_user(
+    user: Optional[schemas.UserOut] = Depends(get_current_user),
+) -> schemas.UserOut:
+    """Dependency for protected routes: 401 unless logged in."""
+    if user is None:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return user
+
+
+def _hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many sign-in attempts right now, please retry",
+        headers={"Retry-After": "2"},
+    )
+
+
+async def _user_by_email(db: AsyncSession, email: str) -> Optional[models.User]:
+    result = await db.execute(select(models.User).where(models.User.email == email.lower()))
+    return result.scalars().first()
 
 
 # -----------------------------
 # Routes
 # -----------------------------
+# register/login/reset are async so the bcrypt work can be awaited on the
+# dedicated hashing pool (security.py) instead of blocking a shared worker.
 @router.post("/register", response_model=schemas.UserOut)
-def register(payload: schemas.RegisterIn, db: Session = Depends(get_db)):
+async def register(payload: schemas.RegisterIn, db: AsyncSession = Depends(get_async_db)):
     """
     Registration is OFF by default.
     If you enable it (ENABLE_REGISTER=1), it still enforces the allow-list:
@@ -128,51 +174,67 @@ def register(payload: schemas.RegisterIn, db: Session = Depends(get_db)):
     if ALLOWED_LOGIN_EMAILS and payload.email.lower() not in ALLOWED_LOGIN_EMAILS:
         raise HTTPException(status_code=403, detail="Registration not allowed for this email")
 
-    exists = db.query(models.User).filter(models.User.email == payload.email.lower()).first()
+    exists = await _user_by_email(db, payload.email)
     if exists:
         raise HTTPException(status_code=400, detail="Email already registered")
 
+    try:
+        password_hash = await hash_password_async(payload.password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+
     u = models.User(
         email=payload.email.lower(),
         full_name=payload.full_name,
-        password_hash=hash_password(payload.password),
+        password_hash=password_hash,
         role="owner",
         is_active=True,
     )
     db.add(u)
-    db.commit()
-    db.refresh(u)
+    await db.commit()
+    await db.refresh(u)
     return u
 
 
 @router.post("/login", response_model=schemas.UserOut)
-def login(payload: schemas.LoginIn, response: Response, db: Session = Depends(get_db)):
-    u = db.query(models.User).filter(models.User.email == payload.email.lower()).first()
+async def login(payload: schemas.LoginIn, response: Response, db: AsyncSession = Depends(get_async_db)):
+    u = await _user_by_email(db, payload.email)
 
     # Enforce "only two can log" (or however many you list) via allow-list
     if ALLOWED_LOGIN_EMAILS and (not u or u.email.lower() not in ALLOWED_LOGIN_EMAILS):
         # Do not reveal whether user exists
         raise HTTPException(status_code=403, detail="Login not allowed for this account")
 
-    if not u or not verify_password(payload.password, u.password_hash):
+    if not u:
+        raise HTTPException(status_code=401, detail="Invalid email/password")
+    try:
+        ok, new_hash = await verify_and_update_async(payload.password, u.password_hash)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+    if not ok:
         raise HTTPException(status_code=401, detail="Invalid email/password")
 
+    if new_hash:
+        # stored hash used an old bcrypt cost; upgrade it while we have the plaintext
+        u.password_hash = new_hash
+        await db.commit()
+
     token = create_token({"sub": str(u.id)})
     set_auth_cookie(response, token)
     return schemas.UserOut.model_validate(u)
 
 
 @router.post("/logout")
-def logout(response: Response):
+def logout(request: Request, response: Response):
+    token = request.cookies.get(COOKIE_NAME)
+    if token:
+        revoke_token(token)
     clear_auth_cookie(response)
     return {"ok": True}
 
 
 @router.get("/me", response_model=schemas.MeOut)
-def me(request: Request, db: Session = Depends(get_db)):
-    u = current_user(request, db)
-    if not u:
-        raise HTTPException(status_code=401, detail="Not authenticated")
+async def me(u: schemas.UserOut = Depends(require_user)):
     return u
 
 
@@ -189,18 +251,24 @@ def request_reset(payload: schemas.ResetRequestIn, db: Session = Depends(get_db)
         token = uuid4().hex
         u.reset_token = token
         u.reset_expires = datetime.utcnow() + timedelta(minutes=30)
-        db.commit()
 
         app_url = os.getenv("APP_URL", "http://localhost:5173")
         reset_url = f"{app_url}/reset-password?token={token}"
-        send_reset_email(u.email, reset_url)
+        send_reset_email(db, u.email, reset_url)
+        db.commit()
+        mail_worker.wake()
 
     return {"ok": True}
 
 
+def _reset_token_query(token: str):
+    """The user holding a reset token (ix_users_reset_token)."""
+    return select(models.User).where(models.User.reset_token == token)
+
 @router.post("/reset")
-def confirm_reset(payload: schemas.ResetConfirmIn, db: Session = Depends(get_db)):
-    u = db.query(models.User).filter(models.User.reset_token == payload.token).first()
+async def confirm_reset(payload: schemas.ResetConfirmIn, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(_reset_token_query(payload.token))
+    u = result.scalars().first()
     if not u or not u.reset_expires or u.reset_expires < datetime.utcnow():
         raise HTTPException(status_code=400, detail="Invalid or expired token")
 
@@ -208,8 +276,12 @@ def confirm_reset(payload: schemas.ResetConfirmIn, db: Session = Depends(get_db)
     if ALLOWED_LOGIN_EMAILS and u.email.lower() not in ALLOWED_LOGIN_EMAILS:
         raise HTTPException(status_code=403, detail="Not allowed")
 
-    u.password_hash = hash_password(payload.new_password)
+    try:
+        u.password_hash = await hash_password_async(payload.new_password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
     u.reset_token = None
     u.reset_expires = None
-    db.commit()
+    await db.commit()
+    invalidate_user(u.id)
     return {"ok": True}
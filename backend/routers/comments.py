@@ -1,12 +1,15 @@
 # backend/routers/comments.py
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, cast
 from datetime import datetime
 import json
 
-from ..database import get_db
+from ..database import get_db, get_async_db
 from .. import models, schemas
+from ..group_commit import note_writer
 
 router = APIRouter(tags=["notes"])
 
@@ -21,41 +24,49 @@ def to_out(n: models.Note) -> schemas.NoteOut:
         created_at=cast(datetime, n.created_at),
     )
 
-@router.get("/athletes/{athlete_id}/notes", response_model=List[schemas.NoteOut])
-def list_notes_alias(athlete_id: int, db: Session = Depends(get_db)):
-    # reuse same listing logic
-    items = (
-        db.query(models.Note)
-        .filter(models.Note.athlete_id == athlete_id)
+def _notes_query(athlete_id: int):
+    """One athlete's notes, pinned first, then newest (ix_notes_athlete_pinned_created)."""
+    return (
+        select(models.Note)
+        .where(models.Note.athlete_id == athlete_id)
         .order_by(models.Note.pinned.desc(), models.Note.created_at.desc())
-        .all()
     )
-    return items  # NoteOut validator now parses tags for us
+
+@router.get("/athletes/{athlete_id}/notes", response_model=List[schemas.NoteOut])
+async def list_notes_alias(athlete_id: int, db: AsyncSession = Depends(get_async_db)):
+    # reuse same listing logic
+    result = await db.execute(_notes_query(athlete_id))
+    return result.scalars().all()  # NoteOut validator now parses tags for us
 
 
 @router.post("/notes", response_model=schemas.NoteOut)
-def create_note(payload: schemas.NoteCreate, db: Session = Depends(get_db)):
-    obj = models.Note(
-        athlete_id=payload.athlete_id,
-        text=payload.text,
-        tags=json.dumps(payload.tags or []),
-        author=payload.author or "Coach",
-        pinned=False,
-    )
-    db.add(obj)
-    db.commit()
-    db.refresh(obj)
-    return to_out(obj)
+def create_note(payload: schemas.NoteCreate):
+    # committed together with other notes/pins arriving at the same moment
+    def write(db: Session) -> schemas.NoteOut:
+        obj = models.Note(
+            athlete_id=payload.athlete_id,
+            text=payload.text,
+            tags=json.dumps(payload.tags or []),
+            author=payload.author or "Coach",
+            pinned=False,
+        )
+        db.add(obj)
+        db.flush()  # id + created_at
+        return to_out(obj)
+
+    return note_writer.submit(write)
 
 @router.patch("/notes/{note_id}/pin", response_model=schemas.NoteOut)
-def pin_note(note_id: int, body: schemas.PinPatch, db: Session = Depends(get_db)):
-    obj = db.get(models.Note, note_id)   # modern get()
-    if not obj:
-        raise HTTPException(status_code=404, detail="Note not found")
-    obj.pinned = body.pinned
-    db.commit()
-    db.refresh(obj)
-    return to_out(obj)
+def pin_note(note_id: int, body: schemas.PinPatch):
+    def write(db: Session) -> schemas.NoteOut:
+        obj = db.get(models.Note, note_id)   # modern get()
+        if not obj:
+            raise HTTPException(status_code=404, detail="Note not found")
+        obj.pinned = body.pinned
+        db.flush()
+        return to_out(obj)
+
+    return note_writer.submit(write)
 
 @router.delete("/notes/{note_id}", status_code=204)
 def delete_note(note_id: int, db: Session = Depends(get_db)):
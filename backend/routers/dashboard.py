@@ -1,10 +1,14 @@
 # backend/routers/dashboard.py
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from ..database import get_db
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import get_async_db
+from ..http_cache import cached_json
+from ..versions import versions
 from .. import models
 from typing import Any, Optional
 from datetime import date as _date, datetime as _dt
+import os
 
 
 def _iso(v: Any) -> Optional[str]:
@@ -15,90 +19,112 @@ def _iso(v: Any) -> Optional[str]:
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
-@router.get("/overview")
-def overview(db: Session = Depends(get_db)):
-    # ---- counts
-    total_athletes = db.query(models.Athlete).count()
-    total_assessments = db.query(models.Assessment).count()
-    # If your model is MovementAssessment, change to models.MovementAssessment
-    total_movement = db.query(models.MovementAssessment).count()
-    active_ids = {
-        r.athlete_id
-        for r in db.query(models.Injury)
-        .filter(models.Injury.status.in_(["Active", "Recovering"]))
-        .all()
-    }
+# The overview is served through cached_json, so the serialized snapshot is
+# cached under its ETag: a committed write in this process bumps the version
+# counters and changes the tag at once. Writes made elsewhere (other workers,
+# scripts, a sqlite shell) don't move those counters, so the tag also rolls
+# over every OVERVIEW_TTL seconds; that is how stale the overview can get.
+OVERVIEW_TTL = float(os.getenv("DASHBOARD_CACHE_TTL", "5"))
+
+ACTIVE_INJURY_STATUSES = ("Active", "Recovering")
+LATEST_LIMIT = 10
+
+
+def _injured_athletes_query():
+    """Athletes with an active injury (ix_injuries_status_athlete)."""
+    return (
+        select(func.count(func.distinct(models.Injury.athlete_id)))
+        .where(models.Injury.status.in_(ACTIVE_INJURY_STATUSES))
+    )
+
+
+async def _compute_overview(db: AsyncSession) -> dict[str, Any]:
+    # ---- counts: one round-trip, all aggregates done in SQL
+    counts = (await db.execute(
+        select(
+            select(func.count(models.Athlete.id)).scalar_subquery().label("athletes"),
+            select(func.count(models.Assessment.id)).scalar_subquery().label("assessments"),
+            select(func.count(models.MovementAssessment.id)).scalar_subquery().label("movements"),
+            _injured_athletes_query().scalar_subquery().label("injured"),
+        )
+    )).one()
+
+    # ---- latest lists: narrow column selects, no ORM hydration
+    A, S, M, I = models.Athlete, models.Assessment, models.MovementAssessment, models.Injury
 
-    # ---- latest lists (limit what you need)
     latest_athletes = [
         {
-            "id": a.id,
-            "first_name": a.first_name,
-            "last_name": a.last_name,
-            "level": a.level,
-            "sport": a.sport,
+            "id": r.id,
+            "first_name": r.first_name,
+            "last_name": r.last_name,
+            "level": r.level,
+            "sport": r.sport,
         }
-        for a in db.query(models.Athlete)
-        .order_by(models.Athlete.created_at.desc())
-        .limit(10)
-        .all()
+        for r in await db.execute(
+            select(A.id, A.first_name, A.last_name, A.level, A.sport)
+            .order_by(A.created_at.desc())
+            .limit(LATEST_LIMIT)
+        )
     ]
-    items: list[models.Assessment] = (
-    db.query(models.Assessment)
-      .order_by(models.Assessment.created_at.desc())
-      .limit(10)
-      .all()
-)
 
     latest_assessments = [
         {
-            "id": x.id,
-            "athlete_id": x.athlete_id,
-            "date": _iso(getattr(x, "date", None)),
-            "created_at": _iso(getattr(x, "created_at", None)),
+            "id": r.id,
+            "athlete_id": r.athlete_id,
+            "date": _iso(r.date),
+            "created_at": _iso(r.created_at),
         }
-        for x in items
-]
-    movements_q = (
-    db.query(models.MovementAssessment)
-    .order_by(models.MovementAssessment.created_at.desc())
-    .limit(10)
-    .all()
-)
+        for r in await db.execute(
+            select(S.id, S.athlete_id, S.date, S.created_at)
+            .order_by(S.created_at.desc())
+            .limit(LATEST_LIMIT)
+        )
+    ]
 
     latest_movements = [
         {
-            "id": x.id,
-            "athlete_id": x.athlete_id,
-            "created_at": _iso(getattr(x, "created_at", None)),
+            "id": r.id,
+            "athlete_id": r.athlete_id,
+            "created_at": _iso(r.created_at),
         }
-        for x in movements_q
-]
-    injuries_q = (
-    db.query(models.Injury)
-    .order_by(models.Injury.created_at.desc())
-    .limit(10)
-    .all()
-)
+        for r in await db.execute(
+            select(M.id, M.athlete_id, M.created_at)
+            .order_by(M.created_at.desc())
+            .limit(LATEST_LIMIT)
+        )
+    ]
 
     latest_injuries = [
         {
-            "id": x.id,
-            "athlete_id": x.athlete_id,
-            "status": x.status,
-            "area": x.area,
-            "date_reported": _iso(getattr(x, "date_reported", None)),
+            "id": r.id,
+            "athlete_id": r.athlete_id,
+            "status": r.status,
+            "area": r.area,
+            "date_reported": _iso(r.date_reported),
         }
-        for x in injuries_q
+        for r in await db.execute(
+            select(I.id, I.athlete_id, I.status, I.area, I.date_reported)
+            .order_by(I.created_at.desc())
+            .limit(LATEST_LIMIT)
+        )
     ]
 
     return {
-        "total_athletes": total_athletes,
-        "total_assessments": total_assessments,
-        "total_movement_assessments": total_movement,
-        "injured_athletes": len(active_ids),
+        "total_athletes": counts.athletes,
+        "total_assessments": counts.assessments,
+        "total_movement_assessments": counts.movements,
+        "injured_athletes": counts.injured,
         "latest_athletes": latest_athletes,
         "latest_assessments": latest_assessments,
         "latest_movements": latest_movements,
         "latest_injuries": latest_injuries,
     }
+
+
+OVERVIEW_TABLES = ("athletes", "assessments", "movement_assessments", "injuries")
+
+
+@router.get("/overview")
+async def overview(request: Request, db: AsyncSession = Depends(get_async_db)):
+    etag = versions.tables_tag(*OVERVIEW_TABLES, ttl=OVERVIEW_TTL)
+    return await cached_json(request, etag, lambda: _compute_overview(db), dict[str, Any])
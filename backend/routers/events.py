@@ -0,0 +1,93 @@
+# backend/routers/events.py
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+from typing import List, Literal, Optional
+import asyncio
+import json
+import os
+
+from ..events import Subscription, bus
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+HEARTBEAT_SECONDS = float(os.getenv("EVENT_HEARTBEAT_SECONDS", "15"))
+RETRY_MS = 3000
+
+EventTable = Literal["athletes", "assessments", "movement_assessments", "injuries", "notes"]
+
+
+def _frame(ev: dict) -> str:
+    return f"id: {ev['id']}\nevent: {ev['op']}\ndata: {json.dumps(ev, separators=(',', ':'))}\n\n"
+
+
+class EventStream(StreamingResponse):
+    """
+    Releases the subscription however the response ends. The generator's own
+    finally only runs once it has started, which it never does if the client
+    is gone before the first send.
+    """
+
+    def __init__(self, sub: Subscription, content, **kwargs):
+        super().__init__(content, **kwargs)
+        self.sub = sub
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            bus.unsubscribe(self.sub)
+
+
+@router.get("")
+async def stream(
+    request: Request,
+    athlete_id: Optional[int] = Query(None, ge=1),
+    table: Optional[List[EventTable]] = Query(None),
+):
+    """
+    Server-Sent Events feed of roster changes (see backend/events.py).
+    `athlete_id` keeps only that athlete's changes (plus bulk imports and
+    resyncs); repeated `table=` narrows by table. Reconnecting browsers send
+    Last-Event-ID and get what they missed, or a "resync" event if it is no
+    longer buffered. A comment line is sent every HEARTBEAT_SECONDS so
+    proxies keep the connection open.
+    """
+    sub = bus.subscribe(athlete_id=athlete_id, tables=set(table) if table else None)
+    if sub is None:
+        raise HTTPException(status_code=503, detail="Too many event streams", headers={"Retry-After": "30"})
+
+    try:
+        backlog: list[dict] = []
+        last_id = request.headers.get("last-event-id", "")
+        if last_id.isdigit():
+            missed = bus.since(int(last_id), sub)
+            backlog = missed if missed is not None else [{
+                "id": int(last_id), "op": "resync", "table": None, "ref_id": None, "athlete_id": None, "at": None,
+            }]
+    except BaseException:
+        bus.unsubscribe(sub)
+        raise
+
+    async def events():
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            for ev in backlog:
+                yield _frame(ev)
+            while not await request.is_disconnected():
+                try:
+                    ev = await asyncio.wait_for(sub.get(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                yield _frame(ev)
+        finally:
+            bus.unsubscribe(sub)
+
+    # from here on EventStream owns the subscription
+    return EventStream(
+        sub,
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,121 @@
+# backend/routers/exports.py
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from typing import Any, Iterator, Literal, Optional
+from datetime import date as _date, datetime as _dt
+import csv
+import io
+import json
+
+from ..database import SessionLocal
+from .. import models
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+# record type -> table, in the order they are emitted
+EXPORT_TABLES = {
+    "athlete": models.Athlete.__table__,
+    "assessment": models.Assessment.__table__,
+    "movement_assessment": models.MovementAssessment.__table__,
+    "injury": models.Injury.__table__,
+    "note": models.Note.__table__,
+}
+TABLE_PARAM = {
+    "athletes": "athlete",
+    "assessments": "assessment",
+    "movement_assessments": "movement_assessment",
+    "injuries": "injury",
+    "notes": "note",
+}
+
+YIELD_PER = 1000
+
+
+def _json_default(v: Any):
+    if isinstance(v, (_date, _dt)):
+        return v.isoformat()
+    return str(v)
+
+
+def _stream_rows(record_type: str, athlete_id: Optional[int]) -> Iterator[dict]:
+    """
+    Yields one table's rows as dicts using a server-side cursor, YIELD_PER
+    rows at a time, so memory stays flat regardless of table size. Opens its
+    own session because it runs while the response is being sent.
+    """
+    table = EXPORT_TABLES[record_type]
+    q = select(table)
+    if athlete_id is not None:
+        key = table.c.id if record_type == "athlete" else table.c.athlete_id
+        q = q.where(key == athlete_id)
+    q = q.order_by(table.c.id).execution_options(yield_per=YIELD_PER)
+
+    db = SessionLocal()
+    try:
+        for row in db.execute(q):
+            yield dict(row._mapping)
+    finally:
+        db.close()
+
+
+def _ndjson(record_types: list[str], athlete_id: Optional[int]) -> Iterator[str]:
+    for record_type in record_types:
+        buf = []
+        for row in _stream_rows(record_type, athlete_id):
+            buf.append(json.dumps({"type": record_type, "data": row}, default=_json_default))
+            if len(buf) >= YIELD_PER:
+                yield "\n".join(buf) + "\n"
+                buf = []
+        if buf:
+            yield "\n".join(buf) + "\n"
+
+
+def _csv(record_type: str, athlete_id: Optional[int]) -> Iterator[str]:
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow([c.name for c in EXPORT_TABLES[record_type].columns])
+    for n, row in enumerate(_stream_rows(record_type, athlete_id), start=1):
+        writer.writerow(["" if v is None else v for v in row.values()])
+        if n % YIELD_PER == 0:
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate()
+    yield out.getvalue()
+
+
+@router.get("")
+def export(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    table: Optional[Literal["athletes", "assessments", "movement_assessments", "injuries", "notes"]] = None,
+    athlete_id: Optional[int] = Query(None, ge=1),
+):
+    """
+    Streams the database (or one athlete's full record with `athlete_id`).
+
+    - ndjson: every table, one `{"type": ..., "data": {...}}` object per line,
+      athletes first, then assessments, movement assessments, injuries, notes.
+      `table` restricts it to a single table.
+    - csv: a single table (`table` is required), header row = column names.
+    """
+    if format == "csv" and table is None:
+        raise HTTPException(status_code=400, detail="CSV export needs ?table=")
+
+    suffix = f"athlete-{athlete_id}" if athlete_id is not None else "all"
+    if format == "csv":
+        body = _csv(TABLE_PARAM[table], athlete_id)
+        media_type = "text/csv"
+        filename = f"{table}-{suffix}.csv"
+    else:
+        record_types = [TABLE_PARAM[table]] if table else list(EXPORT_TABLES)
+        body = _ndjson(record_types, athlete_id)
+        media_type = "application/x-ndjson"
+        filename = f"{table or 'export'}-{suffix}.ndjson"
+
+    # sync iterators are consumed in the threadpool by StreamingResponse,
+    # so a long export never blocks the event loop
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,190 @@
+# backend/routers/imports.py
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from pydantic import BaseModel, ValidationError
+from typing import Any, Iterator, Literal, Optional
+import codecs
+import csv
+import json
+
+from ..database import get_db
+from ..events import bus
+from .. import models, schemas
+from ..findings import finding_rows
+from ..metrics import compute_batch
+from ..movement_metrics import compute_movement_metrics
+from ..risk import apply_assessments, apply_injuries, apply_movements
+from ..versions import versions
+
+router = APIRouter(prefix="/import", tags=["import"])
+
+# kind -> (row schema, model)
+IMPORT_KINDS: dict[str, tuple[type[BaseModel], Any]] = {
+    "athletes": (schemas.AthleteCreate, models.Athlete),
+    "assessments": (schemas.AssessmentCreate, models.Assessment),
+    "injuries": (schemas.InjuryCreate, models.Injury),
+    "movements": (schemas.MovementCreate, models.MovementAssessment),
+}
+
+BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 500
+
+
+def _detect_format(file: UploadFile, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    name = (file.filename or "").lower()
+    ctype = (file.content_type or "").lower()
+    if name.endswith((".ndjson", ".jsonl")) or "ndjson" in ctype or "jsonl" in ctype:
+        return "ndjson"
+    return "csv"
+
+
+def _iter_rows(file: UploadFile, fmt: str) -> Iterator[tuple[int, Any]]:
+    """
+    Yields (row_number, raw_row) while reading the upload incrementally.
+    Rows that can't even be parsed are yielded as exceptions so they end up
+    in the per-row error report instead of aborting the import.
+    """
+    text = codecs.getreader("utf-8-sig")(file.file)
+    if fmt == "csv":
+        for n, row in enumerate(csv.DictReader(text), start=1):
+            # empty cells mean "not provided"
+            yield n, {k: (v if v != "" else None) for k, v in row.items() if k}
+        return
+
+    for n, line in enumerate(text, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield n, json.loads(line)
+        except ValueError as e:
+            yield n, e
+
+
+def _normalize(kind: str, data: dict) -> dict:
+    if kind == "movements":
+        # allow structured JSON in NDJSON uploads for the *_json text columns
+        for key in ("selections_json", "analysis_json"):
+            if isinstance(data.get(key), (dict, list)):
+                data[key] = json.dumps(data[key])
+    return data
+
+
+def _insert(db: Session, model, rows: list[dict]) -> None:
+    if model is models.Athlete:
+        db.execute(insert(model), rows)
+        return
+    if model is models.Injury:
+        db.execute(insert(model), rows)
+        apply_injuries(db, [(None, row) for row in rows])
+        return
+
+    # movement findings and the risk table's "latest" pointers need the new ids
+    returning = (model.id, model.created_at)
+    inserted = db.execute(insert(model).returning(*returning, sort_by_parameter_order=True), rows).all()
+    rows = [{**row, "id": r.id, "created_at": r.created_at} for r, row in zip(inserted, rows)]
+    if model is models.Assessment:
+        apply_assessments(db, rows)
+        return
+    findings = [
+        f
+        for row in rows
+        for f in finding_rows(row["id"], row["athlete_id"], row.get("selections_json"), row.get("analysis_json"))
+    ]
+    if findings:
+        db.execute(insert(models.MovementFinding), findings)
+    apply_movements(db, rows)
+
+
+def _flush(db: Session, model, batch: list[tuple[int, dict]], errors: list[schemas.ImportRowError]) -> int:
+    """
+    Insert one batch as a single executemany in its own transaction. If the
+    batch is rejected by the database (e.g. a bad athlete_id with foreign
+    keys on), retry it row by row so only the offending rows are reported.
+    """
+    if not batch:
+        return 0
+    if model is models.Assessment:
+        for (_, row), computed in zip(batch, compute_batch([row for _, row in batch])):
+            row.update(computed)
+    elif model is models.MovementAssessment:
+        for _, row in batch:
+            row.update(compute_movement_metrics(row.get("selections_json")))
+    try:
+        _insert(db, model, [row for _, row in batch])
+        db.commit()
+        return len(batch)
+    except SQLAlchemyError:
+        db.rollback()
+
+    inserted = 0
+    for n, row in batch:
+        try:
+            _insert(db, model, [row])
+            db.commit()
+            inserted += 1
+        except SQLAlchemyError as e:
+            db.rollback()
+            errors.append(schemas.ImportRowError(row=n, error=str(e.orig) if hasattr(e, "orig") else str(e)))
+    return inserted
+
+
+@router.post("", response_model=schemas.ImportResult)
+def import_rows(
+    kind: Literal["athletes", "assessments", "injuries", "movements"] = Query(...),
+    format: Optional[Literal["csv", "ndjson"]] = Query(None),
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+):
+    """
+    Bulk import from a CSV (header row = field names) or NDJSON upload.
+    Each row is validated with the matching schemas.*Create model, valid rows
+    are inserted in batches of BATCH_SIZE, and invalid rows are reported by
+    row number (CSV data row / NDJSON line) without stopping the import.
+    """
+    row_schema, model = IMPORT_KINDS[kind]
+    fmt = _detect_format(file, format)
+
+    errors: list[schemas.ImportRowError] = []
+    batch: list[tuple[int, dict]] = []
+    inserted = 0
+    total = 0
+
+    try:
+        for n, raw in _iter_rows(file, fmt):
+            total += 1
+            if isinstance(raw, Exception):
+                errors.append(schemas.ImportRowError(row=n, error=f"Invalid JSON: {raw}"))
+                continue
+            if not isinstance(raw, dict):
+                errors.append(schemas.ImportRowError(row=n, error="Row must be an object"))
+                continue
+            try:
+                obj = row_schema.model_validate(_normalize(kind, raw))
+            except ValidationError as e:
+                errors.append(schemas.ImportRowError(row=n, error=str(e)))
+                continue
+            batch.append((n, obj.model_dump()))
+            if len(batch) >= BATCH_SIZE:
+                inserted += _flush(db, model, batch, errors)
+                batch = []
+        inserted += _flush(db, model, batch, errors)
+    except (UnicodeDecodeError, csv.Error) as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Could not read upload: {e}")
+    finally:
+        if inserted:
+            versions.bump_table(model.__tablename__)
+            bus.publish_bulk(model.__tablename__)
+
+    return schemas.ImportResult(
+        kind=kind,
+        total=total,
+        inserted=inserted,
+        failed=len(errors),
+        errors=errors[:MAX_REPORTED_ERRORS],
+    )
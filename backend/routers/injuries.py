@@ -1,24 +1,38 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
-from ..database import get_db
+from ..database import get_db, get_async_db
 from .. import models, schemas
+from ..http_cache import cached_json
+from ..risk import apply_injuries
+from ..versions import versions
 
 router = APIRouter(prefix="/injuries", tags=["injuries"])
 
-@router.get("/{athlete_id}", response_model=List[schemas.InjuryOut])
-def list_by_athlete(athlete_id: int, db: Session = Depends(get_db)):
+def _list_query(athlete_id: int):
+    """One athlete's injuries, newest first (ix_injuries_athlete_date)."""
     return (
-        db.query(models.Injury)
-        .filter(models.Injury.athlete_id == athlete_id)
+        select(models.Injury)
+        .where(models.Injury.athlete_id == athlete_id)
         .order_by(models.Injury.date_reported.desc(), models.Injury.created_at.desc())
-        .all()
     )
 
+@router.get("/{athlete_id}", response_model=List[schemas.InjuryOut])
+async def list_by_athlete(athlete_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    async def load():
+        result = await db.execute(_list_query(athlete_id))
+        return result.scalars().all()
+
+    etag = versions.athlete_tag(athlete_id, "injuries")
+    return await cached_json(request, etag, load, List[schemas.InjuryOut])
+
 @router.post("/", response_model=schemas.InjuryOut)
 def create_injury(payload: schemas.InjuryCreate, db: Session = Depends(get_db)):
     obj = models.Injury(**payload.model_dump())
     db.add(obj)
+    apply_injuries(db, [(None, obj)])
     db.commit()
     db.refresh(obj)
     return obj
@@ -1,24 +1,162 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-from ..database import get_db
+from typing import List, Literal, Optional
+from ..database import get_db, get_async_db
 from .. import models, schemas
+from ..findings import apply_findings
+from ..movement_metrics import apply_movement_metrics
+from ..risk import apply_movements
 
 router = APIRouter(prefix="/movement-assessments", tags=["movement"])
 
-@router.get("/athlete/{athlete_id}", response_model=List[schemas.MovementOut])
-def list_by_athlete(athlete_id: int, db: Session = Depends(get_db)):
+def _list_query(athlete_id: int):
+    """One athlete's movement assessments, oldest first (ix_movement_assessments_athlete_created)."""
     return (
-        db.query(models.MovementAssessment)
-        .filter(models.MovementAssessment.athlete_id == athlete_id)
+        select(models.MovementAssessment)
+        .where(models.MovementAssessment.athlete_id == athlete_id)
         .order_by(models.MovementAssessment.created_at.asc())
-        .all()
     )
 
+@router.get("/athlete/{athlete_id}", response_model=List[schemas.MovementOut])
+async def list_by_athlete(athlete_id: int, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(_list_query(athlete_id))
+    return result.scalars().all()
+
+FindingKind = Literal["issue", "over", "under"]
+
+
+def _latest_movement_ids():
+    """Each (existing) athlete's most recent movement assessment."""
+    M, A = models.MovementAssessment, models.Athlete
+    rn = func.row_number().over(
+        partition_by=M.athlete_id, order_by=(M.created_at.desc(), M.id.desc())
+    ).label("rn")
+    # joined like flagged / at-risk: with SQLite foreign keys off, rows of
+    # deleted athletes are left behind
+    sub = select(M.id, rn).join(A, A.id == M.athlete_id).subquery()
+    return select(sub.c.id).where(sub.c.rn == 1)
+
+
+@router.get("/findings", response_model=schemas.MovementFindings)
+async def findings(
+    kind: Optional[List[FindingKind]] = Query(None),
+    label: Optional[List[str]] = Query(None),
+    test: Optional[str] = None,
+    by_test: bool = False,
+    latest_only: bool = True,
+    include_athletes: bool = False,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    How many athletes / assessments show each finding, most common first.
+
+    - `kind`: issue (failed test item), over / under (muscle activity); repeatable
+    - `label`: exact finding name(s), e.g. ?kind=issue&label=Knee Valgus
+    - `test` / `by_test`: restrict to, or break issues down by, test name
+    - `latest_only` (default): only each athlete's most recent assessment
+    - `include_athletes`: list the matching athlete ids per finding
+    """
+    F, A = models.MovementFinding, models.Athlete
+    where = []
+    if kind:
+        where.append(F.kind.in_(kind))
+    if label:
+        where.append(F.label.in_(label))
+    if test is not None:
+        where.append(F.test == test)
+    if latest_only:
+        where.append(F.movement_id.in_(_latest_movement_ids()))
+
+    test_col = F.test if by_test else literal(None).label("test")
+    keys = [F.kind, F.test, F.label] if by_test else [F.kind, F.label]
+    athletes = func.count(func.distinct(F.athlete_id)).label("athletes")
+    rows = (await db.execute(
+        select(F.kind, test_col, F.label, athletes, func.count(func.distinct(F.movement_id)).label("assessments"))
+        .join(A, A.id == F.athlete_id)
+        .where(*where)
+        .group_by(*keys)
+        .order_by(athletes.desc(), F.kind, F.label)
+        .limit(limit)
+    )).all()
+
+    ids_by_key: dict[tuple, list[int]] = {}
+    if include_athletes and rows:
+        for r in await db.execute(
+            select(F.kind, test_col, F.label, F.athlete_id)
+            .join(A, A.id == F.athlete_id)
+            .where(*where, F.label.in_({r.label for r in rows}))
+            .distinct()
+            .order_by(F.athlete_id)
+        ):
+            ids_by_key.setdefault((r.kind, r.test, r.label), []).append(r.athlete_id)
+
+    return schemas.MovementFindings(
+        latest_only=latest_only,
+        items=[
+            schemas.FindingCount(
+                kind=r.kind,
+                test=r.test,
+                label=r.label,
+                athletes=r.athletes,
+                assessments=r.assessments,
+                athlete_ids=ids_by_key.get((r.kind, r.test, r.label), []) if include_athletes else None,
+            )
+            for r in rows
+        ],
+    )
+
+@router.get("/flagged", response_model=List[schemas.FlaggedMovement])
+async def flagged(
+    min_red_flags: int = Query(1, ge=1),
+    latest_only: bool = True,
+    limit: int = Query(200, ge=1, le=1000),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Athletes whose movement screen has at least `min_red_flags` red flags,
+    most flags (then lowest score) first. By default only each athlete's most
+    recent screen counts, so athletes who have since improved drop off.
+    """
+    M, A = models.MovementAssessment, models.Athlete
+    q = (
+        select(
+            M.athlete_id, A.first_name, A.last_name, M.id, M.created_at, M.red_flags,
+            M.red_flag_count, M.total_fails, M.movement_score, M.movement_badge,
+        )
+        .join(A, A.id == M.athlete_id)
+        .where(M.red_flag_count >= min_red_flags)
+        .order_by(M.red_flag_count.desc(), M.movement_score.asc(), M.created_at.desc())
+        .limit(limit)
+    )
+    if latest_only:
+        q = q.where(M.id.in_(_latest_movement_ids()))
+    rows = (await db.execute(q)).all()
+    return [
+        schemas.FlaggedMovement(
+            athlete_id=r.athlete_id,
+            athlete_name=f"{r.first_name} {r.last_name}".strip(),
+            movement_id=r.id,
+            assessed_at=r.created_at,
+            red_flags=r.red_flags,
+            red_flag_count=r.red_flag_count,
+            total_fails=r.total_fails or 0,
+            movement_score=r.movement_score,
+            movement_badge=r.movement_badge,
+        )
+        for r in rows
+    ]
+
 @router.post("/", response_model=schemas.MovementOut)
 def create_movement(payload: schemas.MovementCreate, db: Session = Depends(get_db)):
     obj = models.MovementAssessment(**payload.model_dump())
+    apply_movement_metrics(obj)
+    apply_findings(obj)
     db.add(obj)
+    db.flush()  # id / created_at for the risk row
+    apply_movements(db, [obj])
     db.commit()
     db.refresh(obj)
     return obj
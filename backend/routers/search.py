@@ -0,0 +1,52 @@
+# backend/routers/search.py
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal
+
+from ..database import get_async_db
+from .. import schemas
+from ..search import KINDS, search as run_search
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+SearchKind = Literal["athlete", "note", "injury"]
+MAX_LIMIT = 100
+
+
+@router.get("", response_model=schemas.SearchResults)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    kind: List[SearchKind] = Query(list(KINDS)),
+    limit: int = Query(20, ge=1, le=MAX_LIMIT),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Ranked full-text search over athlete profiles (name, sport, club, medical
+    text), notes (text + tags) and injuries (area, diagnosis, notes). Every
+    word must match; on SQLite words also match as prefixes ("ank" finds
+    "ankle"). Narrow with repeated `kind=`; page with `offset`.
+    """
+    kinds = list(dict.fromkeys(kind))
+    # one extra row to know whether another page exists
+    rows = await run_search(db, q, kinds, limit + 1, offset)
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return schemas.SearchResults(
+        query=q,
+        items=[
+            schemas.SearchHit(
+                kind=r.kind,
+                id=r.ref_id,
+                athlete_id=r.athlete_id,
+                athlete_name=f"{r.first_name} {r.last_name}".strip(),
+                title=" ".join(r.title.split()),
+                snippet=" ".join((r.snippet or "").split()),  # empty columns leave runs of spaces
+                score=round(float(r.score), 4),
+            )
+            for r in rows
+        ],
+        limit=limit,
+        offset=offset,
+        next_offset=offset + limit if has_more else None,
+    )
@@ -1,9 +1,11 @@
 # backend/schemas.py
 import datetime as dt
-from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator, ConfigDict, EmailStr
+from typing import Any, Optional, List, Dict
+from pydantic import BaseModel, Field, field_validator, computed_field, ConfigDict, EmailStr
 import json
 
+from .uploads import variant_urls
+
 
 class UserOut(BaseModel):
     id: int
@@ -128,12 +130,44 @@ class AthleteUpdate(BaseModel):
     additional_comments: Optional[str] = None
 
 
-class AthleteOut(AthleteBase):
+class PhotoVariantsMixin(BaseModel):
+    # Resized copies of photo_url (thumb / card / full), derived from the
+    # upload's name; empty for external URLs, so fall back to photo_url.
+    @computed_field
+    @property
+    def photo_variants(self) -> Dict[str, str]:
+        return variant_urls(self.photo_url)
+
+
+class AthleteOut(AthleteBase, PhotoVariantsMixin):
     id: int
     created_at: dt.datetime
     class Config:
         from_attributes = True
 
+# Lightweight roster projection: identity/level/sport columns only, so list
+# payloads don't carry the large medical / coach-IQ Text fields.
+class AthleteSummary(BaseModel):
+    id: int
+    first_name: str
+    last_name: str
+    photo_url: Optional[str] = None
+    email: Optional[str] = None
+    city: Optional[str] = None
+    sport: Optional[str] = None
+    position: Optional[str] = None
+    level: Optional[str] = None
+    club_team: Optional[str] = None
+    created_at: dt.datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class AthletePage(BaseModel):
+    items: List[AthleteSummary] | List[AthleteOut]
+    limit: int
+    # Pass as ?after_id= to fetch the next page; None when this is the last page.
+    next_after_id: Optional[int] = None
+
 # ---- add this in backend/schemas.py ----
 class AthleteUpdate(BaseModel):
     first_name: Optional[str] = None
@@ -218,11 +252,28 @@ class AssessmentOut(BaseModel):
     goal: Optional[str] = None
     recommendation_summary: Optional[str] = None
     coach_comment: Optional[str] = None
+    target_force: Optional[float] = None
+    deficit_left: Optional[float] = None
+    deficit_right: Optional[float] = None
+    percent_below_left: Optional[float] = None
+    percent_below_right: Optional[float] = None
+    asymmetry: Optional[float] = None
     created_at: dt.datetime
 
     model_config = ConfigDict(from_attributes=True)
 
 
+# Columnar chart data for one athlete (GET /assessments/athlete/{id}/series)
+class AssessmentSeries(BaseModel):
+    athlete_id: int
+    mode: str                       # raw | lttb | week | month (| week+lttb ...)
+    source_points: int              # assessments in range before downsampling
+    dates: List[dt.date]            # bucket start dates in week/month mode
+    series: Dict[str, List[Optional[float]]]                  # bucket means in week/month mode
+    series_min: Optional[Dict[str, List[Optional[float]]]] = None
+    series_max: Optional[Dict[str, List[Optional[float]]]] = None
+
+
 # -------- Movement --------
 class MovementCreate(BaseModel):
     athlete_id: int
@@ -234,9 +285,77 @@ class MovementCreate(BaseModel):
 class MovementOut(MovementCreate):
     id: int
     created_at: dt.datetime
+    # stored screen metrics (backend/movement_metrics.py)
+    total_fails: Optional[int] = None
+    fails_by_category: Dict[str, int] = Field(default_factory=dict)
+    red_flags: List[str] = Field(default_factory=list)
+    red_flag_count: Optional[int] = None
+    top_issues: List[Dict[str, Any]] = Field(default_factory=list)
+    movement_score: Optional[float] = None
+    movement_badge: Optional[str] = None
+
+    # stored as JSON text; null (not yet backfilled) -> empty
+    @field_validator("fails_by_category", "red_flags", "top_issues", mode="before")
+    @classmethod
+    def _parse_json(cls, v, info):
+        if isinstance(v, str):
+            try:
+                v = json.loads(v)
+            except ValueError:
+                v = None
+        if v is None:
+            return {} if info.field_name == "fails_by_category" else []
+        return v
+
     class Config:
         from_attributes = True
 
+# GET /movement-assessments/flagged
+class FlaggedMovement(BaseModel):
+    athlete_id: int
+    athlete_name: str
+    movement_id: int
+    assessed_at: dt.datetime
+    red_flags: List[str]
+    red_flag_count: int
+    total_fails: int
+    movement_score: Optional[float] = None
+    movement_badge: Optional[str] = None
+
+    @field_validator("red_flags", mode="before")
+    @classmethod
+    def _parse_flags(cls, v):
+        return json.loads(v) if isinstance(v, str) else (v or [])
+
+# GET /athletes/at-risk
+class AthleteRiskOut(BaseModel):
+    athlete_id: int
+    athlete_name: str
+    sport: Optional[str] = None
+    risk_score: float                 # 0-100, higher = more risk
+    readiness: float                  # 100 - risk_score
+    risk_band: str                    # Low | Moderate | High
+    injury_risk: float                # sum of unresolved injuries' severity x stage
+    active_injuries: int
+    asymmetry: Optional[float] = None           # latest assessment
+    assessment_date: Optional[dt.date] = None
+    red_flag_count: Optional[int] = None        # latest movement screen
+    movement_score: Optional[float] = None
+    updated_at: Optional[dt.datetime] = None
+
+# GET /movement-assessments/findings
+class FindingCount(BaseModel):
+    kind: str                         # issue | over | under
+    test: Optional[str] = None        # only with by_test=true (kind=issue)
+    label: str
+    athletes: int                     # distinct athletes with this finding
+    assessments: int                  # movement assessments with this finding
+    athlete_ids: Optional[List[int]] = None   # with include_athletes=true
+
+class MovementFindings(BaseModel):
+    latest_only: bool
+    items: List[FindingCount]
+
 # -------- Injuries --------
 class InjuryCreate(BaseModel):
     athlete_id: int
@@ -292,3 +411,67 @@ class NoteOut(BaseModel):
 
 class PinPatch(BaseModel):
     pinned: bool
+
+
+# -------- Profile (GET /athletes/{id}/profile) --------
+class AthleteProfile(BaseModel):
+    athlete: AthleteOut | AthleteSummary
+    # None = collection not requested via ?include=
+    assessments: Optional[List[AssessmentOut]] = None
+    movements: Optional[List[MovementOut]] = None
+    injuries: Optional[List[InjuryOut]] = None
+    notes: Optional[List[NoteOut]] = None
+    # collection -> True when its *_limit cut off older rows
+    has_more: Dict[str, bool] = Field(default_factory=dict)
+
+
+# -------- Search --------
+class SearchHit(BaseModel):
+    kind: str                      # athlete | note | injury
+    id: int                        # id of the athlete / note / injury
+    athlete_id: int
+    athlete_name: str
+    title: str
+    snippet: str                   # best-matching excerpt, plain text
+    score: float                   # higher is better; only comparable within one query
+
+class SearchResults(BaseModel):
+    query: str
+    items: List[SearchHit]
+    limit: int
+    offset: int
+    # Pass as ?offset= for the next page; None when this is the last page.
+    next_offset: Optional[int] = None
+
+
+# -------- Bulk import --------
+class ImportRowError(BaseModel):
+    row: int
+    error: str
+
+class ImportResult(BaseModel):
+    kind: str
+    total: int
+    inserted: int
+    failed: int
+    errors: List[ImportRowError] = Field(default_factory=list)  # capped; see `failed` for the full count
+
+
+# -------- Analytics --------
+class MetricStats(BaseModel):
+    mean: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    percentiles: Dict[str, Optional[float]] = Field(default_factory=dict)  # p10 .. p90
+
+class Cohort(BaseModel):
+    key: Dict[str, Optional[str]]     # e.g. {"sport": "Soccer", "level": "High School"}
+    athletes: int
+    assessments: int
+    metrics: Dict[str, MetricStats]
+
+class CohortReport(BaseModel):
+    group_by: List[str]
+    filters: Dict[str, str]
+    latest_only: bool
+    cohorts: List[Cohort]
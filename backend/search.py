@@ -0,0 +1,209 @@
+# backend/search.py
+"""
+Full-text search over athletes, notes and injuries.
+
+SQLite: one FTS5 table, `search_index`, holds a (title, body) document per
+athlete / note / injury. Triggers on the source tables keep it in sync, so
+every write path (ORM, bulk import, raw SQL) is covered. Ranking is bm25 with
+titles weighted above bodies. Documents use rowid = id * 4 + kind code, so
+a trigger can replace a document by rowid without scanning the index.
+
+Postgres: no extra table. Each source table gets a GIN index on its weighted
+tsvector expression, and queries use that same expression, so the index
+can't drift from the data.
+
+Installed by migration step 4. `python -m backend.search` rebuilds the
+SQLite index from scratch.
+"""
+from typing import Optional
+import re
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# kind -> (source table, rowid code, athlete id column, title columns, body columns)
+DOCUMENTS = {
+    "athlete": (
+        "athletes", 0, "id",
+        ("first_name", "last_name"),
+        ("sport", "position", "level", "club_team", "city",
+         "medical_conditions", "allergies", "medications"),
+    ),
+    "note": ("notes", 1, "athlete_id", (), ("text", "tags")),
+    "injury": ("injuries", 2, "athlete_id", ("area",), ("diagnosis", "notes", "mechanism")),
+}
+KINDS = tuple(DOCUMENTS)
+
+# bm25 column weights: kind, ref_id, athlete_id, title, body
+TITLE_WEIGHT, BODY_WEIGHT = 10.0, 1.0
+SNIPPET_TOKENS = 16
+PG_CONFIG = "english"
+
+
+def _concat(prefix: str, columns: tuple[str, ...]) -> str:
+    if not columns:
+        return "''"
+    return " || ' ' || ".join(f"coalesce({prefix}{c}, '')" for c in columns)
+
+
+# -----------------------------
+# SQLite FTS5
+# -----------------------------
+def _sqlite_row(kind: str, prefix: str) -> tuple[str, str]:
+    table, code, athlete_col, title, body = DOCUMENTS[kind]
+    cols = "rowid, kind, ref_id, athlete_id, title, body"
+    values = (
+        f"{prefix}id * 4 + {code}, '{kind}', {prefix}id, {prefix}{athlete_col}, "
+        f"{_concat(prefix, title)}, {_concat(prefix, body)}"
+    )
+    return cols, values
+
+
+def _sqlite_install(conn: Connection) -> None:
+    conn.exec_driver_sql(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+        "kind UNINDEXED, ref_id UNINDEXED, athlete_id UNINDEXED, title, body, "
+        "tokenize = 'porter unicode61 remove_diacritics 2')"
+    )
+    for kind, (table, code, athlete_col, title, body) in DOCUMENTS.items():
+        cols, new_values = _sqlite_row(kind, "NEW.")
+        watched = ", ".join(dict.fromkeys((athlete_col, *title, *body)))
+        conn.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO search_index({cols}) VALUES ({new_values}); END"
+        )
+        conn.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_au AFTER UPDATE OF {watched} ON {table} BEGIN "
+            f"DELETE FROM search_index WHERE rowid = OLD.id * 4 + {code}; "
+            f"INSERT INTO search_index({cols}) VALUES ({new_values}); END"
+        )
+        conn.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_ad AFTER DELETE ON {table} BEGIN "
+            f"DELETE FROM search_index WHERE rowid = OLD.id * 4 + {code}; END"
+        )
+    rebuild(conn)
+
+
+def rebuild(conn: Connection) -> None:
+    """Re-index every document (SQLite)."""
+    conn.exec_driver_sql("DELETE FROM search_index")
+    for kind, (table, *_rest) in DOCUMENTS.items():
+        cols, values = _sqlite_row(kind, "")
+        conn.exec_driver_sql(f"INSERT INTO search_index({cols}) SELECT {values} FROM {table}")
+
+
+def drop_search_index(conn: Connection) -> None:
+    """Used by reset_db.py; triggers go with their tables, the index doesn't."""
+    if conn.dialect.name == "sqlite":
+        conn.exec_driver_sql("DROP TABLE IF EXISTS search_index")
+
+
+def fts_query(q: str) -> Optional[str]:
+    """
+    User text -> FTS5 MATCH expression: every word must match, each as a
+    quoted prefix so partial words work and FTS syntax in the input is inert.
+    """
+    words = re.findall(r"\w+", q.lower())
+    if not words:
+        return None
+    return " ".join(f'"{w}"*' for w in words)
+
+
+# -----------------------------
+# Postgres tsvector
+# -----------------------------
+def _pg_document(kind: str, prefix: str = "") -> str:
+    _table, _code, _athlete_col, title, body = DOCUMENTS[kind]
+    return (
+        f"(setweight(to_tsvector('{PG_CONFIG}', {_concat(prefix, title)}), 'A') || "
+        f"setweight(to_tsvector('{PG_CONFIG}', {_concat(prefix, body)}), 'B'))"
+    )
+
+
+def _pg_install(conn: Connection) -> None:
+    for kind, (table, *_rest) in DOCUMENTS.items():
+        conn.exec_driver_sql(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_search ON {table} USING gin ({_pg_document(kind)})"
+        )
+
+
+def install(conn: Connection) -> None:
+    if conn.dialect.name == "sqlite":
+        _sqlite_install(conn)
+    elif conn.dialect.name == "postgresql":
+        _pg_install(conn)
+
+
+# -----------------------------
+# Querying
+# -----------------------------
+async def search(
+    db: AsyncSession, q: str, kinds: list[str], limit: int, offset: int
+) -> list:
+    """
+    Ranked hits, best first: rows of (kind, ref_id, athlete_id, first_name,
+    last_name, title, snippet, score), with higher scores better.
+    Hits whose athlete no longer exists are dropped.
+    """
+    if db.bind.dialect.name == "postgresql":
+        return await _search_pg(db, q, kinds, limit, offset)
+    match = fts_query(q)
+    if match is None:
+        return []
+    sql = text(
+        f"""
+        SELECT search_index.kind, search_index.ref_id, search_index.athlete_id,
+               a.first_name, a.last_name, search_index.title,
+               snippet(search_index, -1, '', '', '…', {SNIPPET_TOKENS}) AS snippet,
+               -bm25(search_index, 0, 0, 0, {TITLE_WEIGHT}, {BODY_WEIGHT}) AS score
+        FROM search_index
+        JOIN athletes a ON a.id = search_index.athlete_id
+        WHERE search_index MATCH :match
+          AND search_index.kind IN ({", ".join(f"'{k}'" for k in kinds)})
+        ORDER BY score DESC
+        LIMIT :limit OFFSET :offset
+        """
+    )
+    return (await db.execute(sql, {"match": match, "limit": limit, "offset": offset})).all()
+
+
+async def _search_pg(db: AsyncSession, q: str, kinds: list[str], limit: int, offset: int) -> list:
+    parts = []
+    for kind in kinds:
+        table, _code, athlete_col, title, body = DOCUMENTS[kind]
+        parts.append(
+            f"SELECT '{kind}' AS kind, t.id AS ref_id, t.{athlete_col} AS athlete_id, "
+            f"{_concat('t.', title)} AS title, {_concat('t.', body)} AS body, "
+            f"ts_rank({_pg_document(kind, 't.')}, q.query) AS score "
+            f"FROM {table} t, query q WHERE {_pg_document(kind, 't.')} @@ q.query"
+        )
+    # ts_headline is costly, so it runs only on the page being returned
+    sql = text(
+        f"""
+        WITH query AS (SELECT websearch_to_tsquery('{PG_CONFIG}', :q) AS query),
+        hits AS (
+            {" UNION ALL ".join(parts)}
+            ORDER BY score DESC
+            LIMIT :limit OFFSET :offset
+        )
+        SELECT hits.kind, hits.ref_id, hits.athlete_id, a.first_name, a.last_name, hits.title,
+               ts_headline('{PG_CONFIG}', hits.body, (SELECT query FROM query),
+                           'StartSel="",StopSel="",MaxFragments=1,MaxWords={SNIPPET_TOKENS},MinWords=6') AS snippet,
+               hits.score
+        FROM hits JOIN athletes a ON a.id = hits.athlete_id
+        ORDER BY hits.score DESC
+        """
+    )
+    return (await db.execute(sql, {"q": q, "limit": limit, "offset": offset})).all()
+
+
+if __name__ == "__main__":
+    from .database import engine
+
+    with engine.begin() as conn:
+        if conn.dialect.name == "sqlite":
+            rebuild(conn)
+            print("search index rebuilt")
+        else:
+            print("nothing to rebuild: Postgres searches the tables' own GIN indexes")
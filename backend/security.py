@@ -1,6 +1,9 @@
 # backend/security.py
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Optional
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 
@@ -8,7 +11,11 @@ SECRET = os.getenv("JWT_SECRET", "dev-super-secret-change-me")
 ALGO = "HS256"
 ACCESS_MIN = int(os.getenv("ACCESS_MINUTES", "10080"))  # 7 days
 
-pwd = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt cost factor. Raising it is safe: hashes with a different cost are
+# flagged by deprecated="auto" and transparently re-hashed at next login.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+pwd = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 
 def hash_password(p: str) -> str:
     return pwd.hash(p)
@@ -23,3 +30,46 @@ def create_token(data: dict, minutes: int = ACCESS_MIN) -> str:
 
 def decode_token(token: str) -> dict:
     return jwt.decode(token, SECRET, algorithms=[ALGO])
+
+
+# -----------------------------
+# Dedicated password-hashing pool
+# -----------------------------
+# bcrypt is deliberately slow. Running it on its own small pool (bcrypt
+# releases the GIL, so threads are enough) keeps a burst of logins from
+# occupying the threadpool every other endpoint shares. At most
+# HASH_WORKERS hashes run at once, at most HASH_QUEUE more wait, and anything
+# beyond that is rejected immediately with PasswordHasherBusy.
+HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+HASH_QUEUE = int(os.getenv("PASSWORD_HASH_QUEUE", "32"))
+HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", "10"))
+
+_hash_pool = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="pwhash")
+_hash_slots = asyncio.Semaphore(HASH_WORKERS + HASH_QUEUE)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing pool is saturated or a job times out."""
+
+
+async def _run_hash_job(fn, *args):
+    if _hash_slots.locked():
+        raise PasswordHasherBusy("password hashing queue is full")
+    async with _hash_slots:
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(_hash_pool, fn, *args), HASH_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise PasswordHasherBusy("password hashing timed out")
+
+
+async def hash_password_async(p: str) -> str:
+    return await _run_hash_job(pwd.hash, p)
+
+
+async def verify_and_update_async(p: str, h: str) -> tuple[bool, Optional[str]]:
+    """
+    Verify on the hashing pool. Returns (ok, new_hash); new_hash is set when
+    the stored hash uses an outdated cost and should be replaced.
+    """
+    return await _run_hash_job(pwd.verify_and_update, p, h)
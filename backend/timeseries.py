@@ -0,0 +1,69 @@
+# backend/timeseries.py
+"""
+Downsampling helpers for chart series. Inputs are parallel NumPy arrays:
+`x` as day ordinals (ascending) and one float array per metric (NaN = missing).
+"""
+from typing import Literal
+import warnings
+
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: picks `threshold` indices that preserve the
+    visual shape of (x, y). First and last points are always kept.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    y = np.where(np.isnan(y), np.nanmean(y) if np.isfinite(y).any() else 0.0, y)
+    every = (n - 2) / (threshold - 2)
+    picked = [0]
+    a = 0
+    for i in range(threshold - 2):
+        # bucket i covers [start, end); the first and last points sit outside all buckets
+        start = int(np.floor(i * every)) + 1
+        end = int(np.floor((i + 1) * every)) + 1
+        # average of the next bucket (or the last point) is the third triangle vertex
+        nxt_start, nxt_end = end, min(int(np.floor((i + 2) * every)) + 1, n)
+        avg_x = x[nxt_start:nxt_end].mean()
+        avg_y = y[nxt_start:nxt_end].mean()
+
+        bx, by = x[start:end], y[start:end]
+        area = np.abs((x[a] - avg_x) * (by - y[a]) - (x[a] - bx) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        picked.append(a)
+    picked.append(n - 1)
+    return np.asarray(picked)
+
+
+EPOCH_ORDINAL = 719163  # date(1970, 1, 1).toordinal()
+
+
+def bucket_keys(x: np.ndarray, bucket: Literal["week", "month"]) -> np.ndarray:
+    """Bucket start (as day ordinal) for each point: Monday of its week or first of its month."""
+    if bucket == "week":
+        return x - (x - 1) % 7  # ordinal 1 (0001-01-01) is a Monday
+    months = (x - EPOCH_ORDINAL).astype("datetime64[D]").astype("datetime64[M]")
+    return months.astype("datetime64[D]").astype(np.int64) + EPOCH_ORDINAL
+
+
+def bucket_aggregate(
+    x: np.ndarray, columns: dict[str, np.ndarray], bucket: Literal["week", "month"]
+) -> tuple[np.ndarray, dict[str, np.ndarray], dict[str, np.ndarray], dict[str, np.ndarray]]:
+    """
+    Returns (bucket_starts, means, mins, maxes). `x` must be sorted, so each
+    bucket is a contiguous slice; NaNs are ignored within a bucket.
+    """
+    starts, first = np.unique(bucket_keys(x, bucket), return_index=True)
+    means, mins, maxes = {}, {}, {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)  # all-NaN bucket -> NaN
+        for name, values in columns.items():
+            groups = np.split(values, first[1:])
+            means[name] = np.array([np.nanmean(g) for g in groups])
+            mins[name] = np.array([np.nanmin(g) for g in groups])
+            maxes[name] = np.array([np.nanmax(g) for g in groups])
+    return starts, means, mins, maxes
@@ -0,0 +1,278 @@
+# backend/uploads.py
+"""
+Shared upload storage used by /api/upload and /files/photo.
+
+Uploads are streamed to disk in chunks (aiofiles, so the event loop never
+blocks on file I/O), capped at MAX_UPLOAD_BYTES, type-checked by their
+leading bytes, and hashed while streaming. The stored name is the SHA-256
+of the content, so re-uploading the same photo reuses the existing file.
+
+Once stored, resized variants (imaging.VARIANTS) are generated in the
+background. `variant_urls()` derives their URLs from the upload's name alone,
+so serializing athletes never touches the disk; a variant requested before
+it has been written is generated on the spot by `UploadFiles`.
+
+Because several athletes may point at one file, `release()` only deletes a
+file (and its variants) once no athlete's photo_url references it any more.
+An upload is referenced by a later request (the athlete form is saved after
+the photo is uploaded), so `save_upload()` also records a claim on the name.
+Files claimed within the last UPLOAD_CLAIM_SECONDS are kept even if nothing
+references them yet. Claims and the release check run under the same
+per-name lock, so a dedup upload and a concurrent delete of the last
+reference can't interleave. The claim is per process.
+
+Stored files are never rewritten under the same name, so `UploadFiles`
+serves them as immutable: a year-long Cache-Control, a strong ETag (the
+content hash for content-addressed names) and 304s for If-None-Match.
+Range requests are handled by Starlette's FileResponse.
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+from uuid import uuid4
+import asyncio
+import hashlib
+import os
+import re
+import threading
+import time
+
+import aiofiles
+import aiofiles.os
+from fastapi import HTTPException, UploadFile
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from . import models
+from .imaging import VARIANT_EXT, VARIANTS, make_variants, schedule_variants, variant_name
+
+UPLOAD_DIR = Path("uploads")
+UPLOAD_URL_PREFIX = "/uploads/"
+CHUNK_SIZE = 64 * 1024
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_MB", "10")) * 1024 * 1024
+UPLOAD_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# how long an uploaded file is kept for the request that will reference it
+CLAIM_SECONDS = float(os.getenv("UPLOAD_CLAIM_SECONDS", "900"))
+
+# <sha256>.ext or <sha256>_<variant>.ext
+_HASHED_NAME = re.compile(r"^([0-9a-f]{64}(?:_[a-z]+)?)\.[a-z0-9]+$")
+
+# detected content type -> stored extension
+ALLOWED_TYPES = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+}
+_SOURCE_EXTS = tuple(ALLOWED_TYPES.values())
+# <stem>_<variant><VARIANT_EXT>, as written by imaging.make_variants
+_VARIANT_FILE = re.compile(rf"^([^/_.][^/_]*)_({'|'.join(VARIANTS)}){re.escape(VARIANT_EXT)}$")
+
+
+# per-name locks, striped so the set stays bounded
+_locks = [threading.Lock() for _ in range(64)]
+# stored name -> time.monotonic() it was last handed out by save_upload
+_claims: dict[str, float] = {}
+
+
+def _lock_for(name: str) -> threading.Lock:
+    return _locks[hash(name) % len(_locks)]
+
+
+def _store(tmp: Path, dest: Path) -> bool:
+    """Moves a finished upload into place (or drops it as a duplicate) and claims it. True if deduplicated."""
+    with _lock_for(dest.name):
+        now = time.monotonic()
+        for name, at in list(_claims.items()):
+            if now - at > CLAIM_SECONDS:
+                _claims.pop(name, None)
+        _claims[dest.name] = now
+        if dest.exists():
+            tmp.unlink()
+            return True
+        os.replace(tmp, dest)
+        return False
+
+
+@dataclass
+class StoredFile:
+    url: str
+    name: str
+    sha256: str
+    size: int
+    content_type: str
+    deduplicated: bool
+
+
+def sniff_content_type(head: bytes) -> Optional[str]:
+    """Content type from magic bytes; the client-declared type isn't trusted."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+async def save_upload(file: UploadFile) -> StoredFile:
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = UPLOAD_DIR / f".tmp-{uuid4().hex}"
+    digest = hashlib.sha256()
+    size = 0
+    content_type = None
+    try:
+        async with aiofiles.open(tmp, "wb") as out:
+            while chunk := await file.read(CHUNK_SIZE):
+                if content_type is None:
+                    content_type = sniff_content_type(chunk[:16])
+                    if content_type not in ALLOWED_TYPES:
+                        raise HTTPException(
+                            status_code=415,
+                            detail=f"Unsupported file type; allowed: {', '.join(ALLOWED_TYPES)}",
+                        )
+                size += len(chunk)
+                if size > MAX_UPLOAD_BYTES:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File exceeds {MAX_UPLOAD_BYTES // (1024 * 1024)} MB limit",
+                    )
+                digest.update(chunk)
+                await out.write(chunk)
+        if size == 0:
+            raise HTTPException(status_code=400, detail="Empty upload")
+
+        sha = digest.hexdigest()
+        name = f"{sha}{ALLOWED_TYPES[content_type]}"
+        dest = UPLOAD_DIR / name
+        deduplicated = await asyncio.to_thread(_store, tmp, dest)
+        # no-op for variants that already exist
+        schedule_variants(dest)
+        return StoredFile(
+            url=f"{UPLOAD_URL_PREFIX}{name}",
+            name=name,
+            sha256=sha,
+            size=size,
+            content_type=content_type,
+            deduplicated=deduplicated,
+        )
+    finally:
+        if await aiofiles.os.path.exists(tmp):
+            await aiofiles.os.remove(tmp)
+
+
+def path_for_url(url: Optional[str]) -> Optional[Path]:
+    if not url or not url.startswith(UPLOAD_URL_PREFIX):
+        return None
+    name = url[len(UPLOAD_URL_PREFIX):]
+    if not name or "/" in name or name.startswith("."):
+        return None
+    return UPLOAD_DIR / name
+
+
+class UploadFiles(StaticFiles):
+    """StaticFiles for the uploads dir with long-lived caching and no dotfiles."""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        # .tmp-* are uploads still being written
+        if any(part.startswith(".") for part in Path(path).parts):
+            raise StarletteHTTPException(status_code=404)
+        try:
+            return await super().get_response(path, scope)
+        except StarletteHTTPException as e:
+            # variant URLs are handed out before the background resize has
+            # finished (or for photos uploaded before variants existed)
+            src = _variant_source(path) if e.status_code == 404 else None
+            if src is None:
+                raise
+            try:
+                await asyncio.wrap_future(schedule_variants(src))
+            except Exception:
+                raise e from None
+            return await super().get_response(path, scope)
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        headers = {"cache-control": UPLOAD_CACHE_CONTROL}
+        m = _HASHED_NAME.match(os.path.basename(full_path))
+        if m:
+            headers["etag"] = f'"{m.group(1)}"'
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result, headers=headers)
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+def variant_urls(url: Optional[str]) -> Dict[str, str]:
+    """Variant name -> URL for a local upload, from its file name alone (no disk access)."""
+    path = path_for_url(url)
+    if path is None or path.suffix.lower() not in _SOURCE_EXTS or "_" in path.stem:
+        return {}
+    return {v: f"{UPLOAD_URL_PREFIX}{variant_name(path.stem, v)}" for v in VARIANTS}
+
+
+def _variant_source(path: str) -> Optional[Path]:
+    """The stored upload a missing variant file would be made from, if any."""
+    m = _VARIANT_FILE.match(path)
+    if not m:
+        return None
+    for ext in _SOURCE_EXTS:
+        src = UPLOAD_DIR / f"{m.group(1)}{ext}"
+        if src.is_file():
+            return src
+    return None
+
+
+def release(db: Session, url: Optional[str]) -> None:
+    """
+    Call after an athlete stops referencing `url` (deleted or photo replaced)
+    and the change is flushed. Deletes the file once nothing references it.
+    """
+    path = path_for_url(url)
+    if path is None:
+        return
+    with _lock_for(path.name):
+        claimed = _claims.get(path.name)
+        if claimed is not None and time.monotonic() - claimed <= CLAIM_SECONDS:
+            return  # just uploaded (again); the referencing request is on its way
+        refs = db.execute(
+            select(func.count()).select_from(models.Athlete).where(models.Athlete.photo_url == url)
+        ).scalar_one()
+        if refs == 0:
+            for p in [path, *(path.with_name(variant_name(path.stem, v)) for v in VARIANTS)]:
+                try:
+                    p.unlink(missing_ok=True)
+                except OSError:
+                    pass  # non-fatal
+
+
+def backfill_variants() -> int:
+    """Generates missing variants for every stored upload. Returns files written."""
+    written = 0
+    for ext in set(ALLOWED_TYPES.values()):
+        for src in UPLOAD_DIR.glob(f"*{ext}"):
+            if "_" in src.stem or src.name.startswith("."):
+                continue  # a variant or a partial upload
+            try:
+                written += len(make_variants(src))
+            except Exception as e:
+                print(f"[IMAGING][ERROR] {src.name}: {e}")
+    return written
+
+
+if __name__ == "__main__":
+    # python -m backend.uploads  -> generate variants for photos uploaded before they existed
+    print(f"wrote {backfill_variants()} variant files")
@@ -0,0 +1,177 @@
+# backend/versions.py
+"""
+In-process data version counters, used to build ETags for read endpoints.
+
+Every committed ORM write bumps:
+  - the counter of the table it touched, and
+  - the counter of the athlete the row belongs to (Athlete.id, or the row's
+    athlete_id for child tables).
+A response built from "athlete 7's assessments" can then be tagged with
+(assessments epoch, athlete 7 version) and one built from whole tables with
+those tables' counters; if none of them moved, the payload can't have changed.
+
+ORM writes are picked up automatically from Session flush/commit events (sync
+and async sessions alike). Core-level bulk writes (insert()/update()) bypass
+those, so such code calls `versions.bump_table()` itself.
+
+Counters live in this process only and restart with it; ETags include a
+per-process id so a tag from before a restart never matches. With several
+worker processes a write is only seen by the worker that made it, the same
+caveat as the TTLCache snapshots.
+
+Scripts that write outside any server process (e.g. `python -m backend.risk`)
+call `record_external_bump()`, which stores a counter in the
+`table_versions` table. `VersionWatcher`, started with the app, polls that
+table every VERSION_POLL_SECONDS and bumps the matching in-process counters,
+so running servers stop serving cached responses within one poll interval.
+"""
+from itertools import chain
+from typing import Iterable, Optional
+from uuid import uuid4
+import os
+import threading
+import time
+
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+
+from . import models
+from .database import SessionLocal
+
+_PENDING_KEY = "_version_bumps"
+
+VERSION_POLL_SECONDS = float(os.getenv("VERSION_POLL_SECONDS", "5"))
+
+
+class Versions:
+    def __init__(self):
+        self.boot = uuid4().hex[:8]
+        self._lock = threading.Lock()
+        self._tables: dict[str, int] = {}
+        self._epochs: dict[str, int] = {}
+        self._athletes: dict[int, int] = {}
+
+    def bump(self, changes: Iterable[tuple[str, Optional[int]]]) -> None:
+        """changes: (table name, athlete id or None) pairs."""
+        with self._lock:
+            for table, athlete_id in changes:
+                self._tables[table] = self._tables.get(table, 0) + 1
+                if athlete_id is not None:
+                    self._athletes[athlete_id] = self._athletes.get(athlete_id, 0) + 1
+
+    def bump_table(self, table: str) -> None:
+        """Everything in `table` may have changed (bulk writes)."""
+        with self._lock:
+            self._tables[table] = self._tables.get(table, 0) + 1
+            self._epochs[table] = self._epochs.get(table, 0) + 1
+
+    def athlete_tag(self, athlete_id: int, *tables: str) -> str:
+        """ETag for a response built from one athlete's rows in `tables`."""
+        with self._lock:
+            epochs = "-".join(str(self._epochs.get(t, 0)) for t in tables)
+            version = self._athletes.get(athlete_id, 0)
+        return f'W/"{self.boot}-{"+".join(tables)}-{epochs}-a{athlete_id}-{version}"'
+
+    def tables_tag(self, *tables: str, ttl: Optional[float] = None) -> str:
+        """
+        ETag for a response built from whole tables. With `ttl`, the tag also
+        rolls over every `ttl` seconds, for responses that must pick up
+        writes these counters never see (other processes) within that time.
+        """
+        with self._lock:
+            parts = "-".join(str(self._tables.get(t, 0)) for t in tables)
+        if ttl is not None:
+            window = int(time.time() // ttl) if ttl > 0 else time.time_ns()
+            parts += f"-t{window}"
+        return f'W/"{self.boot}-{"+".join(tables)}-{parts}"'
+
+
+versions = Versions()
+
+
+def _athlete_id(obj) -> Optional[int]:
+    if isinstance(obj, models.Athlete):
+        return obj.id
+    return getattr(obj, "athlete_id", None)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect(session: Session, flush_context) -> None:
+    # new/dirty/deleted still hold the pre-flush state here
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table is not None:
+            pending.add((table, _athlete_id(obj)))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        versions.bump(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# -----------------------------
+# Writes from other processes
+# -----------------------------
+def record_external_bump(db: Session, *tables: str) -> None:
+    """Marks `tables` as changed for every running server; committed with the caller's transaction."""
+    V = models.TableVersion
+    for table in tables:
+        res = db.execute(update(V).where(V.table_name == table).values(version=V.version + 1))
+        if res.rowcount == 0:
+            db.add(V(table_name=table, version=1))
+    db.flush()
+
+
+class VersionWatcher:
+    """Background thread turning table_versions changes into bump_table() calls."""
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._seen: Optional[dict[str, int]] = None
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="version-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def poll(self) -> list[str]:
+        """Bumps tables whose stored version moved since the last poll; returns them."""
+        V = models.TableVersion
+        with SessionLocal() as db:
+            current = dict(db.execute(select(V.table_name, V.version)).all())
+        # the first poll only records where we start; our own counters are
+        # fresh (new boot id) anyway
+        changed = [] if self._seen is None else [
+            t for t, v in current.items() if self._seen.get(t) != v
+        ]
+        self._seen = current
+        for table in changed:
+            versions.bump_table(table)
+        return changed
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"[VERSIONS][ERROR] table_versions poll failed: {e}")
+            self._stop.wait(VERSION_POLL_SECONDS)
+
+
+version_watcher = VersionWatcher()
@@ -0,0 +1,43 @@
+import { useEffect, useRef } from "react";
+import { API_BASE } from "@/utils/api";
+
+/**
+ * Subscribe to the server's change feed (GET /api/events) and call
+ * `onChange(events)` shortly after writes land, batching bursts (e.g. an
+ * import) into one call. Pass `athleteId` to only hear about that athlete.
+ * EventSource reconnects on its own and resumes via Last-Event-ID.
+ */
+export function useLiveEvents(onChange, { athleteId, debounceMs = 300 } = {}) {
+  const handler = useRef(onChange);
+  handler.current = onChange;
+
+  useEffect(() => {
+    if (typeof EventSource === "undefined") return;
+    const qs = athleteId ? `?athlete_id=${encodeURIComponent(athleteId)}` : "";
+    const source = new EventSource(`${API_BASE}/events${qs}`, { withCredentials: true });
+    let pending = [];
+    let timer = null;
+
+    const onEvent = (e) => {
+      try {
+        pending.push(JSON.parse(e.data));
+      } catch {
+        return;
+      }
+      clearTimeout(timer);
+      timer = setTimeout(() => {
+        const batch = pending;
+        pending = [];
+        handler.current(batch);
+      }, debounceMs);
+    };
+
+    ["created", "updated", "deleted", "bulk", "resync"].forEach((t) =>
+      source.addEventListener(t, onEvent)
+    );
+    return () => {
+      clearTimeout(timer);
+      source.close();
+    };
+  }, [athleteId, debounceMs]);
+}
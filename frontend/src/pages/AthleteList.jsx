@@ -13,7 +13,9 @@ const toAbsUrl = (p) => {
 };
 
 function AvatarCell({ a }) {
-  const src = useMemo(() => toAbsUrl(a?.photo_url), [a?.photo_url]);
+  // small resized variant when available; the original is full-size
+  const thumb = a?.photo_variants?.thumb || a?.photo_url;
+  const src = useMemo(() => toAbsUrl(thumb), [thumb]);
   const initials =
     `${a?.first_name?.[0] || ""}${a?.last_name?.[0] || ""}`.toUpperCase() ||
     "A";
@@ -2,6 +2,7 @@
 import React, { useEffect, useMemo, useRef, useState } from "react";
 import { useParams, Link } from "react-router-dom";
 import { apiPatch, apiUpload } from "@/utils/api";
+import { useLiveEvents } from "@/hooks/useLiveEvents";
 
 import AssessmentOutcomeCard from "@/components/assessment/AssessmentOutcomeCard";
 import MovementOutcomeCard from "@/components/movement/MovementOutcomeCard";
@@ -66,6 +67,10 @@ export default function AthleteProfile() {
   const [injuries, setInjuries] = useState([]);
   const [notes, setNotes] = useState([]);
 
+  // bumped when the server reports a change to this athlete
+  const [revision, setRevision] = useState(0);
+  useLiveEvents(() => setRevision((r) => r + 1), { athleteId: id });
+
   // carousel indices
   const [assessIdx, setAssessIdx] = useState(0);
   const [moveIdx, setMoveIdx] = useState(0);
@@ -75,8 +80,8 @@ export default function AthleteProfile() {
   const onPickPhoto = () => fileRef.current?.click();
 
   const avatarSrc = useMemo(
-    () => toAbsUrl(athlete?.photo_url),
-    [athlete?.photo_url]
+    () => toAbsUrl(athlete?.photo_variants?.card || athlete?.photo_url),
+    [athlete?.photo_variants?.card, athlete?.photo_url]
   );
 
   const onPhotoChange = async (e) => {
@@ -100,48 +105,38 @@ export default function AthleteProfile() {
   useEffect(() => {
     if (!id) return;
 
-    fetch(`${API}/athletes/${id}`)
-      .then((r) => r.json())
-      .then(setAthlete)
-      .catch(() => setAthlete(null));
-
-    fetch(`${API}/assessments/athlete/${id}`)
-      .then((r) => r.json())
-      .then((rows) => {
-        const s = (rows || [])
-          .slice()
-          .sort((a, b) => (a.date > b.date ? -1 : 1));
-        setAssessments(s);
-      })
-      .catch(() => setAssessments([]));
-
-    fetch(`${API}/movement-assessments/athlete/${id}`)
-      .then((r) => r.json())
-      .then((rows) => {
-        const s = (rows || [])
-          .slice()
-          .sort((a, b) =>
-            (a.created_at || "").localeCompare(b.created_at || "")
-          );
-        setMovementHistory(s);
-      })
-      .catch(() => setMovementHistory([]));
-
-    fetch(`${API}/injuries/${id}`)
-      .then((r) => r.json())
-      .then((rows) => {
-        const s = (rows || [])
-          .slice()
-          .sort((a, b) => (a.date_reported > b.date_reported ? -1 : 1));
-        setInjuries(s);
+    // one round-trip for the athlete and every tab's data
+    fetch(`${API}/athletes/${id}/profile`)
+      .then((r) => (r.ok ? r.json() : Promise.reject(r)))
+      .then((p) => {
+        setAthlete(p.athlete);
+        setAssessments(
+          (p.assessments || [])
+            .slice()
+            .sort((a, b) => (a.date > b.date ? -1 : 1))
+        );
+        setMovementHistory(
+          (p.movements || [])
+            .slice()
+            .sort((a, b) =>
+              (a.created_at || "").localeCompare(b.created_at || "")
+            )
+        );
+        setInjuries(
+          (p.injuries || [])
+            .slice()
+            .sort((a, b) => (a.date_reported > b.date_reported ? -1 : 1))
+        );
+        setNotes(p.notes || []);
       })
-      .catch(() => setInjuries([]));
-
-    fetch(`${NOTES_ENDPOINT}/athletes/${id}/notes`)
-      .then((r) => (r.ok ? r.json() : []))
-      .then(setNotes)
-      .catch(() => setNotes([]));
-  }, [id]);
+      .catch(() => {
+        setAthlete(null);
+        setAssessments([]);
+        setMovementHistory([]);
+        setInjuries([]);
+        setNotes([]);
+      });
+  }, [id, revision]);
 
   // keep carousel index valid when lists change
   useEffect(() => setAssessIdx(0), [assessments.length]);
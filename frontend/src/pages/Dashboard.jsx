@@ -2,6 +2,7 @@
 import React, { useEffect, useMemo, useState } from "react";
 import { Link, useNavigate } from "react-router-dom";
 import { apiGet } from "@/utils/api";
+import { useLiveEvents } from "@/hooks/useLiveEvents";
 
 function StatCard({ label, value }) {
   return (
@@ -36,14 +37,18 @@ export default function Dashboard() {
   const [allAthletes, setAllAthletes] = useState([]);
   const [search, setSearch] = useState("");
 
-  useEffect(() => {
+  const load = () => {
     apiGet("/dashboard/overview")
       .then(setStats)
       .catch(() => setStats(null));
     apiGet("/athletes/")
       .then(setAllAthletes)
       .catch(() => setAllAthletes([]));
-  }, []);
+  };
+
+  useEffect(load, []);
+  // refresh when another coach changes the roster
+  useLiveEvents(load);
 
   const athletesFiltered = useMemo(() => {
     const q = search.trim().toLowerCase();
@@ -68,7 +73,7 @@ export default function Dashboard() {
 
   const avatarById = useMemo(() => {
     const m = new Map();
-    allAthletes.forEach((a) => m.set(a.id, toAbsUrl(a.photo_url)));
+    allAthletes.forEach((a) => m.set(a.id, toAbsUrl(a.photo_variants?.thumb || a.photo_url)));
     return m;
   }, [allAthletes]);
 
@@ -122,7 +127,7 @@ export default function Dashboard() {
             </thead>
             <tbody>
               {athletesFiltered.map((a) => {
-                const avatar = toAbsUrl(a.photo_url);
+                const avatar = toAbsUrl(a.photo_variants?.thumb || a.photo_url);
                 return (
                   <tr key={a.id} className="border-t">
                     <td className="px-4 py-2">
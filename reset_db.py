@@ -1,9 +1,16 @@
 from backend.database import engine, Base
 from backend import models
+from backend.migrations import migrate, schema_migrations
+from backend.search import drop_search_index
 
 def reset():
     Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        # objects outside Base.metadata; forgetting applied steps makes
+        # migrate() recreate them (search triggers, FTS table, ...)
+        drop_search_index(conn)
+        schema_migrations.drop(conn, checkfirst=True)
+    migrate(engine)
     print("Database reset at:", engine.url)
 
 if __name__ == "__main__":
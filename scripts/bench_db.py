@@ -0,0 +1,111 @@
+# scripts/bench_db.py
+"""
+Concurrent read/write throughput against a scratch SQLite file, with the
+default connection settings vs. the SQLITE_TUNING profile from
+backend/database.py.
+
+    python scripts/bench_db.py --seconds 5 --writers 4 --readers 8
+"""
+import sys
+from pathlib import Path
+
+# Ensure project root is on the path
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import argparse
+import random
+import tempfile
+import threading
+import time
+from datetime import date
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import Base, POOL_OPTIONS, apply_sqlite_pragmas
+from backend import models
+
+
+def run(tuned: bool, seconds: float, writers: int, readers: int, athletes: int) -> dict:
+    tmp = tempfile.mkdtemp()
+    engine = create_engine(
+        f"sqlite:///{tmp}/bench.db",
+        connect_args={"check_same_thread": False},
+        **POOL_OPTIONS,
+    )
+    if tuned:
+        event.listen(engine, "connect", lambda c, _r: apply_sqlite_pragmas(c))
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+
+    with Session() as db:
+        db.add_all(models.Athlete(first_name=f"A{i}", last_name="Bench") for i in range(athletes))
+        db.commit()
+
+    stop = time.monotonic() + seconds
+    counts = {"reads": 0, "writes": 0, "locked": 0}
+    lock = threading.Lock()
+
+    def bump(key):
+        with lock:
+            counts[key] += 1
+
+    def writer():
+        while time.monotonic() < stop:
+            try:
+                with Session() as db:
+                    db.add(models.Assessment(
+                        athlete_id=random.randint(1, athletes), date=date.today(),
+                        cmf_left=800, cmf_right=790, cmp_left=600, cmp_right=590,
+                    ))
+                    db.commit()
+                bump("writes")
+            except OperationalError:
+                bump("locked")
+
+    def reader():
+        while time.monotonic() < stop:
+            try:
+                with Session() as db:
+                    aid = random.randint(1, athletes)
+                    (
+                        db.query(models.Assessment)
+                        .filter(models.Assessment.athlete_id == aid)
+                        .order_by(models.Assessment.date.desc(), models.Assessment.created_at.desc())
+                        .all()
+                    )
+                bump("reads")
+            except OperationalError:
+                bump("locked")
+
+    threads = [threading.Thread(target=writer) for _ in range(writers)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    engine.dispose()
+    return counts
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--seconds", type=float, default=5)
+    p.add_argument("--writers", type=int, default=4)
+    p.add_argument("--readers", type=int, default=8)
+    p.add_argument("--athletes", type=int, default=200)
+    args = p.parse_args()
+
+    for label, tuned in (("default", False), ("tuned", True)):
+        c = run(tuned, args.seconds, args.writers, args.readers, args.athletes)
+        print(
+            f"{label:8s} writes/s={c['writes'] / args.seconds:8.1f} "
+            f"reads/s={c['reads'] / args.seconds:8.1f} locked_errors={c['locked']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# scripts/bench_json.py
+"""
+Serialization time and bytes-on-wire for a List[AthleteOut] response with
+realistic long Text fields (medical history, goals, coach IQ notes).
+
+    python scripts/bench_json.py --athletes 500 --repeat 20
+"""
+import sys
+from pathlib import Path
+
+# Ensure project root is on the path
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import argparse
+import datetime as dt
+import gzip
+import json
+import random
+import time
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from backend import schemas
+from backend.responses import ORJSONResponse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+WORDS = (
+    "left hamstring strain rehab progressing well return to play week two "
+    "prefers visual feedback responds to direct coaching focus on landing "
+    "mechanics previous ACL reconstruction right knee goals sprint speed"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def make_athletes(n: int) -> list[schemas.AthleteOut]:
+    rng = random.Random(42)
+    long_fields = [
+        name
+        for name, field in schemas.AthleteOut.model_fields.items()
+        if field.annotation == schemas.Optional[str] and name not in ("photo_url", "email")
+    ]
+    out = []
+    for i in range(n):
+        data = {name: _text(rng, rng.randint(5, 80)) for name in long_fields}
+        data.update(
+            id=i + 1,
+            first_name=f"First{i}",
+            last_name=f"Last{i}",
+            date_of_birth=dt.date(2005, 1, 1) + dt.timedelta(days=i),
+            created_at=dt.datetime(2024, 1, 1, 12, 0) + dt.timedelta(hours=i),
+        )
+        out.append(schemas.AthleteOut(**data))
+    return out
+
+
+def timed(fn, repeat: int) -> tuple[float, bytes]:
+    best = float("inf")
+    body = b""
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        body = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000, body
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--athletes", type=int, default=500)
+    p.add_argument("--repeat", type=int, default=20)
+    args = p.parse_args()
+
+    athletes = make_athletes(args.athletes)
+    adapter = TypeAdapter(List[schemas.AthleteOut])
+
+    # FastAPI turns the response_model output into plain Python first
+    # (jsonable_encoder on older releases), then the response class renders it.
+    encoded = jsonable_encoder(athletes)
+    encoders = {
+        "render: stdlib json": lambda: json.dumps(
+            encoded, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8"),
+        "render: orjson": lambda: ORJSONResponse(None).render(encoded),
+        # model -> bytes in one pass, as http_cache.cached_json() does
+        "pydantic dump_json": lambda: adapter.dump_json(athletes),
+    }
+    print(f"{len(athletes)} athletes, best of {args.repeat}")
+    ms, _ = timed(lambda: jsonable_encoder(athletes), args.repeat)
+    print(f"  {'jsonable_encoder':20s} {ms:8.2f} ms")
+    body = b""
+    for label, fn in encoders.items():
+        ms, body = timed(fn, args.repeat)
+        print(f"  {label:20s} {ms:8.2f} ms  {len(body):>10,d} bytes")
+
+    print("bytes on wire")
+    print(f"  {'identity':20s} {len(body):>10,d}")
+    for label, compress in (
+        ("gzip -6", lambda b: gzip.compress(b, compresslevel=6)),
+        ("gzip -9", lambda b: gzip.compress(b, compresslevel=9)),
+        ("brotli q4", (lambda b: brotli.compress(b, quality=4)) if brotli else None),
+    ):
+        if compress is None:
+            print(f"  {label:20s} (brotli not installed)")
+            continue
+        ms, packed = timed(lambda: compress(body), max(1, args.repeat // 4))
+        print(f"  {label:20s} {len(packed):>10,d}  ({len(packed) / len(body):.1%}, {ms:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
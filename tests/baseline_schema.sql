@@ -0,0 +1,122 @@
+-- Schema of app.db as created by the original create_all-only code,
+-- before any migration existed. Used to check that migrate() upgrades it.
+CREATE TABLE athletes (
+	id INTEGER NOT NULL, 
+	first_name VARCHAR NOT NULL, 
+	last_name VARCHAR NOT NULL, 
+	date_of_birth DATE, 
+	gender VARCHAR, 
+	sport VARCHAR, 
+	position VARCHAR, 
+	photo_url VARCHAR, 
+	email VARCHAR, 
+	city VARCHAR, 
+	level VARCHAR, 
+	club_team VARCHAR, 
+	mom_name VARCHAR, 
+	dad_name VARCHAR, 
+	medical_conditions TEXT, 
+	allergies TEXT, 
+	medications TEXT, 
+	achievements TEXT, 
+	practice_frequency VARCHAR, 
+	workout_frequency VARCHAR, 
+	skill_frequency VARCHAR, 
+	development_level VARCHAR, 
+	nutrition_habits TEXT, 
+	hydration_habits TEXT, 
+	supplements TEXT, 
+	sleep_habits TEXT, 
+	goal_long_term TEXT, 
+	goal_sport_specific TEXT, 
+	goal_athlete_specific TEXT, 
+	coach_athlete_mentality TEXT, 
+	coach_athlete_personality TEXT, 
+	coach_prehab_needs TEXT, 
+	coach_testing_request TEXT, 
+	coach_supplement_requests TEXT, 
+	coach_notes TEXT, 
+	iq_training_style TEXT, 
+	iq_motivation_work_ethic TEXT, 
+	iq_learning_preference TEXT, 
+	iq_communication_preference TEXT, 
+	additional_comments TEXT, 
+	created_at DATETIME, 
+	PRIMARY KEY (id)
+);
+CREATE INDEX ix_athletes_id ON athletes (id);
+CREATE TABLE users (
+	id INTEGER NOT NULL, 
+	email VARCHAR NOT NULL, 
+	full_name VARCHAR, 
+	password_hash VARCHAR NOT NULL, 
+	role VARCHAR, 
+	is_active BOOLEAN, 
+	reset_token VARCHAR, 
+	reset_expires DATETIME, 
+	created_at DATETIME, 
+	PRIMARY KEY (id)
+);
+CREATE INDEX ix_users_id ON users (id);
+CREATE UNIQUE INDEX ix_users_email ON users (email);
+CREATE TABLE assessments (
+	id INTEGER NOT NULL, 
+	athlete_id INTEGER NOT NULL, 
+	date DATE, 
+	age INTEGER, 
+	weight FLOAT, 
+	cmf_left FLOAT, 
+	cmf_right FLOAT, 
+	cmp_left FLOAT, 
+	cmp_right FLOAT, 
+	ratio_left FLOAT, 
+	ratio_right FLOAT, 
+	custom_target FLOAT, 
+	goal VARCHAR, 
+	recommendation_summary TEXT, 
+	coach_comment TEXT, 
+	created_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(athlete_id) REFERENCES athletes (id) ON DELETE CASCADE
+);
+CREATE INDEX ix_assessments_id ON assessments (id);
+CREATE TABLE movement_assessments (
+	id INTEGER NOT NULL, 
+	athlete_id INTEGER NOT NULL, 
+	selections_json TEXT, 
+	analysis_json TEXT, 
+	athlete_comment TEXT, 
+	coach_comment TEXT, 
+	created_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(athlete_id) REFERENCES athletes (id) ON DELETE CASCADE
+);
+CREATE INDEX ix_movement_assessments_id ON movement_assessments (id);
+CREATE TABLE injuries (
+	id INTEGER NOT NULL, 
+	athlete_id INTEGER NOT NULL, 
+	date_reported DATE, 
+	area VARCHAR, 
+	severity VARCHAR, 
+	status VARCHAR, 
+	recovery_plan TEXT, 
+	notes TEXT, 
+	diagnosis TEXT, 
+	mechanism TEXT, 
+	created_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(athlete_id) REFERENCES athletes (id) ON DELETE CASCADE
+);
+CREATE INDEX ix_injuries_id ON injuries (id);
+CREATE TABLE notes (
+	id INTEGER NOT NULL, 
+	athlete_id INTEGER NOT NULL, 
+	text TEXT NOT NULL, 
+	tags TEXT, 
+	pinned BOOLEAN NOT NULL, 
+	author VARCHAR, 
+	created_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(athlete_id) REFERENCES athletes (id) ON DELETE CASCADE
+);
+CREATE INDEX ix_notes_id ON notes (id);
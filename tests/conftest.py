@@ -0,0 +1,32 @@
+# tests/conftest.py
+from pathlib import Path
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+BASELINE_SCHEMA = Path(__file__).with_name("baseline_schema.sql")
+
+
+@pytest.fixture
+def baseline_engine(tmp_path):
+    """An app.db as the pre-migration code left it: original tables, no extra indexes."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    raw = engine.raw_connection()
+    try:
+        raw.executescript(BASELINE_SCHEMA.read_text())
+        raw.commit()
+    finally:
+        raw.close()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def fresh_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    yield engine
+    engine.dispose()
@@ -0,0 +1,46 @@
+# tests/test_backfills.py
+"""
+Backfill scripts write outside any server process, so each must record a
+table_versions bump; that is what makes running servers drop cached
+responses (VersionWatcher).
+"""
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend import metrics, models, movement_metrics
+from backend.migrations import migrate
+
+
+def _version(db: Session, table: str):
+    V = models.TableVersion
+    return db.scalar(select(V.version).where(V.table_name == table))
+
+
+def test_metrics_backfill_bumps_assessments(fresh_engine):
+    migrate(fresh_engine)
+    with Session(fresh_engine) as db:
+        athlete = models.Athlete(first_name="A", last_name="B")
+        db.add(athlete)
+        db.flush()
+        db.add(models.Assessment(athlete_id=athlete.id, weight=80, cmf_left=400, cmf_right=600))
+        db.commit()
+        before = _version(db, "assessments") or 0
+
+        assert metrics.backfill(db) == 1
+        assert _version(db, "assessments") == before + 1
+        assert db.scalar(select(models.Assessment.asymmetry)) == 33.3
+
+
+def test_movement_metrics_backfill_bumps_movements(fresh_engine):
+    migrate(fresh_engine)
+    with Session(fresh_engine) as db:
+        athlete = models.Athlete(first_name="A", last_name="B")
+        db.add(athlete)
+        db.flush()
+        db.add(models.MovementAssessment(athlete_id=athlete.id, selections_json='{"Squat Test": ["Knee Valgus"]}'))
+        db.commit()
+        before = _version(db, "movement_assessments") or 0
+
+        assert movement_metrics.backfill(db) == 1
+        assert _version(db, "movement_assessments") == before + 1
+        assert db.scalar(select(models.MovementAssessment.red_flag_count)) == 1
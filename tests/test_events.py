@@ -0,0 +1,46 @@
+# tests/test_events.py
+import asyncio
+
+import pytest
+from starlette.requests import ClientDisconnect, Request
+
+from backend.events import bus
+from backend.routers.events import stream
+
+
+def _request() -> Request:
+    async def receive():
+        return {"type": "http.disconnect"}
+    return Request({"type": "http", "method": "GET", "path": "/api/events", "headers": []}, receive)
+
+
+def test_subscription_released_when_client_is_gone_before_first_send():
+    async def run():
+        request = _request()
+        response = await stream(request, athlete_id=None, table=None)
+        assert bus.subscribers == 1
+
+        async def send(message):
+            raise OSError("client disconnected")
+
+        with pytest.raises((OSError, ClientDisconnect)):
+            await response({"type": "http", "asgi": {"spec_version": "2.4"}}, request.receive, send)
+        assert bus.subscribers == 0
+
+    asyncio.run(run())
+
+
+def test_subscription_released_after_stream_ends():
+    async def run():
+        request = _request()
+        response = await stream(request, athlete_id=None, table=None)
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await response({"type": "http", "asgi": {"spec_version": "2.4"}}, request.receive, send)
+        assert sent[0]["status"] == 200
+        assert bus.subscribers == 0
+
+    asyncio.run(run())
@@ -0,0 +1,49 @@
+# tests/test_findings.py
+import asyncio
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from backend import models
+from backend.findings import apply_findings
+from backend.migrations import migrate
+from backend.routers.movements import findings
+
+
+def _findings(db_path, **params) -> dict[str, list[int]]:
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        try:
+            async with AsyncSession(engine) as db:
+                defaults = dict(kind=None, label=None, test=None, by_test=False, latest_only=True,
+                                include_athletes=True, limit=100)
+                out = await findings(db=db, **{**defaults, **params})
+        finally:
+            await engine.dispose()
+        return {item.label: item.athlete_ids for item in out.items}
+    return asyncio.run(run())
+
+
+def test_findings_skip_deleted_athletes(fresh_engine, tmp_path):
+    migrate(fresh_engine)
+    with Session(fresh_engine) as db:
+        ann, bob = models.Athlete(first_name="Ann", last_name="X"), models.Athlete(first_name="Bob", last_name="X")
+        db.add_all([ann, bob])
+        db.flush()
+        for athlete in (ann, bob):
+            obj = models.MovementAssessment(athlete_id=athlete.id, selections_json='{"Squat Test": ["Knee Valgus"]}')
+            apply_findings(obj)
+            db.add(obj)
+        db.commit()
+        ann_id, bob_id = ann.id, bob.id
+
+        for latest_only in (True, False):
+            assert _findings(tmp_path / "fresh.db", latest_only=latest_only) == {"Knee Valgus": [ann_id, bob_id]}
+
+        # SQLite foreign keys are off by default, so nothing cascades
+        db.execute(delete(models.Athlete).where(models.Athlete.id == bob_id))
+        db.commit()
+
+    for latest_only in (True, False):
+        assert _findings(tmp_path / "fresh.db", latest_only=latest_only) == {"Knee Valgus": [ann_id]}
@@ -0,0 +1,109 @@
+# tests/test_group_commit.py
+"""
+A failing write in a group-commit batch must fail only its own caller: the
+others are re-run one transaction each and still commit, each with its own
+result.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend import group_commit, models
+from backend.group_commit import GroupCommitter
+from backend.migrations import migrate
+
+
+@pytest.fixture
+def factory(fresh_engine):
+    migrate(fresh_engine)
+    factory = sessionmaker(bind=fresh_engine)
+    factory.commits = []
+    event.listen(factory, "after_commit", lambda session: factory.commits.append(session))
+    with factory() as db:
+        db.add(models.Athlete(id=1, first_name="Ann", last_name="Lee"))
+        db.commit()
+    factory.commits.clear()
+    return factory
+
+
+def add_note(text, flush=True):
+    def write(db: Session) -> tuple[int, str]:
+        note = models.Note(athlete_id=1, text=text)
+        db.add(note)
+        if flush:
+            db.flush()
+            return note.id, text
+        return None, text
+    return write
+
+
+def _texts(factory) -> list[str]:
+    with factory() as db:
+        return list(db.scalars(select(models.Note.text).order_by(models.Note.id)))
+
+
+def _run(writer: GroupCommitter, fns) -> list[Future]:
+    batch = [(fn, Future()) for fn in fns]
+    writer._commit(batch)
+    return [fut for _fn, fut in batch]
+
+
+def test_batch_commits_once(factory):
+    futures = _run(GroupCommitter("test", factory), [add_note("a"), add_note("b"), add_note("c")])
+    assert [f.result()[1] for f in futures] == ["a", "b", "c"]
+    assert len(factory.commits) == 1
+    assert _texts(factory) == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("flush", [True, False], ids=["fails-in-write", "fails-at-commit"])
+def test_failing_write_only_fails_its_caller(factory, flush):
+    futures = _run(GroupCommitter("test", factory), [add_note("a"), add_note(None, flush=flush), add_note("c")])
+
+    assert futures[0].result()[1] == "a"
+    with pytest.raises(IntegrityError):
+        futures[1].result()
+    assert futures[2].result()[1] == "c"
+    # the results belong to the rows that were actually committed
+    with factory() as db:
+        for fut in (futures[0], futures[2]):
+            note_id, text = fut.result()
+            assert db.get(models.Note, note_id).text == text
+    assert _texts(factory) == ["a", "c"]
+
+
+def test_other_errors_reach_their_caller(factory):
+    def missing(db: Session):
+        raise LookupError("Note not found")
+
+    futures = _run(GroupCommitter("test", factory), [missing, add_note("b")])
+    with pytest.raises(LookupError):
+        futures[0].result()
+    assert futures[1].result()[1] == "b"
+    assert _texts(factory) == ["b"]
+
+
+def test_submit_from_many_threads(factory, monkeypatch):
+    # a wide window so the submissions below share batches
+    monkeypatch.setattr(group_commit, "COMMIT_WINDOW_MS", 200)
+    writer = GroupCommitter("test", factory)
+    texts = [f"note {i}" if i != 7 else None for i in range(20)]
+    start = threading.Barrier(len(texts))
+
+    def submit(text):
+        start.wait()
+        return writer.submit(add_note(text))
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(texts)) as pool:
+            futures = [pool.submit(submit, text) for text in texts]
+            outcomes = [f.exception() or f.result()[1] for f in futures]
+    finally:
+        writer.stop()
+
+    assert isinstance(outcomes[7], IntegrityError)
+    assert [o for i, o in enumerate(outcomes) if i != 7] == [t for t in texts if t is not None]
+    assert sorted(_texts(factory)) == sorted(t for t in texts if t is not None)
@@ -0,0 +1,32 @@
+# tests/test_imaging.py
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from backend import imaging
+
+
+def _photo(tmp_path):
+    src = tmp_path / ("ab" * 32 + ".jpg")
+    Image.new("RGB", (2000, 1500), "red").save(src)
+    return src
+
+
+def test_one_job_per_source(tmp_path):
+    src = _photo(tmp_path)
+    futures = [imaging.schedule_variants(src) for _ in range(5)]
+    assert all(f is futures[0] for f in futures)
+    assert len(futures[0].result()) == len(imaging.VARIANTS)
+    # finished jobs are forgotten; the next call starts (and skips) afresh
+    assert imaging.schedule_variants(src).result() == []
+
+
+def test_concurrent_writers_never_share_a_temp_file(tmp_path):
+    src = _photo(tmp_path)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for fut in [pool.submit(imaging.make_variants, src) for _ in range(8)]:
+            fut.result()  # no FileNotFoundError from a stolen temp file
+    for variant, size in imaging.VARIANTS.items():
+        with Image.open(src.with_name(imaging.variant_name(src.stem, variant))) as im:
+            assert max(im.size) == size
+    assert not list(tmp_path.glob(".tmp-*"))
@@ -0,0 +1,71 @@
+# tests/test_migrations.py
+from sqlalchemy import inspect, text
+
+from backend.database import Base
+from backend.migrations import MIGRATIONS, migrate
+
+
+def _schema(engine) -> dict[str, tuple[set, set]]:
+    insp = inspect(engine)
+    return {
+        table: (
+            {c["name"] for c in insp.get_columns(table)},
+            {ix["name"] for ix in insp.get_indexes(table)},
+        )
+        for table in Base.metadata.tables
+    }
+
+
+def test_upgrades_baseline_database(baseline_engine):
+    with baseline_engine.begin() as conn:
+        conn.execute(text("INSERT INTO athletes (id, first_name, last_name) VALUES (1, 'Ann', 'Lee')"))
+        conn.execute(text(
+            "INSERT INTO movement_assessments (athlete_id, selections_json) "
+            "VALUES (1, '{\"Squat Test\": [\"Knee Valgus\"]}')"
+        ))
+
+    applied = migrate(baseline_engine)
+
+    assert applied == [version for version, _name, _step in MIGRATIONS]
+    schema = _schema(baseline_engine)
+    for table in Base.metadata.tables.values():
+        columns, indexes = schema[table.name]
+        assert {c.name for c in table.columns} <= columns, table.name
+        assert {ix.name for ix in table.indexes} <= indexes, table.name
+    # existing rows survive and are picked up by the data steps
+    with baseline_engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM athlete_risk")).scalar() == 1
+        assert conn.execute(text("SELECT red_flag_count, total_fails FROM movement_assessments")).one() == (1, 1)
+        assert conn.execute(text("SELECT kind, test, label FROM movement_findings")).all() == [
+            ("issue", "Squat Test", "Knee Valgus")
+        ]
+
+
+def test_upgrade_scores_risk_from_existing_rows(baseline_engine):
+    with baseline_engine.begin() as conn:
+        conn.execute(text("INSERT INTO athletes (id, first_name, last_name) VALUES (1, 'Ann', 'Lee')"))
+        # 60% CMF asymmetry, three red flags
+        conn.execute(text(
+            "INSERT INTO assessments (athlete_id, weight, cmf_left, cmf_right) VALUES (1, 80, 400, 1000)"
+        ))
+        conn.execute(text(
+            "INSERT INTO movement_assessments (athlete_id, selections_json) VALUES (1, "
+            "'{\"Squat Test\": [\"Knee Valgus\", \"Contralateral Hip Drop\", \"Excessive Lumbar Lordosis\"]}')"
+        ))
+
+    migrate(baseline_engine)
+
+    with baseline_engine.connect() as conn:
+        row = conn.execute(text("SELECT risk_score, risk_band, asymmetry, red_flag_count FROM athlete_risk")).one()
+    assert row == (50.0, "High", 60.0, 3)
+
+
+def test_upgraded_schema_matches_fresh_one(baseline_engine, fresh_engine):
+    migrate(baseline_engine)
+    migrate(fresh_engine)
+    assert _schema(baseline_engine) == _schema(fresh_engine)
+
+
+def test_migrate_is_idempotent(baseline_engine):
+    migrate(baseline_engine)
+    assert migrate(baseline_engine) == []
@@ -0,0 +1,49 @@
+# tests/test_query_plans.py
+"""
+The hot per-athlete queries must be index searches, never full-table scans,
+both on a fresh database and on a baseline app.db upgraded by migrate().
+"""
+import pytest
+
+from backend.migrations import migrate
+from backend.routers import assessments, athletes, auth, comments, dashboard, injuries, movements
+
+# name -> (query built by the endpoint's own helper, index it should use)
+HOT_QUERIES = {
+    "assessments.list_by_athlete": (assessments._list_query(1), "ix_assessments_athlete_date"),
+    "movements.list_by_athlete": (movements._list_query(1), "ix_movement_assessments_athlete_created"),
+    "injuries.list_by_athlete": (injuries._list_query(1), "ix_injuries_athlete_date"),
+    "comments.list_notes_alias": (comments._notes_query(1), "ix_notes_athlete_pinned_created"),
+    "dashboard injured athletes": (dashboard._injured_athletes_query(), "ix_injuries_status_athlete"),
+    "auth reset_token lookup": (auth._reset_token_query("token"), "ix_users_reset_token"),
+    **{
+        f"athletes.athlete_profile {name}": (athletes._profile_query(name, 1), index)
+        for name, index in {
+            "assessments": "ix_assessments_athlete_date",
+            "movements": "ix_movement_assessments_athlete_created",
+            "injuries": "ix_injuries_athlete_date",
+            "notes": "ix_notes_athlete_pinned_created",
+        }.items()
+    },
+}
+
+
+def _plan(engine, stmt) -> list[str]:
+    sql = stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        return [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+
+
+@pytest.fixture(params=["fresh", "upgraded"])
+def engine(request, fresh_engine, baseline_engine):
+    engine = fresh_engine if request.param == "fresh" else baseline_engine
+    migrate(engine)
+    return engine
+
+
+@pytest.mark.parametrize("name", list(HOT_QUERIES))
+def test_hot_query_uses_index(engine, name):
+    stmt, index = HOT_QUERIES[name]
+    plan = _plan(engine, stmt)
+    assert any(line.startswith("SEARCH") and f"INDEX {index} " in line for line in plan), plan
+    assert not any(line.startswith("SCAN") for line in plan), plan
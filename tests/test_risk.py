@@ -0,0 +1,128 @@
+# tests/test_risk.py
+"""
+athlete_risk is kept by on-write deltas (apply_*); a full rebuild from the
+source tables must land on exactly the same rows.
+"""
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from backend import metrics, models, movement_metrics, risk
+from backend.migrations import migrate
+
+R = models.AthleteRisk
+COLUMNS = [c for c in R.__table__.columns if c.name != "updated_at"]
+
+SQUAT_FLAGS = '{"Squat Test": ["Knee Valgus", "Contralateral Hip Drop"]}'
+
+
+def _table(db: Session) -> list[tuple]:
+    db.expire_all()
+    return [tuple(r) for r in db.execute(select(*COLUMNS).order_by(R.athlete_id))]
+
+
+def _injury_values(obj: models.Injury) -> dict:
+    return {"athlete_id": obj.athlete_id, "severity": obj.severity, "status": obj.status}
+
+
+def _assessment(db: Session, athlete_id: int, day: date, left: float, right: float) -> models.Assessment:
+    obj = models.Assessment(athlete_id=athlete_id, date=day, weight=80, cmf_left=left, cmf_right=right)
+    metrics.apply_metrics(obj)
+    db.add(obj)
+    db.flush()
+    risk.apply_assessments(db, [obj])
+    return obj
+
+
+def _movement(db: Session, athlete_id: int, at: datetime, selections: str) -> models.MovementAssessment:
+    obj = models.MovementAssessment(athlete_id=athlete_id, created_at=at, selections_json=selections)
+    movement_metrics.apply_movement_metrics(obj)
+    db.add(obj)
+    db.flush()
+    risk.apply_movements(db, [obj])
+    return obj
+
+
+@pytest.fixture
+def db(fresh_engine):
+    migrate(fresh_engine)
+    with Session(fresh_engine) as session:
+        yield session
+
+
+def test_deltas_match_full_rebuild(db):
+    ann, bob, cat = (models.Athlete(first_name=n, last_name="X") for n in ("Ann", "Bob", "Cat"))
+    db.add_all([ann, bob, cat])
+    db.flush()
+
+    # injuries: create, change status (old, new), resolve, delete
+    knee = models.Injury(athlete_id=ann.id, severity="Severe", status="Active")
+    ankle = models.Injury(athlete_id=ann.id, severity="Moderate", status="Active")
+    wrist = models.Injury(athlete_id=bob.id, severity="Minor", status="Active")
+    db.add_all([knee, ankle, wrist])
+    db.flush()
+    risk.apply_injuries(db, [(None, knee), (None, ankle), (None, wrist)])
+    db.commit()
+
+    old = _injury_values(ankle)
+    ankle.status = "Recovering"
+    risk.apply_injuries(db, [(old, ankle)])
+    old = _injury_values(wrist)
+    wrist.status = "Resolved"
+    risk.apply_injuries(db, [(old, wrist)])
+    old = _injury_values(knee)
+    db.delete(knee)
+    risk.apply_injuries(db, [(old, None)])
+    # bulk path: dicts, as imports pass them
+    rows = [{"athlete_id": cat.id, "severity": "7", "status": "rtp"}]
+    db.execute(insert(models.Injury), rows)
+    risk.apply_injuries(db, [(None, r) for r in rows])
+    db.commit()
+
+    # assessments: latest by date wins, undated never beats dated; moving
+    # the current latest back in time falls back to the next one
+    _assessment(db, ann.id, date(2024, 1, 10), 400, 1000)
+    latest = _assessment(db, ann.id, date(2024, 3, 1), 900, 1000)
+    _assessment(db, ann.id, None, 100, 1000)
+    _assessment(db, bob.id, date(2024, 2, 1), 500, 600)
+    db.commit()
+    latest.date = date(2023, 12, 1)
+    db.flush()
+    risk.apply_assessments(db, [latest])
+    db.commit()
+
+    # movement screens: latest by created_at wins, even if recorded later
+    _movement(db, ann.id, datetime(2024, 2, 1), SQUAT_FLAGS)
+    _movement(db, ann.id, datetime(2024, 1, 1), '{"Squat Test": []}')
+    _movement(db, cat.id, datetime(2024, 1, 1), SQUAT_FLAGS)
+    db.commit()
+
+    incremental = _table(db)
+    assert [r[0] for r in incremental] == [ann.id, bob.id, cat.id]
+    row = db.get(R, ann.id)
+    assert (row.injury_risk, row.active_injuries) == (3.6, 1)
+    assert (row.assessment_date, row.asymmetry, row.red_flag_count) == (date(2024, 1, 10), 60.0, 2)
+
+    # a rebuild from scratch gives the same rows
+    db.execute(delete(R))
+    db.commit()
+    risk.rebuild(db, chunk_size=2)
+    assert _table(db) == incremental
+
+
+def test_rebuild_drops_rows_of_deleted_athletes(db):
+    ann = models.Athlete(first_name="Ann", last_name="X")
+    db.add(ann)
+    db.flush()
+    db.add(models.Injury(athlete_id=ann.id, severity="Severe", status="Active"))
+    db.commit()
+    risk.rebuild(db)
+    assert db.scalar(select(R.risk_band)) == "Moderate"
+
+    # with SQLite foreign keys off nothing cascades
+    db.execute(delete(models.Athlete))
+    db.commit()
+    risk.rebuild(db)
+    assert _table(db) == []
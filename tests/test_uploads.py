@@ -0,0 +1,59 @@
+# tests/test_uploads.py
+import asyncio
+import io
+
+import pytest
+from PIL import Image
+from sqlalchemy.orm import Session
+from starlette.datastructures import UploadFile
+
+from backend import models, uploads
+from backend.migrations import migrate
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(uploads, "UPLOAD_DIR", tmp_path / "uploads")
+    monkeypatch.setattr(uploads, "_claims", {})
+    return tmp_path / "uploads"
+
+
+def _save() -> uploads.StoredFile:
+    buf = io.BytesIO()
+    Image.new("RGB", (32, 32), "blue").save(buf, "PNG")
+    buf.seek(0)
+    return asyncio.run(uploads.save_upload(UploadFile(buf, filename="photo.png")))
+
+
+def test_dedup_upload_survives_release_of_last_reference(fresh_engine, upload_dir, monkeypatch):
+    migrate(fresh_engine)
+    first = _save()
+    with Session(fresh_engine) as db:
+        db.add(models.Athlete(first_name="Ann", last_name="A", photo_url=first.url))
+        db.commit()
+        monkeypatch.setattr(uploads, "_claims", {})  # Ann's upload is long done
+
+        # Bob uploads the same photo; his athlete form isn't saved yet when
+        # Ann, the only reference so far, is deleted
+        second = _save()
+        assert second.deduplicated and second.url == first.url
+        db.query(models.Athlete).delete()
+        db.commit()
+        uploads.release(db, first.url)
+        assert (upload_dir / first.name).exists()
+
+        # once the claim has run out, an unreferenced file goes
+        monkeypatch.setattr(uploads, "CLAIM_SECONDS", 0)
+        uploads.release(db, first.url)
+        assert not (upload_dir / first.name).exists()
+
+
+def test_release_keeps_referenced_files(fresh_engine, upload_dir, monkeypatch):
+    migrate(fresh_engine)
+    monkeypatch.setattr(uploads, "CLAIM_SECONDS", 0)
+    stored = _save()
+    with Session(fresh_engine) as db:
+        db.add(models.Athlete(first_name="Ann", last_name="A", photo_url=stored.url))
+        db.commit()
+        uploads.release(db, stored.url)
+    assert (upload_dir / stored.name).exists()
@@ -0,0 +1,22 @@
+# tests/test_versions.py
+from backend import versions as versions_module
+from backend.versions import Versions
+
+
+def test_tables_tag_follows_counters():
+    v = Versions()
+    before = v.tables_tag("athletes", "injuries")
+    v.bump([("injuries", 1)])
+    assert v.tables_tag("athletes", "injuries") != before
+
+
+def test_tables_tag_with_ttl_rolls_over(monkeypatch):
+    v = Versions()
+    now = [1000.0]
+    monkeypatch.setattr(versions_module.time, "time", lambda: now[0])
+    tag = v.tables_tag("athletes", ttl=5)
+    now[0] += 4.9
+    assert v.tables_tag("athletes", ttl=5) == tag
+    # nothing was written in this process, but the window moved on
+    now[0] += 0.2
+    assert v.tables_tag("athletes", ttl=5) != tag